@@ -0,0 +1,156 @@
+# benchmark.py - 녹화된 세션(또는 합성 프레임)을 실제 파이프라인으로 재생하여 성능 측정
+#
+# 사용 예:
+#   python benchmark.py --session session.npz
+#   python benchmark.py --synthetic 300 --ocr mock --engine-latency 0.3
+#
+# 세션 녹화: config.py의 RECORD_SESSION_PATH를 지정한 뒤 평소처럼 OCR 실행
+import argparse
+import tempfile
+import os
+import time
+import zlib
+import numpy as np
+from config import update_setting
+
+MOCK_LINES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Press any key to continue.",
+    "You have obtained a rusty key.",
+    "Where are you going? The gate is closed at night.",
+    "Save complete.",
+    "I have been waiting for you for a long time.",
+]
+
+
+class MockReader:
+    """
+    EasyOCR 대신 쓰는 가짜 리더 (GPU/모델 없이 파이프라인 자체의 비용 측정용)
+    같은 화면에는 항상 같은 텍스트를 반환
+    """
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+
+    def readtext(self, image, detail=0, **kwargs):
+        time.sleep(self.latency)
+        key = zlib.crc32(np.ascontiguousarray(image[::8, ::8]).tobytes())
+        lines = [MOCK_LINES[key % len(MOCK_LINES)], MOCK_LINES[(key >> 8) % len(MOCK_LINES)]]
+        if not detail:
+            return lines
+        # 줄마다 이미지 높이를 나눠 가진 글자 상자
+        height, width = image.shape[:2]
+        step = height / len(lines)
+        return [
+            ([[0, i * step], [width, i * step], [width, (i + 1) * step], [0, (i + 1) * step]], line, 0.99)
+            for i, line in enumerate(lines)
+        ]
+
+
+class NullLabel:
+    """Tk 없이 실행하기 위한 출력 라벨 대용"""
+
+    def __init__(self):
+        self.text = ""
+
+    def config(self, **kwargs):
+        self.text = kwargs.get("text", self.text)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sonagi OCR 파이프라인 벤치마크")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--session", help="SessionRecorder로 녹화한 .npz 파일")
+    source.add_argument("--synthetic", type=int, metavar="N", help="합성 프레임 N장 사용")
+    parser.add_argument("--interval", type=float, default=None,
+                        help="캡처 간격(초), 생략 시 녹화 당시 간격의 중앙값 (합성은 0.2)")
+    parser.add_argument("--fixed-interval", action="store_true", help="적응형 캡처 주기를 끄고 --interval로 고정")
+    parser.add_argument("--ocr", choices=["easyocr", "mock"], default="easyocr")
+    parser.add_argument("--ocr-latency", type=float, default=0.05, help="가짜 OCR 리더 지연(초)")
+    parser.add_argument("--engine", default="mock", help="번역 엔진 (기본: 가짜 엔진)")
+    parser.add_argument("--engine-latency", type=float, default=0.2, help="가짜 번역 엔진 지연(초)")
+    parser.add_argument("--region", default="0,0,640,160", help="합성 프레임 영역 x1,y1,x2,y2")
+    parser.add_argument("--settle-time", type=float, default=None, help="SETTLE_TIME 덮어쓰기(초)")
+    parser.add_argument("--drain", type=float, default=2.0, help="마지막 프레임 이후 대기 시간(초)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.session:
+        from capture import ReplayCapture
+        replay = ReplayCapture(args.session)
+        total_frames = len(replay)
+        height, width = replay.grab(None).shape[:2]
+        region = (0, 0, width, height)
+        gaps = np.diff(replay.timestamps)
+        interval = args.interval if args.interval is not None else (float(np.median(gaps)) if len(gaps) else 0.1)
+        update_setting("CAPTURE_BACKEND", "replay")
+        update_setting("CAPTURE_FILE", args.session)
+    else:
+        total_frames = args.synthetic
+        region = tuple(int(v) for v in args.region.split(","))
+        interval = args.interval if args.interval is not None else 0.2
+        update_setting("CAPTURE_BACKEND", "synthetic")
+
+    # 실행 중인 설정/캐시 파일을 건드리지 않도록 임시 캐시 사용
+    cache_dir = tempfile.mkdtemp(prefix="sonagi-bench-")
+    update_setting("TRANSLATION_CACHE_PATH", os.path.join(cache_dir, "translation_cache.db"))
+    update_setting("RECORD_SESSION_PATH", None)
+    update_setting("OCR_REGION", region)
+    update_setting("OCR_INTERVAL", interval)
+    if args.fixed_interval:
+        update_setting("USE_ADAPTIVE_INTERVAL", False)
+    update_setting("ENGINE", args.engine)
+    update_setting("USE_ENGINE_FAILOVER", False)
+    update_setting("MOCK_ENGINE_LATENCY", args.engine_latency)
+    update_setting("LOG_TO_CONSOLE", False)
+    if args.settle_time is not None:
+        update_setting("SETTLE_TIME", args.settle_time)
+
+    import ocr
+    from metrics import reset_metrics, snapshot
+    from logger import flush_log
+
+    if args.ocr == "mock":
+        ocr.ocr_reader = MockReader(args.ocr_latency)
+    else:
+        ocr.ocr_reader = ocr.init_ocr_reader()
+        if ocr.ocr_reader is None:
+            raise SystemExit("EasyOCR 리더를 초기화할 수 없습니다 (--ocr mock 사용 가능)")
+
+    reset_metrics()
+    print(f"▶ 프레임 {total_frames}장, 간격 {interval:.3f}s, OCR: {args.ocr}, 엔진: {args.engine}")
+    start = time.perf_counter()
+    ocr.start_ocr_thread(NullLabel(), "tk")
+    while snapshot()["counters"].get("frames", 0) < total_frames and ocr.ocr_thread.is_alive():
+        time.sleep(0.05)
+    capture_elapsed = time.perf_counter() - start
+    captured = snapshot()["counters"].get("frames", 0)
+    time.sleep(args.drain)
+    ocr.stop_ocr()
+    ocr.ocr_thread.join(timeout=5.0)
+    flush_log()
+
+    data = snapshot()
+    counters = data["counters"]
+    stages = data["stages"]
+    frames = counters.get("frames", 0)
+    ocr_calls = stages.get("ocr", {}).get("count", 0)
+
+    print(f"처리 속도: {captured / capture_elapsed:.1f} frames/s ({captured}장 / {capture_elapsed:.2f}s)")
+    end_to_end = stages.get("end_to_end")
+    if end_to_end:
+        print("종단 지연: p50 {p50:.3f}s / p95 {p95:.3f}s / p99 {p99:.3f}s ({count}회 표시)".format(**end_to_end))
+    else:
+        print("종단 지연: 표시된 결과 없음")
+    print(f"OCR 호출: {ocr_calls}회 (생략 {frames - ocr_calls}회, 화면 변화 없음 {counters.get('frames_skipped', 0)}회)")
+    print(f"API 전송 글자 수: {counters.get('api_chars_sent', 0):,}자 "
+          f"(캐시 적중 {counters.get('cache_hits', 0)}회 / 미스 {counters.get('cache_misses', 0)}회)")
+    for name, stage in sorted(stages.items()):
+        print(f"  {name:<20} n={stage['count']:<5} p50={stage['p50'] * 1000:7.1f}ms p95={stage['p95'] * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# calibrate.py - 인식 결과가 달라지지 않는 가장 작은 전처리 축소 배율 찾기
+#
+# 사용 예:
+#   python calibrate.py --sample dialogue.png
+#   python calibrate.py --sample session.npz --mode stretch
+#   python calibrate.py                  (현재 OCR_REGION을 한 번 캡처해서 사용)
+#
+# 결과로 나온 배율을 config.py의 PREPROCESS_SCALE에 지정
+import argparse
+import time
+import numpy as np
+from config import get_setting, update_setting
+from preprocess import preprocess_image, PREPROCESS_MODES
+
+
+def load_sample(path):
+    """이미지 파일, .npy, 녹화 세션(.npz)의 첫 프레임과 채널 순서"""
+    if path.endswith(".npz"):
+        data = np.load(path)
+        frames = data["frames"]
+        # 녹화 세션은 캡처 백엔드의 순서 그대로 저장됨 (ReplayCapture와 같은 기본값)
+        channel_order = str(data["channel_order"]) if "channel_order" in data else "BGR"
+        return (frames[data["frame_index"][0]] if "frame_index" in data else frames[0]), channel_order
+    if path.endswith(".npy"):
+        frames = np.load(path)
+        return (frames[0] if frames.ndim == 4 else frames), "RGB"
+    from PIL import Image
+    return np.asarray(Image.open(path).convert("RGB")), "RGB"
+
+
+def capture_sample():
+    from capture import create_capture_backend
+    backend = create_capture_backend()
+    try:
+        return np.array(backend.grab(get_setting("OCR_REGION")), copy=True), backend.channel_order
+    finally:
+        backend.close()
+
+
+def read_lines(reader, image, mode, scale, channel_order):
+    processed, _ = preprocess_image(image, mode=mode, scale=scale, channel_order=channel_order)
+    start = time.perf_counter()
+    lines = reader.readtext(processed, detail=0)
+    return lines, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 전처리 축소 배율 보정")
+    parser.add_argument("--sample", help="샘플 이미지 (.png/.jpg/.npy/.npz), 생략 시 현재 OCR 영역 캡처")
+    parser.add_argument("--mode", choices=PREPROCESS_MODES, default=None, help="전처리 방식 (기본: PREPROCESS_MODE)")
+    parser.add_argument("--min-scale", type=float, default=0.25)
+    parser.add_argument("--step", type=float, default=0.05)
+    args = parser.parse_args()
+
+    mode = args.mode or get_setting("PREPROCESS_MODE", "gray")
+    update_setting("LOG_TO_CONSOLE", False)
+    image, channel_order = load_sample(args.sample) if args.sample else capture_sample()
+
+    from ocr_reader_cache import get_ocr_reader
+    reader = get_ocr_reader()
+
+    baseline, baseline_time = read_lines(reader, image, mode, 1.0, channel_order)
+    print(f"▶ 샘플 {image.shape[1]}x{image.shape[0]}, 전처리: {mode}")
+    print(f"  1.00배: {baseline_time * 1000:7.1f}ms  {baseline}")
+    if not baseline:
+        raise SystemExit("샘플에서 글자가 인식되지 않았습니다. 대사가 보이는 화면으로 다시 시도하세요.")
+
+    # 배율을 줄여가며 원본 배율과 같은 결과가 나오는 마지막 배율을 찾음
+    best, best_time = 1.0, baseline_time
+    scale = 1.0 - args.step
+    while scale >= args.min_scale - 1e-9:
+        lines, elapsed = read_lines(reader, image, mode, scale, channel_order)
+        same = lines == baseline
+        print(f"  {scale:.2f}배: {elapsed * 1000:7.1f}ms  {'✅ 동일' if same else '❌ 다름'}")
+        if not same:
+            break
+        best, best_time = scale, elapsed
+        scale -= args.step
+
+    print(f"\n추천 PREPROCESS_SCALE: {best:.2f} (OCR 시간 {baseline_time * 1000:.0f}ms → {best_time * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+# capture.py - 화면 캡처 백엔드 (OCR 영역을 NumPy 배열로 가져오기)
+import os
+import sys
+import numpy as np
+from config import get_setting
+from logger import write_log
+
+
+class CaptureBackend:
+    """
+    캡처 백엔드 공통 인터페이스
+    - grab(region): region = (x1, y1, x2, y2), (H, W, 3) uint8 배열 반환
+    - channel_order: grab() 결과의 채널 순서 ("RGB" 또는 "BGR")
+      복사를 피하려고 변환하지 않으므로 회색조 변환 등 채널을 구분하는 처리는 이 값을 따라야 함
+    - reuses_buffer가 True이면 반환된 배열은 다음 grab()에서 덮어써지므로
+      다른 스레드로 넘길 때는 복사해야 함
+    """
+    name = "base"
+    channel_order = "RGB"
+    reuses_buffer = False
+
+    def grab(self, region):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PyAutoGuiCapture(CaptureBackend):
+    """기존 방식 (매번 PIL 이미지 생성 후 배열로 변환) - 대체용"""
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def grab(self, region):
+        x1, y1, x2, y2 = region
+        img = self._pyautogui.screenshot(region=(x1, y1, x2 - x1, y2 - y1))
+        return np.asarray(img)
+
+
+class GdiCapture(CaptureBackend):
+    """
+    Windows GDI 캡처: DIB 섹션 메모리를 NumPy 배열로 직접 감싸고 BitBlt로 그 위에 복사
+    영역 크기가 바뀔 때만 버퍼를 다시 만들고, 그 외에는 할당/복사가 전혀 없음
+    """
+    name = "gdi"
+    channel_order = "BGR"  # DIB 섹션의 BGRA 메모리를 그대로 사용
+    reuses_buffer = True
+
+    SRCCOPY = 0x00CC0020
+    CAPTUREBLT = 0x40000000
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        self._ctypes = ctypes
+        self._user32 = ctypes.WinDLL("user32")
+        self._gdi32 = ctypes.WinDLL("gdi32")
+
+        class BITMAPINFOHEADER(ctypes.Structure):
+            _fields_ = [
+                ("biSize", wintypes.DWORD), ("biWidth", wintypes.LONG), ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD), ("biBitCount", wintypes.WORD), ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD), ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG), ("biClrUsed", wintypes.DWORD), ("biClrImportant", wintypes.DWORD),
+            ]
+        self._header_type = BITMAPINFOHEADER
+
+        # 64비트 핸들이 잘리지 않도록 반환/인자 형식 지정
+        self._user32.GetDC.restype = wintypes.HDC
+        self._user32.GetDC.argtypes = [wintypes.HWND]
+        self._user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+        self._gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        self._gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+        self._gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        self._gdi32.CreateDIBSection.argtypes = [
+            wintypes.HDC, ctypes.POINTER(BITMAPINFOHEADER), wintypes.UINT,
+            ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD
+        ]
+        self._gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        self._gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+        self._gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+        self._gdi32.DeleteDC.argtypes = [wintypes.HDC]
+        self._gdi32.BitBlt.argtypes = [
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD
+        ]
+
+        self._screen_dc = self._user32.GetDC(None)
+        self._mem_dc = self._gdi32.CreateCompatibleDC(self._screen_dc)
+        self._bitmap = None
+        self._size = None
+        self._buffer = None
+
+    def _allocate(self, width, height):
+        ctypes = self._ctypes
+        if self._bitmap:
+            self._gdi32.DeleteObject(self._bitmap)
+
+        header = self._header_type()
+        header.biSize = ctypes.sizeof(header)
+        header.biWidth = width
+        header.biHeight = -height  # 음수 = 위에서 아래로 저장 (NumPy 행 순서와 동일)
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = 0  # BI_RGB
+
+        bits = ctypes.c_void_p()
+        self._bitmap = self._gdi32.CreateDIBSection(self._mem_dc, ctypes.byref(header), 0, ctypes.byref(bits), None, 0)
+        if not self._bitmap:
+            raise OSError("CreateDIBSection 실패")
+        self._gdi32.SelectObject(self._mem_dc, self._bitmap)
+
+        raw = (ctypes.c_uint8 * (width * height * 4)).from_address(bits.value)
+        self._buffer = np.ctypeslib.as_array(raw).reshape(height, width, 4)
+        self._size = (width, height)
+
+    def grab(self, region):
+        x1, y1, x2, y2 = region
+        width, height = x2 - x1, y2 - y1
+        if self._size != (width, height):
+            self._allocate(width, height)
+
+        if not self._gdi32.BitBlt(self._mem_dc, 0, 0, width, height, self._screen_dc, x1, y1,
+                                  self.SRCCOPY | self.CAPTUREBLT):
+            raise OSError("BitBlt 실패")
+        # BGRA → BGR 뷰 (복사 없음, EasyOCR은 3채널 배열을 BGR로 처리)
+        return self._buffer[:, :, :3]
+
+    def close(self):
+        if self._bitmap:
+            self._gdi32.DeleteObject(self._bitmap)
+            self._bitmap = None
+        if self._mem_dc:
+            self._gdi32.DeleteDC(self._mem_dc)
+            self._mem_dc = None
+        if self._screen_dc:
+            self._user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+
+class MssCapture(CaptureBackend):
+    """mss 라이브러리 캡처 (Windows 외 환경용, 결과를 재사용 버퍼에 복사)"""
+    name = "mss"
+    channel_order = "BGR"  # mss의 BGRA 원본에서 알파만 제외
+    reuses_buffer = True
+
+    def __init__(self):
+        import mss
+        self._sct = mss.mss()
+        self._buffer = None
+
+    def grab(self, region):
+        x1, y1, x2, y2 = region
+        shot = self._sct.grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if self._buffer is None or self._buffer.shape[:2] != bgra.shape[:2]:
+            self._buffer = np.empty((shot.height, shot.width, 3), dtype=np.uint8)
+        np.copyto(self._buffer, bgra[:, :, :3])
+        return self._buffer
+
+    def close(self):
+        self._sct.close()
+
+
+class FileCapture(CaptureBackend):
+    """
+    파일에 저장된 프레임을 순서대로 반복 재생 (화면 없이 테스트/벤치마크용)
+    - .npy: (H, W, 3) 한 장 또는 (N, H, W, 3) 여러 장 (RGB)
+    - .npz: "frames" 배열 ("channel_order"가 저장되어 있으면 그 순서, 없으면 RGB)
+    - 그 외: 이미지 파일 (PIL 필요)
+    region은 무시하고 파일의 프레임 크기를 그대로 사용
+    """
+    name = "file"
+
+    def __init__(self, path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".npy":
+            frames = np.load(path, mmap_mode="r")
+        elif ext == ".npz":
+            data = np.load(path)
+            frames = data["frames"]
+            if "channel_order" in data:
+                self.channel_order = str(data["channel_order"])
+        else:
+            from PIL import Image
+            frames = np.asarray(Image.open(path).convert("RGB"))
+        if frames.ndim == 3:
+            frames = frames[None]
+        self._frames = frames
+        self._index = 0
+
+    def grab(self, region):
+        frame = self._frames[self._index % len(self._frames)]
+        self._index += 1
+        return np.asarray(frame)
+
+
+class SyntheticCapture(CaptureBackend):
+    """
+    합성 프레임 생성 (화면 없이 테스트/벤치마크용)
+    change_every 프레임마다 내용이 바뀌고, 그 사이에는 같은 화면을 반환
+    """
+    name = "synthetic"
+    reuses_buffer = True
+
+    def __init__(self, change_every=5):
+        self.change_every = max(1, int(change_every))
+        self._buffer = None
+        self._count = 0
+
+    def grab(self, region):
+        x1, y1, x2, y2 = region
+        height, width = y2 - y1, x2 - x1
+        if self._buffer is None or self._buffer.shape[:2] != (height, width):
+            self._buffer = np.empty((height, width, 3), dtype=np.uint8)
+
+        if self._count % self.change_every == 0:
+            # 어두운 배경 위에 글자 줄처럼 보이는 밝은 블록
+            rng = np.random.default_rng(self._count // self.change_every)
+            self._buffer.fill(20)
+            line_height = max(4, height // 6)
+            for top in range(line_height // 2, height - line_height, line_height * 2):
+                length = int(rng.integers(width // 4, width))
+                self._buffer[top:top + line_height, :length] = rng.integers(150, 255, dtype=np.uint8)
+        self._count += 1
+        return self._buffer
+
+
+class ReplayCapture(CaptureBackend):
+    """
+    SessionRecorder로 저장한 세션을 녹화된 순서대로 재생
+    마지막 프레임 이후에는 마지막 화면을 계속 반환 (정적인 화면)
+    채널 순서는 녹화한 백엔드의 순서 (저장되지 않은 이전 녹화는 기본 백엔드(GDI/mss)의 BGR로 간주)
+    """
+    name = "replay"
+
+    def __init__(self, path):
+        data = np.load(path)
+        self.channel_order = str(data["channel_order"]) if "channel_order" in data else "BGR"
+        self._frames = data["frames"]
+        self._index = data["frame_index"]
+        self.timestamps = data["timestamps"]
+        self._position = 0
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def finished(self):
+        return self._position >= len(self._index)
+
+    def grab(self, region):
+        position = min(self._position, len(self._index) - 1)
+        self._position += 1
+        return self._frames[self._index[position]]
+
+
+class SessionRecorder:
+    """
+    실제 세션의 캡처 프레임과 시각을 기록하여 압축 파일(.npz)로 저장
+    같은 화면이 반복되면 프레임은 한 번만 저장하고 인덱스로 참조
+    """
+
+    def __init__(self, path, max_frames=2000, channel_order="RGB"):
+        self.path = path
+        self.max_frames = max_frames
+        self.channel_order = channel_order  # 녹화하는 캡처 백엔드의 채널 순서 (재생 시 그대로 사용)
+        self._frames = []
+        self._index = []
+        self._timestamps = []
+
+    def add(self, frame, timestamp):
+        if not self._frames or not np.array_equal(self._frames[-1], frame):
+            if len(self._frames) >= self.max_frames:
+                return
+            self._frames.append(np.array(frame, copy=True))
+        self._index.append(len(self._frames) - 1)
+        self._timestamps.append(timestamp)
+
+    def save(self):
+        if not self._frames:
+            return False
+        # 녹화 중 영역 크기가 바뀐 경우 마지막 크기의 프레임만 유지
+        shape = self._frames[-1].shape
+        keep = [i for i, frame in enumerate(self._frames) if frame.shape == shape]
+        remap = {old: new for new, old in enumerate(keep)}
+        pairs = [(remap[i], t) for i, t in zip(self._index, self._timestamps) if i in remap]
+        np.savez_compressed(
+            self.path,
+            frames=np.stack([self._frames[i] for i in keep]),
+            frame_index=np.array([i for i, _ in pairs], dtype=np.int32),
+            timestamps=np.array([t for _, t in pairs], dtype=np.float64),
+            channel_order=np.array(self.channel_order),
+        )
+        return True
+
+
+def create_capture_backend(name=None):
+    """
+    설정된 캡처 백엔드 생성 (사용할 수 없으면 다음 후보로 대체)
+    "auto": Windows는 GDI, 그 외는 mss, 둘 다 안 되면 pyautogui
+    "file"/"replay": CAPTURE_FILE의 프레임 재생
+    """
+    name = name or get_setting("CAPTURE_BACKEND", "auto")
+    if name == "file":
+        return FileCapture(get_setting("CAPTURE_FILE"))
+    if name == "synthetic":
+        return SyntheticCapture()
+    if name == "replay":
+        return ReplayCapture(get_setting("CAPTURE_FILE"))
+
+    candidates = {
+        "auto": ["gdi", "mss", "pyautogui"] if sys.platform == "win32" else ["mss", "pyautogui"],
+        "gdi": ["gdi", "pyautogui"],
+        "mss": ["mss", "pyautogui"],
+    }.get(name, ["pyautogui"])
+    backends = {"gdi": GdiCapture, "mss": MssCapture, "pyautogui": PyAutoGuiCapture}
+
+    for candidate in candidates:
+        try:
+            return backends[candidate]()
+        except Exception as e:
+            write_log(f"[⚠️ 캡처 백엔드 '{candidate}' 사용 불가]: {e}", "WARNING")
+    raise RuntimeError("사용 가능한 캡처 백엔드가 없습니다")
@@ -4,6 +4,7 @@ import datetime
 # ⚙️ 유저 설정 (딕셔너리 기반으로 관리)
 settings = {
     "OCR_REGION": (200, 800, 1700, 1000),
+    "OCR_REGIONS": [],  # 여러 영역 동시 감시: [{"name": "dialogue", "region": [x1, y1, x2, y2], "interval": 0.5}, ...] (비어 있으면 OCR_REGION 사용)
     "OUTPUT_POSITION": [600, 850],
     "FONT_FAMILY": "Malgun Gothic",
     "FONT_SIZE": 16,
@@ -17,12 +18,75 @@ settings = {
     "OCR_INTERVAL": 1.0,
     "SOURCE_LANG": "en",
     "TARGET_LANG": "ko",
+    "AUTO_DETECT_LANG": False,  # 원본 언어 자동 감지 (켜면 SOURCE_LANG 무시)
+    "USE_LIMITED_AUTO_DETECT": True,  # LIMITED_AUTO_DETECT_LANGS 중에서만 감지
+    "LIMITED_AUTO_DETECT_LANGS": ["ko", "ja", "en", "zh-CN", "ru", "fr"],  # 제한된 자동 감지 후보 언어
+    "USE_LOCAL_LANG_DETECT": True,  # 문자 계열(한글/가나/한자/키릴/라틴) 분포로 요청 전에 로컬에서 원본 언어 결정
+    "LANG_DETECT_MIN_RATIO": 0.6,  # 가장 많은 문자 계열의 비율이 이보다 낮으면 판단하지 않고 엔진 자동 감지 사용
     "BROWSER_WIDTH": 1920,
     "BROWSER_HEIGHT": 1080,
     "VERTICAL": None,
     "PRIMARY_MONITOR_SIDE": None,
     "LIBRE_API_URL": "https://libretranslate.com/translate",  # LibreTranslate API URL
-    "LIBRE_API_KEY": ""  # LibreTranslate API 키 (선택사항)
+    "LIBRE_API_KEY": "",  # LibreTranslate API 키 (선택사항)
+    "FRAME_DIFF_THRESHOLD": 6.0,  # 화면 변화 감지 임계값 (칸별 평균 밝기 차이, 0~255)
+    "FRAME_FINGERPRINT_SIZE": (64, 16),  # 화면 지문 격자 크기 (가로, 세로)
+    "USE_TRANSLATION_CACHE": True,  # 번역 캐시 사용 여부
+    "TRANSLATION_CACHE_PATH": "translation_cache.db",  # 번역 캐시 파일 경로
+    "TRANSLATION_CACHE_MAX_ENTRIES": 20000,  # 번역 캐시 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+    # 엔진별 (연결, 응답) 제한 시간 (초)
+    "ENGINE_TIMEOUTS": {
+        "papago-nhn": [3.05, 5.0],
+        "deepl": [3.05, 8.0],
+        "gpt": [3.05, 20.0],
+        "libretranslate": [3.05, 10.0]
+    },
+    "BREAKER_FAILURE_THRESHOLD": 3,  # 연속 실패 시 엔진을 일시 차단할 횟수
+    "BREAKER_COOLDOWN": 30.0,  # 차단 후 다시 시도하기까지 대기 시간 (초)
+    "USE_ENGINE_FAILOVER": False,  # 번역 실패 시 대체 엔진 사용 (켜면 실패한 원문이 아래 엔진들로 전송됨)
+    "ENGINE_FALLBACK_CHAIN": [],  # 대체 엔진 시도 순서 (직접 설정한 엔진만 넣을 것, 예: ["papago-nhn", "deepl"])
+    "USE_HEDGED_REQUESTS": False,  # 주 엔진이 평소보다 늦으면 보조 엔진에도 같은 요청을 보내 먼저 온 결과 사용 (보조 엔진 사용량 증가)
+    "HEDGE_PERCENTILE": 0.95,  # 주 엔진의 최근 처리 시간 중 이 분위수만큼 기다린 뒤 헤지
+    "HEDGE_MIN_SAMPLES": 20,  # 주 엔진의 처리 시간 기록이 이만큼 쌓이기 전에는 헤지하지 않음
+    "HEDGE_MIN_DELAY": 0.2,  # 헤지 전 최소 대기 시간 (초)
+    "HEDGE_ENGINE": None,  # 보조 엔진 (None이면 ENGINE_FALLBACK_CHAIN에서 다음으로 사용 가능한 엔진, USE_ENGINE_FAILOVER가 꺼져 있어도 사용)
+    "OCR_MIN_CONFIDENCE": 0.3,  # 이 신뢰도 미만인 OCR 상자는 버림 (0~1)
+    "OCR_MIN_BOX_HEIGHT": 8,  # 이 높이(픽셀) 미만인 OCR 상자는 버림
+    "SKIP_MEANINGLESS_TEXT": True,  # 특수문자 위주의 의미 없는 텍스트는 번역하지 않음 (모든 엔진)
+    "SPECIAL_CHAR_THRESHOLD": 0.3,  # 의미 없는 텍스트로 판단하는 특수문자 비율
+    "SEGMENT_MODE": "sentence",  # 번역 단위: "sentence"(문장), "line"(줄), "off"(전체 한 번에)
+    "SETTLE_TIME": 0.6,  # 텍스트가 이 시간(초) 동안 바뀌지 않고 다음 캡처에서도 그대로여야 번역 (0이면 즉시 번역)
+    "SHOW_PARTIAL_TEXT": False,  # 번역 보류 중인 텍스트를 원문 그대로 표시
+    "DEDUP_SIMILARITY": 0.9,  # 최근 텍스트와 이 유사도 이상이면 같은 텍스트로 간주 (0~1)
+    "DEDUP_WINDOW": 5,  # 유사 텍스트 비교에 쓰는 최근 텍스트 개수
+    "CAPTURE_BACKEND": "auto",  # 캡처 방식: "auto", "gdi", "mss", "pyautogui", "file", "synthetic"
+    "CAPTURE_FILE": None,  # "file" 캡처 방식에서 재생할 프레임 파일 (.npy/.npz/이미지)
+    "LOG_LEVEL": "INFO",  # 로그 수준: "DEBUG"(프레임마다 기록), "INFO", "WARNING", "ERROR"
+    "LOG_TO_CONSOLE": True,  # 로그를 콘솔에도 출력
+    "LOG_MAX_BYTES": 5 * 1024 * 1024,  # 로그 파일이 이 크기를 넘으면 백업 파일로 회전
+    "LOG_BACKUP_COUNT": 2,  # 보관할 백업 로그 파일 수
+    "LOG_FLUSH_INTERVAL": 0.5,  # 로그를 모아서 기록하는 간격 (초)
+    "METRICS_WINDOW": 512,  # 지연 시간 백분위 계산에 쓰는 최근 측정 개수
+    "RECORD_SESSION_PATH": None,  # 지정하면 캡처 프레임을 이 파일(.npz)로 녹화 (재생: CAPTURE_BACKEND="replay")
+    "RECORD_MAX_FRAMES": 2000,  # 녹화할 서로 다른 프레임의 최대 개수
+    "MOCK_ENGINE_LATENCY": 0.2,  # 가짜 번역 엔진("mock")의 응답 지연 (초)
+    "USE_ADAPTIVE_ROI": True,  # 최근 인식된 글자 위치 주변만 OCR (영역을 넉넉히 잡아도 검출 비용이 글자 크기에 비례)
+    "ROI_MARGIN": 16,  # 글자 영역 주변 여백 (픽셀)
+    "ROI_HISTORY": 5,  # 글자 영역 계산에 쓰는 최근 인식 결과 수
+    "ROI_RESCAN_INTERVAL": 3.0,  # 전체 영역을 다시 검사하는 주기 (초)
+    "USE_RECOGNITION_CACHE": True,  # 이전과 픽셀이 같은 글자 줄은 인식(recognizer)을 건너뛰고 결과 재사용
+    "RECOGNITION_CACHE_SIZE": 2000,  # 인식 결과 캐시에 보관할 글자 줄 수
+    "USE_ADAPTIVE_INTERVAL": True,  # 화면이 바뀌면 MIN_OCR_INTERVAL로 빠르게, 변화가 없으면 OCR_INTERVAL까지 점점 느리게 캡처 (끄면 OCR_INTERVAL 고정)
+    "MIN_OCR_INTERVAL": 0.2,  # 적응형 캡처 주기 최소값 (초, 화면 변화 직후 - 이어지는 글자/다음 대사를 바로 잡기 위해)
+    "IDLE_BACKOFF": 1.5,  # 변화가 없을 때마다 캡처 주기에 곱하는 값
+    "PREPROCESS_MODE": "gray",  # OCR 전 전처리: "off" / "gray"(회색조) / "stretch"(회색조+대비 늘이기) / "binary"(회색조+이진화)
+    "PREPROCESS_SCALE": 1.0,  # OCR 전 축소 배율 (python calibrate.py로 인식 결과가 같은 최소 배율 측정)
+    "OCR_TARGET_TEXT_HEIGHT": None,  # 지정 시 글자 줄 높이가 이 값(픽셀)이 되도록 자동 축소
+    "OCR_READER_CACHE_MB": 1024,  # 언어별 EasyOCR 리더 캐시의 메모리 예산 (MB), 넘으면 오래된 리더부터 해제
+    "READER_IDLE_UNLOAD": 300,  # 번역을 끈 채로 이 시간(초)이 지나면 OCR 모델을 메모리에서 해제 (0: 해제 안 함)
+    "GPT_API_URL": "https://api.openai.com/v1/chat/completions",  # OpenAI 호환 Chat Completions 주소 (로컬 테스트 서버 지정 가능)
+    "GPT_STREAMING": True,  # GPT 번역을 스트리밍으로 받아 도착하는 대로 오버레이에 표시
+    "OVERLAY_SERVER_URL": None  # OBS 오버레이 서버가 다른 프로세스/PC에 있을 때만 지정 (예: "http://192.168.0.10:5000")
 }
 
 # 설정 업데이트 함수
@@ -76,6 +140,16 @@ def increment_libre_usage(amount):
     global LIBRE_USAGE
     LIBRE_USAGE += amount
 
+# 무료 한도를 다 쓴 엔진인지 확인 (GPT는 한도 없음)
+def is_usage_limit_reached(engine):
+    if engine == "papago-nhn":
+        return NHN_PAPAGO_USAGE >= PAPAGO_LIMIT
+    elif engine == "deepl":
+        return DEEPL_USAGE >= DEEPL_LIMIT
+    elif engine == "libretranslate":
+        return LIBRE_USAGE >= LIBRE_LIMIT
+    return False
+
 # 사용량 문자열 반환 함수
 def make_usage_string():
     engine = get_setting("ENGINE")
@@ -8,8 +8,11 @@ from config import get_setting, update_setting, make_usage_string
 from presets import select_preset_gui, load_presets
 from settings import open_settings_window
 from overlay import create_overlay_window, update_overlay_position, hide_overlay, destroy_overlay, show_overlay
-from ocr import start_ocr_thread, stop_ocr
+from ocr import start_ocr_thread, stop_ocr, preload_hint
+from ocr_reader_cache import has_loaded_reader
+from utils import get_rss_bytes
 from translator_dispatch import translate_text
+from translation_cache import make_cache_stats_string, clear_translation_cache
 import keyboard
 import time
 
@@ -183,6 +186,30 @@ def create_status_window():
     usage = tk.Label(win, text=make_usage_string(), justify="left")
     usage.pack(pady=5)
 
+    cache_label = tk.Label(win, text=make_cache_stats_string(), justify="left")
+    cache_label.pack()
+
+    def make_memory_string():
+        rss = get_rss_bytes()
+        model = "로드됨" if has_loaded_reader() else "해제됨"
+        if rss is None:
+            return f"🧠 OCR 모델: {model}"
+        return f"🧠 메모리: {rss / 1024 / 1024:,.0f}MB (OCR 모델 {model})"
+
+    memory_label = tk.Label(win, text=make_memory_string(), justify="left")
+    memory_label.pack()
+
+    # 사용량/캐시 통계/메모리 주기적 갱신
+    def refresh_usage():
+        usage.config(text=make_usage_string())
+        cache_label.config(text=make_cache_stats_string())
+        memory_label.config(text=make_memory_string())
+        win.after(2000, refresh_usage)
+    win.after(2000, refresh_usage)
+
+    # 상태창으로 돌아오면 곧 번역을 켤 가능성이 높으므로 해제된 OCR 모델을 미리 로드
+    win.bind("<FocusIn>", lambda event: preload_hint() if event.widget is win else None)
+
     engine_var = StringVar(value=get_setting("ENGINE"))
     engine_dropdown = tk.OptionMenu(win, engine_var, "gpt", "papago-nhn", "deepl", "libretranslate")
     engine_dropdown.config(width=btn_width - 6)
@@ -218,6 +245,12 @@ def create_status_window():
         update_setting("SHOW_OCR_BOX", show_box_var.get())
     tk.Checkbutton(win, text="🟥 OCR 박스 보이기", variable=show_box_var, command=on_show_box_change).pack()
 
+    cache_var = BooleanVar(value=get_setting("USE_TRANSLATION_CACHE", True))
+    def on_cache_change():
+        update_setting("USE_TRANSLATION_CACHE", cache_var.get())
+        cache_label.config(text=make_cache_stats_string())
+    tk.Checkbutton(win, text="💾 번역 캐시 사용", variable=cache_var, command=on_cache_change).pack()
+
     toggle_btn = tk.Button(win, text="▶️ 번역 시작", width=btn_width)
     toggle_btn.pack(pady=2)
 
@@ -228,6 +261,7 @@ def create_status_window():
             bg="#3cb043" if running else "#888888"
         ))
         win.after(0, lambda: usage.config(text=make_usage_string()))
+        win.after(0, lambda: cache_label.config(text=make_cache_stats_string()))
         toggle_btn.config(text="⏸️ 번역 중단" if running else "▶️ 번역 시작")
         
         # 번역이 켜지면 상태창에 현재 언어 정보 표시
@@ -261,8 +295,9 @@ def create_status_window():
                 mode = mode_var.get() or "tk"
                 print(f"[⚙️ 설정된 출력 모드]: {mode}")
 
+                # 모델 로드(해제된 경우 포함)는 OCR 스레드/백그라운드에서 처리하여 창이 멈추지 않게 함
                 from ocr import reinit_ocr_reader
-                reinit_ocr_reader()
+                reinit_ocr_reader(background=True)
                 start_ocr_thread(overlay_label, mode)
                 
                 if mode == "obs":
@@ -438,6 +473,11 @@ def create_status_window():
             except:
                 messagebox.showerror("오류", "LibreTranslate 설정 파일 생성에 실패했습니다.")
                 
+    def clear_cache():
+        if messagebox.askyesno("번역 캐시 비우기", "저장된 번역 캐시를 모두 삭제할까요?"):
+            clear_translation_cache()
+            cache_label.config(text=make_cache_stats_string())
+
     def quit_program():
         import requests
         stop_ocr()
@@ -460,6 +500,7 @@ def create_status_window():
     tk.Button(win, text="☁️ NHN Papago API 입력", command=generate_nhn_papago, width=btn_width).pack(pady=2)
     tk.Button(win, text="🔑 DeepL API 입력", command=generate_deepl, width=btn_width).pack(pady=2)
     tk.Button(win, text="🌍 LibreTranslate 설정", command=setup_libretranslate, width=btn_width).pack(pady=2)
+    tk.Button(win, text="🗑️ 번역 캐시 비우기", command=clear_cache, width=btn_width).pack(pady=2)
     tk.Button(win, text="⚙️ 설정", command=lambda: open_settings_window(overlay_label, toggle_translate, restart_ocr=toggle_translate), width=btn_width).pack(pady=2)
     tk.Button(win, text="❌ 프로그램 종료", command=quit_program, width=btn_width).pack(pady=2)
 
@@ -0,0 +1,38 @@
+# frame_gate.py - 화면 변화 감지 (OCR 전에 정적인 프레임을 걸러냄)
+import numpy as np
+
+
+def make_fingerprint(frame, grid=(64, 16)):
+    """
+    캡처한 프레임을 작은 회색조 격자로 축소한 지문을 만든다.
+    - frame: (H, W) 또는 (H, W, C) 배열
+    - grid: (가로 칸 수, 세로 칸 수)
+    각 칸은 해당 블록의 평균 밝기이므로 노이즈 한두 픽셀에는 둔감하다.
+    """
+    arr = np.asarray(frame)
+    if arr.ndim == 2:
+        arr = arr[:, :, None]
+
+    h, w = arr.shape[:2]
+    grid_w = max(1, min(int(grid[0]), w))
+    grid_h = max(1, min(int(grid[1]), h))
+    step_y = h // grid_h
+    step_x = w // grid_w
+
+    # 블록 단위로 나누어 떨어지도록 자른 뒤 평균 (채널 평균 = 회색조)
+    blocks = arr[:grid_h * step_y, :grid_w * step_x].reshape(
+        grid_h, step_y, grid_w, step_x, arr.shape[2]
+    )
+    return blocks.mean(axis=(1, 3, 4), dtype=np.float32)
+
+
+def fingerprint_diff(prev, curr):
+    """두 지문 사이의 최대 칸 밝기 차이 (0~255). 비교 불가하면 무한대"""
+    if prev is None or curr is None or prev.shape != curr.shape:
+        return float("inf")
+    return float(np.abs(curr - prev).max())
+
+
+def frame_changed(prev, curr, threshold):
+    """지문 차이가 임계값을 넘으면 새 프레임으로 간주"""
+    return fingerprint_diff(prev, curr) > threshold
@@ -0,0 +1,135 @@
+# lang_detect.py - 유니코드 문자 계열(스크립트) 분포로 원본 언어를 로컬에서 추정
+import re
+from config import get_setting
+from logger import write_log
+from metrics import increment
+
+# 문자 계열별 패턴 (글자 수를 세어 분포를 만듦)
+_SCRIPT_RES = {
+    "hangul": re.compile(r"[가-힣\u1100-\u11ff\u3130-\u318f]"),
+    "kana": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]"),
+    "han": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"),
+    "cyrillic": re.compile(r"[\u0400-\u04ff]"),
+    "latin": re.compile(r"[a-zA-Z\u00c0-\u024f]"),
+}
+# 라틴 문자 중 프랑스어 표시: 악센트 문자, 자주 쓰는 단어
+_FRENCH_RE = re.compile(r"[àâçéèêëîïôûùüÿœæ]|\b(?:le|la|les|des|une|est|et|je|vous|nous|pas|que|qui|du|au)\b", re.IGNORECASE)
+_ENGLISH_RE = re.compile(r"\b(?:the|and|is|are|you|to|of|it|that|this|what|have|with)\b", re.IGNORECASE)
+
+# EasyOCR 언어 코드, 같은 인식 모델을 쓰는 언어끼리만 한 리더에 넣을 수 있음 (영어는 모든 모델에 포함)
+_EASYOCR_CODES = {
+    "en": "en", "fr": "fr", "es": "es", "de": "de", "it": "it", "pt": "pt",
+    "ru": "ru", "ja": "ja", "ko": "ko", "zh": "ch_sim",
+}
+_EASYOCR_MODELS = {
+    "en": "latin", "fr": "latin", "es": "latin", "de": "latin", "it": "latin", "pt": "latin",
+    "ru": "cyrillic", "ja": "ja", "ko": "ko", "ch_sim": "ch_sim",
+}
+
+
+def base_lang(lang_code):
+    """언어 코드의 기본 부분만 (zh-CN → zh, EN → en)"""
+    return (lang_code or "").lower().split("-")[0]
+
+
+def same_language(a, b):
+    return bool(a) and bool(b) and base_lang(a) == base_lang(b)
+
+
+def script_histogram(text):
+    """문자 계열별 글자 수"""
+    return {script: len(pattern.findall(text)) for script, pattern in _SCRIPT_RES.items()}
+
+
+def detection_candidates():
+    """자동 감지 후보 언어 (제한 모드가 아니면 None = 문자 계열만으로 확실한 언어만)"""
+    if not get_setting("USE_LIMITED_AUTO_DETECT", True):
+        return None
+    return get_setting("LIMITED_AUTO_DETECT_LANGS") or ["ko", "ja", "en", "zh-CN", "ru", "fr"]
+
+
+def _pick(lang, candidates):
+    """추정한 언어를 후보 목록의 표기로 (후보에 없으면 None)"""
+    if candidates is None:
+        return lang
+    for code in candidates:
+        if same_language(code, lang):
+            return code
+    return None
+
+
+def _latin_lang(text, candidates):
+    """라틴 문자 텍스트: 후보 중 영어/프랑스어만 구분 (다른 라틴 언어가 후보에 있으면 영어 표시 단어가 있을 때만 영어)"""
+    if candidates is None:
+        return None
+    english = _pick("en", candidates)
+    french = _pick("fr", candidates)
+    if french and (not english or len(_FRENCH_RE.findall(text)) > len(_ENGLISH_RE.findall(text))):
+        return french
+    others = [code for code in candidates
+              if base_lang(code) not in ("en", "fr") and _EASYOCR_MODELS.get(_EASYOCR_CODES.get(base_lang(code))) == "latin"]
+    if english and (not others or _ENGLISH_RE.search(text)):
+        return english
+    return None
+
+
+def detect_language(text, candidates=None):
+    """
+    문자 계열 분포로 언어 추정 (확실하지 않으면 None → 번역 서버의 자동 감지에 맡김)
+    - 한글 → ko, 가나가 섞인 한자 → ja, 가나 없는 한자 → zh, 키릴 → ru
+    - 라틴 문자는 후보 중 영어/프랑스어만 구분
+    가장 많은 계열이 LANG_DETECT_MIN_RATIO 미만이면 (여러 언어 혼합) 판단하지 않음
+    """
+    counts = script_histogram(text)
+    total = sum(counts.values())
+    if not total:
+        return None
+
+    # 일본어는 한자와 가나를 함께 쓰므로 한 계열로 묶어서 비교
+    cjk = counts["kana"] + counts["han"]
+    groups = {"hangul": counts["hangul"], "cjk": cjk, "cyrillic": counts["cyrillic"], "latin": counts["latin"]}
+    script = max(groups, key=groups.get)
+    if groups[script] / total < get_setting("LANG_DETECT_MIN_RATIO", 0.6):
+        return None
+
+    if script == "hangul":
+        return _pick("ko", candidates)
+    if script == "cjk":
+        # 한자만 있는 짧은 일본어 문장도 있으므로 가나가 조금이라도 섞이면 일본어
+        return _pick("ja" if counts["kana"] else "zh-CN", candidates)
+    if script == "cyrillic":
+        return _pick("ru", candidates)
+    return _latin_lang(text, candidates)
+
+
+def detect_source_lang(text):
+    """
+    번역 요청 전에 정할 원본 언어
+    자동 감지를 끈 경우 SOURCE_LANG, 로컬 감지로 확실하지 않으면 None (엔진별 자동 감지 사용)
+    """
+    if not get_setting("AUTO_DETECT_LANG", False):
+        return get_setting("SOURCE_LANG")
+    if not get_setting("USE_LOCAL_LANG_DETECT", True):
+        return None
+
+    lang = detect_language(text, detection_candidates())
+    increment(f"lang_detect.{lang or 'remote'}")
+    write_log(f"[🔍 로컬 언어 감지] {lang or '판단 보류 (엔진 자동 감지 사용)'}", "DEBUG")
+    return lang
+
+
+def easyocr_lang_list(lang_code, extra_langs=()):
+    """
+    EasyOCR 언어 목록: 기본 언어 + 같은 인식 모델로 읽을 수 있는 추가 언어 + 영어
+    (한/중/일은 각각 영어와만 함께 쓸 수 있고, 라틴/키릴 계열은 같은 계열끼리 묶을 수 있음)
+    """
+    primary = _EASYOCR_CODES.get(base_lang(lang_code), "en")
+    model = _EASYOCR_MODELS[primary]
+    langs = [primary]
+    for code in extra_langs:
+        extra = _EASYOCR_CODES.get(base_lang(code))
+        if extra and extra not in langs and _EASYOCR_MODELS[extra] == model:
+            langs.append(extra)
+    if "en" not in langs:
+        langs.append("en")
+    return langs
@@ -0,0 +1,114 @@
+# logger.py - 백그라운드 스레드로 모아서 기록하는 로그 (OCR 루프에서 파일 I/O 제거)
+import os
+import queue
+import threading
+import time
+from config import get_setting
+
+LOG_FILE = "debug_log.txt"
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+_queue = queue.SimpleQueue()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+
+def _level_enabled(level):
+    threshold = LOG_LEVELS.get(get_setting("LOG_LEVEL", "INFO"), 20)
+    return LOG_LEVELS.get(level, 20) >= threshold
+
+
+def write_log(message, level="INFO"):
+    """
+    로그 기록 요청 (즉시 반환)
+    - LOG_LEVEL보다 낮은 수준의 메시지는 큐에 넣지도 않음
+    - 실제 파일 쓰기/콘솔 출력은 백그라운드 스레드가 묶어서 처리
+    """
+    if not _level_enabled(level):
+        return
+    _ensure_writer()
+    _queue.put(str(message))
+
+
+def flush_log(timeout=2.0):
+    """대기 중인 로그를 모두 기록할 때까지 기다림 (프로그램 종료 시)"""
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
+
+
+def start_log_file(header):
+    """로그 파일을 새로 시작 (이전 내용은 백업 파일로 회전)"""
+    try:
+        _rotate()
+        with open(LOG_FILE, "w", encoding="utf-8") as log_file:
+            log_file.write(f"{header}\n")
+    except Exception as e:
+        print(f"로그 파일 생성 실패: {e}")
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="log-writer", daemon=True)
+            _writer_thread.start()
+
+
+def _rotate():
+    """debug_log.txt → debug_log.txt.1 → ... (LOG_BACKUP_COUNT개 유지)"""
+    backup_count = get_setting("LOG_BACKUP_COUNT", 2)
+    if not os.path.exists(LOG_FILE):
+        return
+    if backup_count <= 0:
+        os.remove(LOG_FILE)
+        return
+    for i in range(backup_count - 1, 0, -1):
+        src = f"{LOG_FILE}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{LOG_FILE}.{i + 1}")
+    os.replace(LOG_FILE, f"{LOG_FILE}.1")
+
+
+def _write_batch(lines):
+    if get_setting("LOG_TO_CONSOLE", True):
+        print("\n".join(lines))
+    try:
+        with open(LOG_FILE, "a", encoding="utf-8") as log_file:
+            log_file.write("\n".join(lines) + "\n")
+            size = log_file.tell()
+        if size > get_setting("LOG_MAX_BYTES", 5 * 1024 * 1024):
+            _rotate()
+    except Exception as e:
+        print(f"로그 기록 실패: {e}")
+
+
+def _writer_loop():
+    while True:
+        item = _queue.get()
+        batch = []
+        waiters = []
+
+        # 첫 메시지 이후 LOG_FLUSH_INTERVAL 동안 들어온 메시지를 한 번에 기록
+        deadline = time.time() + get_setting("LOG_FLUSH_INTERVAL", 0.5)
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break
+            batch.append(item)
+            remaining = deadline - time.time()
+            if remaining <= 0 or len(batch) >= 1000:
+                break
+            try:
+                item = _queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_batch(batch)
+        for waiter in waiters:
+            waiter.set()
@@ -3,33 +3,21 @@ import threading
 import traceback
 import time
 import os
-import sys
 
-# 로그 함수 정의 - 다른 모듈에서도 사용할 수 있도록 글로벌 함수로 설정
-def write_log(message):
-    try:
-        with open("debug_log.txt", "a", encoding="utf-8") as log_file:
-            log_file.write(f"{message}\n")
-        print(message)  # 콘솔에도 출력
-    except Exception as e:
-        print(f"로그 기록 실패: {e}")
+# 공용 로그 함수 (백그라운드 스레드에서 파일 기록)
+from logger import write_log, flush_log, start_log_file
 
 # 초기 로그 파일 생성
-try:
-    with open("debug_log.txt", "w", encoding="utf-8") as log_file:
-        log_file.write(f"프로그램 시작: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-    write_log("로그 파일 생성 완료")
-except Exception as e:
-    print(f"로그 파일 생성 실패: {e}")
-
-# 모듈이 임포트될 때 write_log 함수를 글로벌로 사용할 수 있도록 설정
-sys.modules['write_log'] = write_log
+start_log_file(f"프로그램 시작: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+write_log("로그 파일 생성 완료")
 
 # 나머지 모듈 임포트는 로그 함수 정의 이후에 진행
 try:
     from core_utils import create_status_window, stop_ocr
     from overlay_webserver import run_flask_server
     from config import load_settings
+    from ocr_reader_cache import preload_ocr_reader
+    from ocr import schedule_reader_unload
     import keyboard
     write_log("기본 모듈 임포트 완료")
 except Exception as e:
@@ -73,6 +61,11 @@ def main():
         gui_elements = create_status_window()
         write_log("[GUI 요소 생성 완료]")
 
+        # 현재 언어의 OCR 리더를 미리 로드 (첫 번역 시작 시 모델 로딩 대기 제거)
+        # 번역을 켜지 않은 채로 READER_IDLE_UNLOAD초가 지나면 다시 해제
+        preload_ocr_reader()
+        schedule_reader_unload()
+
         # 출력 모드 바뀔 때마다 Flask 보장 실행
         output_mode_var = gui_elements.get("output_mode_var")
         if output_mode_var:
@@ -120,6 +113,7 @@ def main():
             write_log(f"[OCR 정리 중 오류]: {str(e)}")
             write_log(traceback.format_exc())
         write_log(f"[로그 종료] {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        flush_log()
 
 if __name__ == "__main__":
     try:
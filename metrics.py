@@ -0,0 +1,97 @@
+# metrics.py - 단계별 처리 시간/횟수 집계 (/metrics 라우트에서 조회)
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from config import get_setting
+
+_lock = threading.Lock()
+_latencies = {}  # 단계 이름 → 최근 처리 시간(초) deque
+_totals = {}  # 단계 이름 → (누적 횟수, 누적 시간)
+_counters = {}  # 이벤트 이름 → 횟수
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def record_latency(name, seconds):
+    with _lock:
+        window = _latencies.get(name)
+        if window is None:
+            window = _latencies[name] = deque(maxlen=get_setting("METRICS_WINDOW", 512))
+        window.append(seconds)
+        count, total = _totals.get(name, (0, 0.0))
+        _totals[name] = (count + 1, total + seconds)
+
+
+def increment(name, amount=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+@contextmanager
+def timed(name):
+    """with timed("ocr"): ... 블록의 실행 시간을 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_latency(name, time.perf_counter() - start)
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def latency_percentile(name, q, min_samples=1):
+    """최근 처리 시간의 q 분위수 (기록이 min_samples개 미만이면 None)"""
+    with _lock:
+        window = _latencies.get(name)
+        if not window or len(window) < min_samples:
+            return None
+        values = sorted(window)
+    return _percentile(values, q)
+
+
+def reset_metrics():
+    with _lock:
+        _latencies.clear()
+        _totals.clear()
+        _counters.clear()
+
+
+def snapshot():
+    """현재 집계 결과 (최근 구간의 p50/p95/p99 + 누적 횟수)"""
+    with _lock:
+        stages = {}
+        for name, window in _latencies.items():
+            values = sorted(window)
+            count, total = _totals[name]
+            stages[name] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                **{f"p{int(q * 100)}": _percentile(values, q) for q in QUANTILES},
+            }
+        return {"stages": stages, "counters": dict(_counters)}
+
+
+def prometheus_text():
+    """Prometheus 텍스트 형식 (summary + counter)"""
+    data = snapshot()
+    lines = [
+        "# HELP sonagi_stage_latency_seconds Per-stage processing time over the recent window",
+        "# TYPE sonagi_stage_latency_seconds summary",
+    ]
+    for name, stage in sorted(data["stages"].items()):
+        for q in QUANTILES:
+            lines.append(f'sonagi_stage_latency_seconds{{stage="{name}",quantile="{q}"}} {stage[f"p{int(q * 100)}"]:.6f}')
+        lines.append(f'sonagi_stage_latency_seconds_count{{stage="{name}"}} {stage["count"]}')
+        lines.append(f'sonagi_stage_latency_seconds_sum{{stage="{name}"}} {stage["mean"] * stage["count"]:.6f}')
+
+    lines.append("# HELP sonagi_events_total Pipeline event counts")
+    lines.append("# TYPE sonagi_events_total counter")
+    for name, value in sorted(data["counters"].items()):
+        lines.append(f'sonagi_events_total{{event="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
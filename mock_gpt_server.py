@@ -0,0 +1,129 @@
+# mock_gpt_server.py - 스트리밍 GPT 번역을 네트워크/API 키 없이 확인하기 위한 가짜 Chat Completions 서버
+#
+# 사용 예:
+#   python mock_gpt_server.py --port 8765 --reply "안녕하세요, 여러분!" --delay 0.3
+#   → config.py의 GPT_API_URL을 "http://127.0.0.1:8765/v1/chat/completions"로 지정하고 ENGINE을 "gpt"로
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def sse_event(data):
+    """SSE 한 건 ("data: ...", 빈 줄로 끝남)"""
+    payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+    return f"data: {payload}\n\n"
+
+
+def chunk_events(chunks, usage=0):
+    """번역 조각 목록 → OpenAI 스트리밍 형식의 SSE 목록 (마지막에 사용량, [DONE])"""
+    events = [sse_event({"choices": [{"index": 0, "delta": {"content": chunk}}]}) for chunk in chunks]
+    events.append(sse_event({"choices": [], "usage": {"total_tokens": usage}}))
+    events.append(sse_event("[DONE]"))
+    return events
+
+
+class MockGptServer:
+    """
+    127.0.0.1에서 동작하는 가짜 OpenAI Chat Completions 서버
+    - stream=true 요청: events의 각 문자열을 delay초 간격으로 하나씩 전송 (청크 인코딩)
+      (SSE 한 건을 여러 문자열로 나누면 줄이 중간에 끊겨 도착하는 경우도 재현 가능)
+    - 그 외 요청: 조각을 합친 전체 응답을 한 번에 전송
+    받은 요청 본문은 requests 목록에 기록
+    """
+
+    def __init__(self, chunks, delay=0.0, port=0, usage=0, events=None):
+        self.chunks = list(chunks)
+        self.delay = delay
+        self.usage = usage
+        self.events = list(events) if events is not None else chunk_events(self.chunks, usage)
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/v1/chat/completions"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                server.requests.append(body)
+                if body.get("stream"):
+                    self._stream()
+                else:
+                    self._reply()
+
+            def _reply(self):
+                data = json.dumps({
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(server.chunks)}}],
+                    "usage": {"total_tokens": server.usage},
+                }, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for event in server.events:
+                    data = event.encode("utf-8")
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    self.wfile.flush()
+                    if server.delay:
+                        time.sleep(server.delay)
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-gpt-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 GPT 번역 확인용 가짜 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--reply", default="안녕하세요, 여러분! 오늘도 좋은 하루 되세요.", help="보낼 번역문")
+    parser.add_argument("--chunk-size", type=int, default=3, help="조각 하나의 글자 수")
+    parser.add_argument("--delay", type=float, default=0.2, help="조각 사이 간격 (초)")
+    args = parser.parse_args()
+
+    chunks = [args.reply[i:i + args.chunk_size] for i in range(0, len(args.reply), args.chunk_size)]
+    server = MockGptServer(chunks, delay=args.delay, port=args.port, usage=len(args.reply))
+    print(f"▶ 가짜 GPT 서버: {server.url} (조각 {len(chunks)}개, 간격 {args.delay}s)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
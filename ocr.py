@@ -1,211 +1,582 @@
 # ocr.py (SocketIO 클라이언트 수정)
 import time
-import pyautogui
-import numpy as np
 import threading
+import numpy as np
 import socketio
 import traceback
 from config import get_setting
-from translator_dispatch import translate_text, get_lang
-
-# 로그 기록 함수
-def write_log(message):
-    try:
-        with open("debug_log.txt", "a", encoding="utf-8") as log_file:
-            log_file.write(f"{message}\n")
-        print(message)  # 콘솔에도 출력
-    except:
-        pass
+from logger import write_log
+from translator_dispatch import translate_text_segmented
+from ocr_reader_cache import get_ocr_reader, release_ocr_readers
+from frame_gate import make_fingerprint, frame_changed
+from capture import create_capture_backend, SessionRecorder
+from ocr_regions import (
+    LatestSlots, load_ocr_regions, regions_signature, union_box, crop_region, compose_outputs
+)
+from text_dedup import RecentTexts
+from translation_cache import is_error_result
+from metrics import timed, record_latency, increment
+from overlay_mailbox import overlay_mailbox
+from ocr_filter import filter_ocr_results, reading_order_lines, is_meaningful_text
+from preprocess import preprocess_image, choose_scale
+from recognition_cache import readtext_cached, supports_cache, clear_recognition_cache
 
-# easyocr Reader 초기화 - 필요할 때만 임포트하도록 변경
+# easyocr Reader 초기화 - 이미 로드된 리더는 캐시에서 재사용
 def init_ocr_reader():
     try:
         write_log("[🔍 OCR 리더 초기화 시작]")
-        import easyocr
-        lang_list = get_lang(get_setting("SOURCE_LANG"))
-        use_gpu = get_setting("USE_GPU")
-        write_log(f"[🔍 OCR 리더 초기화] 언어: {lang_list}, GPU: {use_gpu}")
-        return easyocr.Reader(lang_list, gpu=use_gpu)
+        return get_ocr_reader()
     except Exception as e:
-        write_log(f"[⚠️ OCR 리더 초기화 오류]: {str(e)}")
-        write_log(traceback.format_exc())
+        write_log(f"[⚠️ OCR 리더 초기화 오류]: {str(e)}", "WARNING")
+        write_log(traceback.format_exc(), "WARNING")
         return None
 
 # 전역 변수로 OCR 리더 관리
 ocr_reader = None
+# 리더 교체/해제와 OCR 시작 여부 확인을 한 번에 하기 위한 잠금 (모델 로드 자체는 잠금 밖에서)
+reader_lock = threading.Lock()
+reader_reloads = 0  # 진행 중인 리더 로드 수 (로드 중에는 해제하지 않음)
 
-def reinit_ocr_reader():
-    global ocr_reader
+def reinit_ocr_reader(background=False):
+    """
+    현재 설정(언어/GPU)의 리더로 교체
+    background=True: 로드가 끝날 때까지 기존 리더로 계속 인식하고, 끝나면 교체 (설정 창 멈춤 방지)
+    """
+    global ocr_reader, reader_reloads
+    if background:
+        threading.Thread(target=reinit_ocr_reader, name="ocr-reader-reload", daemon=True).start()
+        return
+    with reader_lock:
+        reader_reloads += 1
     try:
         write_log("[OCR 리더 초기화 시도]")
-        import easyocr
-        lang_list = get_lang(get_setting("SOURCE_LANG"))
-        use_gpu = get_setting("USE_GPU")
-        ocr_reader = easyocr.Reader(lang_list, gpu=use_gpu)
+        reader = get_ocr_reader()
+        with reader_lock:
+            ocr_reader = reader
         write_log("[OCR 리더 초기화 성공]")
     except Exception as e:
-        write_log(f"[OCR 리더 초기화 실패]: {str(e)}")
-        write_log(traceback.format_exc())
+        write_log(f"[OCR 리더 초기화 실패]: {str(e)}", "WARNING")
+        write_log(traceback.format_exc(), "WARNING")
+    finally:
+        with reader_lock:
+            reader_reloads -= 1
 
 # 최초 실행 시에는 OCR 리더를 초기화하지 않음 - 필요할 때 초기화
 
-# SocketIO 클라이언트 초기화 (네임스페이스 문제 해결)
+# 번역을 끈 채로 READER_IDLE_UNLOAD초가 지나면 OCR 모델을 메모리에서 해제
+reader_unload_timer = None
+
+def unload_ocr_reader():
+    global ocr_reader
+    # 시작/다시 로드와 겹치지 않도록 잠금 안에서 상태를 다시 확인한 뒤 해제
+    with reader_lock:
+        if ocr_running or (ocr_thread and ocr_thread.is_alive()) or reader_reloads:
+            return
+        ocr_reader = None
+        count = release_ocr_readers()
+    if count:
+        write_log(f"[💤 번역 대기 시간 초과, OCR 모델 해제] 리더 {count}개")
+
+def schedule_reader_unload():
+    global reader_unload_timer
+    cancel_reader_unload()
+    delay = get_setting("READER_IDLE_UNLOAD", 300)
+    if not delay:
+        return
+    reader_unload_timer = threading.Timer(delay, unload_ocr_reader)
+    reader_unload_timer.daemon = True
+    reader_unload_timer.start()
+
+def cancel_reader_unload():
+    global reader_unload_timer
+    if reader_unload_timer:
+        reader_unload_timer.cancel()
+        reader_unload_timer = None
+
+def preload_hint():
+    """곧 번역을 켤 것 같을 때 (상태창 포커스 등) 해제된 모델을 백그라운드에서 다시 로드"""
+    with reader_lock:
+        needed = ocr_reader is None and not ocr_running and not reader_reloads
+    if needed:
+        write_log("[🔄 OCR 모델 미리 로드 요청]", "DEBUG")
+        reinit_ocr_reader(background=True)
+
+# SocketIO 클라이언트 초기화 (OVERLAY_SERVER_URL로 원격 서버를 쓸 때만 사용)
 sio = socketio.Client()
 sio_connected = False
 
 ocr_thread = None
 ocr_running = False
+ocr_output_mode = None  # 실행 중인 OCR의 출력 모드 ("tk" / "obs")
+ocr_session = None  # 실행 중(또는 마지막)인 OCR 세션
+session_generation = 0
+
+# 중복 텍스트 관리: 최근 번역한 텍스트와 거의 같으면 (OCR 글자 흔들림) 이전 번역 재사용
+recent_texts = RecentTexts(get_setting("DEDUP_WINDOW", 5))
+
+# 화면 변화 감지 (정적인 프레임은 OCR 생략)
+frame_stats = {"skipped": 0, "recognized": 0}
+
+def get_frame_stats():
+    """OCR 스킵/실행 횟수 반환"""
+    return dict(frame_stats)
+
+STAGE_POLL_TIMEOUT = 0.2  # 단계 스레드가 종료 여부를 확인하는 주기 (초)
+FRAME_TIMES_KEEP = 64
+pipeline_stats = {"dropped": 0, "stale": 0}
+
+class OcrSession:
+    """
+    OCR 시작부터 중지까지 한 번의 실행 (세대)
+    - 단계 사이 슬롯(캡처 → OCR → 번역 → 출력)과 영역 상태를 세션마다 새로 만듦
+      → 번역/OCR이 끝나지 않아 살아 있는 이전 세션의 단계가 새 세션의 작업을 가져가지 않음
+    - 중지되었거나 다음 세션이 시작된 세션의 단계는 처리 중이던 결과를 출력하지 않고 종료
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.stopped = threading.Event()
+        # 영역마다 슬롯 하나: 새 작업이 들어오면 같은 영역의 처리되지 않은 이전 작업을 버림
+        self.ocr_slots = LatestSlots()
+        self.translate_slots = LatestSlots()
+        self.emit_slots = LatestSlots()
+        # 감시 중인 OCR 영역 목록 (영역마다 주기/변화 감지/안정화 상태를 따로 가짐)
+        self.regions = []
+        # 영역 이름 → 마지막으로 출력한 번역 (오버레이에는 영역 순서대로 합쳐서 표시)
+        self.region_outputs = {}
+        # 프레임 번호 → 캡처 시각 (출력 시점에 전체 지연 시간 계산)
+        self.frame_times = {}
+
+    def is_current(self):
+        return not self.stopped.is_set() and ocr_session is self
+
+    def stop(self):
+        self.stopped.set()
+        for slots in (self.ocr_slots, self.translate_slots, self.emit_slots):
+            slots.clear()
+
+def put_latest(slots, region, item):
+    """같은 영역의 대기 중인 작업이 있으면 버리고 새 작업을 넣음"""
+    if slots.put(region.name, item):
+        pipeline_stats["dropped"] += 1
+
+def ensure_sio_connected():
+    """OBS 모드(원격 서버): SocketIO 서버 연결 확인 (연결 실패 시 False)"""
+    global sio_connected
+    if sio_connected and sio.connected:
+        return True
+    try:
+        # 디버그 로그 추가
+        write_log(f"[🔌 현재 연결 상태] sio_connected: {sio_connected}, sio.connected: {getattr(sio, 'connected', False)}", "DEBUG")
+
+        # 네임스페이스 제거, 기본 네임스페이스 사용
+        sio.connect(get_setting("OVERLAY_SERVER_URL"))
+        sio_connected = True
+        write_log("[🔌 WebSocket 연결 성공]")
+        return True
+    except Exception as e:
+        write_log(f"[WebSocket 연결 실패] {str(e)}", "WARNING")
+        return False
+
+def publish_obs_text(text, region=None):
+    """
+    OBS 모드 출력 (region 지정 시 영역별 "region_text" 이벤트)
+    - 기본: 같은 프로세스의 Flask-SocketIO 서버 객체로 바로 브로드캐스트
+    - OVERLAY_SERVER_URL 지정 시: 원격 서버에 WebSocket 클라이언트로 전송
+    """
+    global sio_connected
+    if not get_setting("OVERLAY_SERVER_URL"):
+        from overlay_webserver import publish_text, publish_region_text
+        if region is None:
+            publish_text(text)
+        else:
+            publish_region_text(region, text)
+        return True
+    if not ensure_sio_connected():
+        return False
+    try:
+        if region is None:
+            sio.emit("push_text", text)
+        else:
+            sio.emit("push_region_text", {"region": region, "text": text})
+        return True
+    except Exception:
+        sio_connected = False
+        raise
+
+def release_settled_text(session):
+    """SETTLE_TIME이 지나고 이후 캡처에서도 바뀌지 않은 텍스트를 영역별로 번역 슬롯에 전달"""
+    now = time.time()
+    settle_time = get_setting("SETTLE_TIME", 0.6)
+    for region in list(session.regions):
+        settled = region.settle.poll(now, settle_time)
+        if settled:
+            region.latest_seq = settled[0]
+            put_latest(session.translate_slots, region, (region, *settled))
+
+def recognize_crops(crops):
+    """
+    여러 영역의 이미지를 한 번의 EasyOCR 호출로 인식
+    영역마다 (글자 상자, 텍스트, 신뢰도) 목록 반환 (detail=1, 글자 영역 추적에 사용)
+    배치 인식은 같은 크기의 이미지가 필요하므로 가장 큰 크기에 맞춰 배경색으로 채움
+    """
+    use_cache = get_setting("USE_RECOGNITION_CACHE", True) and supports_cache(ocr_reader)
+    if len(crops) == 1:
+        return readtext_cached(ocr_reader, crops) if use_cache else [ocr_reader.readtext(crops[0], detail=1)]
+    if not use_cache and not hasattr(ocr_reader, "readtext_batched"):
+        return [ocr_reader.readtext(crop, detail=1) for crop in crops]
+
+    height = max(crop.shape[0] for crop in crops)
+    width = max(crop.shape[1] for crop in crops)
+    batch = []
+    for crop in crops:
+        padded = np.empty((height, width) + crop.shape[2:], dtype=crop.dtype)
+        padded[...] = crop[0, 0]
+        padded[:crop.shape[0], :crop.shape[1]] = crop
+        batch.append(padded)
+    if use_cache:
+        return readtext_cached(ocr_reader, batch)
+    return ocr_reader.readtext_batched(batch, detail=1)
+
+def ocr_stage(session):
+    """OCR 단계: 캡처된 영역들을 한 번에 인식하여 영역별로 번역 슬롯에 전달"""
+    while not session.stopped.is_set():
+        batch = session.ocr_slots.take_all(STAGE_POLL_TIMEOUT)
+        if not batch:
+            # 새 프레임이 없다 = 화면이 멈춤 → 보류 중인 텍스트 확인
+            release_settled_text(session)
+            continue
+
+        try:
+            with timed("ocr"):
+                results = recognize_crops([crop for _, _, crop, _ in batch])
+            frame_stats["recognized"] += len(batch)
+            increment("ocr_calls")
+            increment("ocr_regions", len(batch))
+            write_log(f"[🧾 OCR 텍스트 인식 완료] 영역: {[region.name for region, _, _, _ in batch]}", "DEBUG")
+        except Exception as e:
+            write_log(f"[⚠️ OCR 텍스트 인식 실패] {str(e)}", "WARNING")
+            increment("ocr_failures")
+            # 같은 화면이라도 다음 캡처에서 다시 인식하도록 지문 초기화
+            for region, _, _, _ in batch:
+                region.last_fingerprint = None
+            continue
+        if session.stopped.is_set():
+            break
+
+        now = time.time()
+        for (region, seq, _, (offset, scale, full_scan)), result in zip(batch, results):
+            # 축소된 이미지의 좌표를 원래 영역 좌표로 되돌림
+            if scale != 1.0:
+                result = [([(x / scale, y / scale) for x, y in box], line, confidence) for box, line, confidence in result]
+
+            # 신뢰도가 낮거나 너무 작은 상자(아이콘, 무늬) 제거 후 읽는 순서로 정렬
+            kept = filter_ocr_results(result)
+            if len(kept) < len(result):
+                increment("ocr_boxes_dropped", len(result) - len(kept))
+            region.learn_text_boxes([box for box, _, _ in kept], offset, full_scan)
+            text = "\n".join(reading_order_lines(kept)).strip()
+
+            if text and get_setting("SKIP_MEANINGLESS_TEXT", True) and not is_meaningful_text(text):
+                increment("meaningless_skipped")
+                write_log(f"[⚠️ 의미 없는 텍스트로 판단되어 번역을 건너뜁니다] {region.name}: {text}", "DEBUG")
+                continue
+
+            # 텍스트가 없으면 건너뜀
+            if not text:
+                write_log(f"[⚠️ 인식된 텍스트 없음, 건너뜀] 영역: {region.name}", "DEBUG")
+                continue
+
+            write_log(f"[🧾 OCR 원본 텍스트] {region.name}: {text}", "DEBUG")
+            if region.settle.update(text, seq, now) and get_setting("SETTLE_TIME", 0.6) > 0:
+                state = "글자 추가 중" if region.settle.growing else "텍스트 변경"
+                write_log(f"[⌛ {state}, 번역 보류] {region.name} 보류 후 폐기: {region.settle.superseded}회", "DEBUG")
+                # 완성 전 텍스트를 번역 없이 그대로 표시 (선택)
+                if get_setting("SHOW_PARTIAL_TEXT", False):
+                    put_latest(session.emit_slots, region, (region, seq, text, False))
+        release_settled_text(session)
+
+def stream_partial(session, region, seq):
+    """
+    스트리밍 번역의 중간 결과를 출력 슬롯에 넣는 함수
+    (중간 결과끼리 덮어쓰는 것은 정상이므로 폐기 횟수에 넣지 않음, 더 새 텍스트가 인식되었으면 표시하지 않음)
+    """
+    def on_partial(partial):
+        if partial and seq >= region.latest_seq and not session.stopped.is_set():
+            session.emit_slots.put(region.name, (region, seq, partial, False))
+    return on_partial
+
+def translate_stage(session):
+    """번역 단계: 영역마다 최신 텍스트만 번역하여 출력 슬롯에 전달"""
+    while not session.stopped.is_set():
+        for region, seq, text in session.translate_slots.take_all(STAGE_POLL_TIMEOUT):
+            # 이미 더 새로운 텍스트가 인식되었으면 이전 프레임은 버림
+            if seq < region.latest_seq:
+                pipeline_stats["stale"] += 1
+                write_log(f"[⏭️ 오래된 프레임 폐기] {region.name} #{seq} < #{region.latest_seq}", "DEBUG")
+                continue
+
+            try:
+                # 최근 텍스트와 거의 같은지 확인
+                match = recent_texts.find(text, get_setting("DEDUP_SIMILARITY", 0.9))
+                if match:
+                    translated, ratio = match
+                    increment("dedup_hits")
+                    write_log(f"[⏩ 유사 텍스트 감지, 이전 번역 재사용] 유사도: {ratio:.2f}", "DEBUG")
+                else:
+                    with timed("translate"):
+                        translated = translate_text_segmented(text, on_partial=stream_partial(session, region, seq))
+                    if session.stopped.is_set():
+                        # 번역 중에 중지/재시작됨 → 이전 세션의 결과는 출력하지 않고 새 세션의 중복 목록에도 넣지 않음
+                        write_log(f"[⏭️ 중지된 OCR 세션의 번역 폐기] #{session.generation}", "DEBUG")
+                        break
+                    if not is_error_result(translated):
+                        recent_texts.add(text, translated)
+                    write_log("[🌐 번역 성공]", "DEBUG")
+            except Exception as e:
+                write_log(f"[⚠️ 번역 실패] {str(e)}", "WARNING")
+                increment("translate_failures")
+                continue
 
-# 중복 텍스트 관리를 위한 변수들
-last_text = ""
-last_translated = ""
-repeat_count = 0
-MAX_REPEAT = 3  # 최대 3번까지만 같은 텍스트 번역
+            write_log(f"[🌐 번역 결과]: {translated[:50]}..." if len(translated) > 50 else f"[🌐 번역 결과]: {translated}", "DEBUG")
+            put_latest(session.emit_slots, region, (region, seq, translated, True))
 
-def ocr_loop(overlay_label, output_mode="tk", status_window=None):
-    global ocr_running, sio_connected, last_text, last_translated, repeat_count
+def emit_stage(session, overlay_label, output_mode):
+    """출력 단계: 영역별 번역 결과를 합쳐 Tk 오버레이 또는 OBS로 전송"""
+    while not session.stopped.is_set():
+        updated = []
+        for region, seq, translated, final in session.emit_slots.take_all(STAGE_POLL_TIMEOUT):
+            # 이미 더 새로운 결과를 출력했으면 버림
+            if seq < region.emitted_seq:
+                pipeline_stats["stale"] += 1
+                continue
+            first = seq != region.emitted_seq
+            region.emitted_seq = seq
+            session.region_outputs[region.name] = translated
+            updated.append((region, seq, first, final))
+        if not updated:
+            continue
+        if not session.is_current():
+            # 이전 세션의 단계가 늦게 깨어난 경우: 새 세션의 오버레이를 덮어쓰지 않음
+            write_log(f"[⏭️ 중지된 OCR 세션의 출력 폐기] #{session.generation}", "DEBUG")
+            break
+
+        write_log(f"[🧭 현재 출력 모드]: {output_mode}", "DEBUG")
+        emit_start = time.perf_counter()
+        combined = compose_outputs(session.regions, session.region_outputs)
+
+        if output_mode == "tk":
+            # Tk는 스레드 안전하지 않으므로 직접 config하지 않고 Tk 스레드에 맡김
+            overlay_mailbox.post(overlay_label, combined)
+            write_log("[✅ TK 모드: 오버레이 텍스트 전달 완료]", "DEBUG")
+        else:
+            try:
+                # 기존 오버레이 페이지용 합친 텍스트 + 영역별 이벤트 (?region= 페이지용)
+                if publish_obs_text(combined):
+                    for region, _, _, _ in updated:
+                        publish_obs_text(session.region_outputs[region.name], region.name)
+                    write_log("[✅ OBS 모드: 오버레이 전송 완료]", "DEBUG")
+            except Exception as e:
+                write_log(f"[⚠️ OBS 오버레이 전송 실패] {str(e)}", "WARNING")
+
+        now = time.perf_counter()
+        record_latency("emit", now - emit_start)
+        for _, seq, first, final in updated:
+            captured_at = session.frame_times.get(seq)
+            if captured_at is None:
+                continue
+            # 첫 글자가 화면에 나온 시점 (스트리밍/미리 보기) / 최종 번역이 나온 시점
+            if first:
+                record_latency("first_output", now - captured_at)
+            if final:
+                record_latency("end_to_end", now - captured_at)
+        increment("overlay_updates")
+
+def ocr_loop(session, overlay_label, output_mode="tk", status_window=None):
+    """캡처 단계를 실행하고 OCR/번역/출력 단계 스레드를 관리"""
+    global ocr_running
 
     # OCR 리더가 없으면 초기화
     global ocr_reader
     if ocr_reader is None:
         ocr_reader = init_ocr_reader()
         if ocr_reader is None:
-            write_log("[⚠️ OCR 리더 초기화 실패로 OCR 루프 종료]")
+            write_log("[⚠️ OCR 리더 초기화 실패로 OCR 루프 종료]", "WARNING")
             ocr_running = False
+            session.stop()
             return
 
     write_log(f"[✅ OCR 루프 시작] 출력 모드: {output_mode}")
 
-    while ocr_running:
-        try:
-            if output_mode == "obs":
-                if not sio_connected or not sio.connected:
-                    try:
-                        # 디버그 로그 추가
-                        write_log(f"[🔌 현재 연결 상태] sio_connected: {sio_connected}, sio.connected: {getattr(sio, 'connected', False)}")
-                        
-                        # 네임스페이스 제거, 기본 네임스페이스 사용
-                        sio.connect("http://localhost:5000")
-                        sio_connected = True
-                        write_log("[🔌 WebSocket 연결 성공]")
-                    except Exception as e:
-                        write_log(f"[WebSocket 연결 실패] {str(e)}")
-                        time.sleep(1)
-                        continue
+    try:
+        capture_backend = create_capture_backend()
+        write_log(f"[📸 캡처 백엔드]: {capture_backend.name}")
+    except Exception as e:
+        write_log(f"[⚠️ 캡처 백엔드 생성 실패로 OCR 루프 종료] {str(e)}", "WARNING")
+        ocr_running = False
+        session.stop()
+        return
 
-            region = get_setting("OCR_REGION")
-            if not region:
-                write_log("[⚠️ OCR 영역이 설정되지 않음]")
-                time.sleep(1)
-                continue
+    recorder = None
+    if get_setting("RECORD_SESSION_PATH"):
+        recorder = SessionRecorder(get_setting("RECORD_SESSION_PATH"), get_setting("RECORD_MAX_FRAMES", 2000),
+                                   capture_backend.channel_order)
+        write_log(f"[⏺️ 세션 녹화 시작]: {recorder.path}")
 
-            x1, y1, x2, y2 = region
-            try:
-                img = pyautogui.screenshot(region=(x1, y1, x2 - x1, y2 - y1))
-                write_log(f"[📸 스크린샷 촬영 성공] 영역: {region}")
-            except Exception as e:
-                write_log(f"[⚠️ 스크린샷 실패] {str(e)}")
-                time.sleep(1)
-                continue
+    # 단계 스레드 이름에 세션 번호를 붙여 이전 세션의 스레드와 구분
+    stages = [
+        threading.Thread(target=ocr_stage, args=(session,), name=f"ocr_stage-{session.generation}", daemon=True),
+        threading.Thread(target=translate_stage, args=(session,), name=f"translate_stage-{session.generation}", daemon=True),
+        threading.Thread(target=emit_stage, args=(session, overlay_label, output_mode),
+                         name=f"emit_stage-{session.generation}", daemon=True),
+    ]
+    for stage in stages:
+        stage.start()
 
-            try:
-                result = ocr_reader.readtext(np.array(img), detail=0)
-                text = "\n".join(result).strip()
-                write_log(f"[🧾 OCR 텍스트 인식 완료] 길이: {len(text)}")
-            except Exception as e:
-                write_log(f"[⚠️ OCR 텍스트 인식 실패] {str(e)}")
+    session.regions = load_ocr_regions()
+    signature = regions_signature()
+    seq = 0
+    while not session.stopped.is_set():
+        try:
+            # 설정 창 등에서 영역이 바뀌면 다시 구성
+            if regions_signature() != signature:
+                session.regions = load_ocr_regions()
+                signature = regions_signature()
+                session.region_outputs.clear()
+                write_log(f"[🔲 OCR 영역 변경됨]: {[region.name for region in session.regions]}")
+            if not session.regions:
+                write_log("[⚠️ OCR 영역이 설정되지 않음]", "WARNING")
                 time.sleep(1)
                 continue
-            
-            # 텍스트가 없으면 건너뜀
-            if not text:
-                write_log("[⚠️ 인식된 텍스트 없음, 건너뜀]")
-                time.sleep(get_setting("OCR_INTERVAL"))
-                continue
-                
-            write_log(f"[🧾 OCR 원본 텍스트]: {text}")
-
-            # 이전 텍스트와 동일한지 확인
-            if text == last_text:
-                repeat_count += 1
-                write_log(f"[🔄 동일 텍스트 감지] 반복 횟수: {repeat_count}/{MAX_REPEAT}")
-                
-                # 최대 반복 횟수 이상이면 이전 번역 결과 재사용
-                if repeat_count >= MAX_REPEAT:
-                    write_log(f"[⏩ 번역 스킵] 이전 번역 결과 재사용")
-                    translated = last_translated
-                else:
-                    # 최대 반복 횟수 미만이면 새로 번역
-                    translated = translate_text(text)
-                    last_translated = translated
-            else:
-                # 새로운 텍스트면 초기화 후 번역
-                last_text = text
-                repeat_count = 0
+
+            now = time.perf_counter()
+            due = [region for region in session.regions if region.next_due <= now]
+            if due:
+                # 모든 영역을 한 번에 캡처한 뒤 주기가 된 영역만 잘라서 사용
+                union = union_box(session.regions)
                 try:
-                    translated = translate_text(text)
-                    last_translated = translated
-                    write_log(f"[🌐 번역 성공]")
+                    with timed("capture"):
+                        frame = capture_backend.grab(union)
+                    increment("frames")
+                    if recorder:
+                        recorder.add(frame, time.time())
+                    write_log(f"[📸 스크린샷 촬영 성공] 영역: {union}", "DEBUG")
                 except Exception as e:
-                    write_log(f"[⚠️ 번역 실패] {str(e)}")
+                    write_log(f"[⚠️ 스크린샷 실패] {str(e)}", "WARNING")
                     time.sleep(1)
                     continue
 
-            write_log(f"[🌐 번역 결과]: {translated[:50]}..." if len(translated) > 50 else f"[🌐 번역 결과]: {translated}")
-            write_log(f"[🧭 현재 출력 모드]: {output_mode}")
+                seq += 1
+                ready = []
+                for region in due:
+                    crop = crop_region(frame, union, region.box)
 
-            if output_mode == "tk":
-                try:
-                    overlay_label.config(text=translated)
-                    write_log("[✅ TK 모드: 오버레이 텍스트 업데이트 완료]")
-                except Exception as e:
-                    write_log(f"[⚠️ TK 오버레이 업데이트 실패] {str(e)}")
-            elif sio_connected:
-                try:
-                    # 이벤트만 emit, 네임스페이스 없음
-                    sio.emit("push_text", translated)
-                    write_log("[✅ OBS 모드: WebSocket 전송 완료]")
-                except Exception as e:
-                    write_log(f"[⚠️ WebSocket emit 실패] {str(e)}")
-                    sio_connected = False
+                    # 이전 프레임과 화면이 같으면 OCR 자체를 건너뜀
+                    with timed("frame_gate"):
+                        fingerprint = make_fingerprint(crop, get_setting("FRAME_FINGERPRINT_SIZE", (64, 16)))
+                        changed = frame_changed(region.last_fingerprint, fingerprint, get_setting("FRAME_DIFF_THRESHOLD", 6.0))
+                    region.schedule_next(now, changed)
+                    if not changed:
+                        frame_stats["skipped"] += 1
+                        increment("frames_skipped")
+                        # 마지막으로 OCR에 보낸 프레임의 텍스트가 그대로임 → 보류 중인 텍스트 안정 확인
+                        region.settle.confirm(region.fingerprint_seq)
+                        write_log(f"[⏸️ 화면 변화 없음, OCR 스킵] {region.name} 스킵: {frame_stats['skipped']} / 인식: {frame_stats['recognized']}", "DEBUG")
+                        continue
+
+                    # OCR 단계가 바쁘면 같은 영역의 대기 중인 이전 프레임은 버려짐
+                    region.last_fingerprint = fingerprint
+                    region.fingerprint_seq = seq
+                    # 학습된 글자 영역만 OCR (주기적으로 전체 영역 재검사)
+                    crop, offset, full_scan = region.roi_view(crop, now)
+                    # 회색조/대비/축소 전처리 (결과는 새 배열이므로 캡처 버퍼 복사를 겸함)
+                    with timed("preprocess"):
+                        processed, scale = preprocess_image(crop, scale=choose_scale(region.text_height),
+                                                            channel_order=capture_backend.channel_order)
+                    if processed is crop:
+                        # 잘라낸 영역은 캡처 버퍼의 view → 재사용 버퍼면 복사, 아니면 연속 메모리일 때만 그대로 사용
+                        processed = crop.copy() if capture_backend.reuses_buffer else np.ascontiguousarray(crop)
+                    ready.append((region.name, (region, seq, processed, (offset, scale, full_scan))))
+
+                # 같은 캡처의 영역들은 OCR 단계에서 한 번에 배치 인식되도록 함께 넣음
+                if ready:
+                    frame_times = session.frame_times
+                    frame_times[seq] = time.perf_counter()
+                    # 변화가 없는 캡처는 기록하지 않으므로 번호가 아닌 개수로 오래된 항목부터 정리
+                    while len(frame_times) > FRAME_TIMES_KEEP:
+                        frame_times.pop(next(iter(frame_times)))
+                    pipeline_stats["dropped"] += session.ocr_slots.put_many(ready)
 
         except Exception as e:
-            write_log(f"[⚠️ OCR 루프 오류] {str(e)}")
-            write_log(traceback.format_exc())
+            write_log(f"[⚠️ OCR 루프 오류] {str(e)}", "WARNING")
+            write_log(traceback.format_exc(), "WARNING")
 
-        time.sleep(get_setting("OCR_INTERVAL"))
-    
-    write_log("[🛑 OCR 루프 종료됨]")
+        # 다음 영역의 캡처 시각까지 대기
+        if session.regions:
+            session.stopped.wait(max(0.0, min(region.next_due for region in session.regions) - time.perf_counter()))
+        else:
+            session.stopped.wait(get_setting("OCR_INTERVAL"))
+
+    # 번역/OCR 중인 단계는 기다리지 않음 (끝나면 중지된 세션임을 확인하고 결과를 버린 뒤 종료)
+    session.stop()
+    for stage in stages:
+        stage.join(timeout=1.0)
+    capture_backend.close()
+    if recorder and recorder.save():
+        write_log(f"[⏺️ 세션 녹화 저장됨]: {recorder.path}")
+    write_log(f"[🛑 OCR 루프 종료됨] 폐기된 작업: {pipeline_stats['dropped']}, 오래된 프레임: {pipeline_stats['stale']}")
 
 
 def start_ocr_thread(overlay_label, mode="tk"):
-    global ocr_thread, ocr_running, last_text, last_translated, repeat_count
+    global ocr_thread, ocr_running, ocr_output_mode, ocr_session, session_generation
     
     try:
         if ocr_thread and ocr_thread.is_alive():
-            write_log("[⚠️ OCR 스레드 이미 실행 중]")
+            write_log("[⚠️ OCR 스레드 이미 실행 중]", "WARNING")
             return
             
         # 중복 감지 변수 초기화
-        last_text = ""
-        last_translated = ""
-        repeat_count = 0
+        recent_texts.clear()
+        clear_recognition_cache()
+        frame_stats["skipped"] = 0
+        frame_stats["recognized"] = 0
+        pipeline_stats["dropped"] = 0
+        pipeline_stats["stale"] = 0
         
-        ocr_running = True
-        write_log(f"[OCR 스레드 시작] 모드: {mode}")
-        ocr_thread = threading.Thread(target=ocr_loop, args=(overlay_label, mode), daemon=True)
+        # 잠금 안에서 실행 상태로 바꿔, 이미 시작된 해제 타이머가 리더를 비우지 않게 함
+        with reader_lock:
+            cancel_reader_unload()
+            ocr_running = True
+            # 새 세션 (이전 세션의 단계 스레드가 아직 살아 있어도 이 세션의 작업/출력에는 관여하지 않음)
+            session_generation += 1
+            ocr_session = OcrSession(session_generation)
+        ocr_output_mode = mode
+        write_log(f"[OCR 스레드 시작] 모드: {mode}, 세션: #{session_generation}")
+        ocr_thread = threading.Thread(target=ocr_loop, args=(ocr_session, overlay_label, mode), daemon=True)
         ocr_thread.start()
         write_log("[✅ OCR 스레드 시작됨]")
     except Exception as e:
-        write_log(f"[⚠️ OCR 스레드 시작 실패] {str(e)}")
-        write_log(traceback.format_exc())
+        write_log(f"[⚠️ OCR 스레드 시작 실패] {str(e)}", "WARNING")
+        write_log(traceback.format_exc(), "WARNING")
 
 def stop_ocr():
     global ocr_running, sio_connected
     write_log("[🛑 OCR 중지 요청됨]")
     ocr_running = False
+    if ocr_session:
+        ocr_session.stop()
+    schedule_reader_unload()
     
-    # OBS 모드일 때 투명 모드로 전환
+    # OBS 모드일 때 투명 모드로 전환 (같은 프로세스의 서버)
+    if ocr_output_mode == "obs" and not get_setting("OVERLAY_SERVER_URL"):
+        try:
+            from overlay_webserver import publish_overlay_mode
+            publish_overlay_mode("transparent")
+            write_log("[✅ OBS 모드 투명 모드 전환 완료]")
+        except Exception as e:
+            write_log(f"[⚠️ OBS 투명 모드 전환 중 오류] {str(e)}", "WARNING")
+
+    # 원격 서버에 연결된 경우
     if sio_connected:
         try:
             # 디버그 로그 추가
@@ -222,5 +593,5 @@ def stop_ocr():
             sio_connected = False
             write_log("[✅ WebSocket 연결 종료 및 투명 모드 전환 완료]")
         except Exception as e:
-            write_log(f"[⚠️ WebSocket 종료 중 오류] {str(e)}")
-            write_log(traceback.format_exc())
\ No newline at end of file
+            write_log(f"[⚠️ WebSocket 종료 중 오류] {str(e)}", "WARNING")
+            write_log(traceback.format_exc(), "WARNING")
\ No newline at end of file
@@ -0,0 +1,83 @@
+# ocr_filter.py - OCR 결과 정리 (신뢰도/크기 필터, 읽는 순서 정렬, 의미 없는 텍스트 판단)
+import re
+from config import get_setting
+from logger import write_log
+
+# 의미 있는 언어 패턴: 한글, 일본어(가나/한자), 중국어, 3자 이상의 영어 단어
+_MEANINGFUL_RE = re.compile(r"[가-힣\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]|[a-zA-Z]{3,}")
+# 특수문자: 글자/숫자/공백/일반 문장부호가 아닌 문자
+_SPECIAL_RE = re.compile(r"[^\w\s.,;:!?()\-\"']|_")
+# 띄어쓰기 없이 이어 붙이는 문자 (같은 줄의 상자를 합칠 때)
+_CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]")
+
+
+def is_meaningful_text(text):
+    """
+    텍스트가 의미 있는지 확인 (모든 번역 엔진 공통)
+    - 한글, 일본어, 중국어, 영어 등 의미 있는 언어 패턴이 있으면 의미 있음
+    - 패턴이 없고 특수문자 비율이 SPECIAL_CHAR_THRESHOLD를 넘으면 의미 없음
+    """
+    if not text or not text.strip():
+        return False
+    if _MEANINGFUL_RE.search(text):
+        return True
+
+    special_ratio = len(_SPECIAL_RE.findall(text)) / len(text)
+    threshold = get_setting("SPECIAL_CHAR_THRESHOLD", 0.3)
+    if special_ratio > threshold:
+        write_log(f"[⚠️ 특수문자 비율({special_ratio:.1%})이 임계값({threshold:.1%})을 초과하여 의미 없는 텍스트로 판단]", "DEBUG")
+        return False
+    return True
+
+
+def _bounds(box):
+    xs = [point[0] for point in box]
+    ys = [point[1] for point in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def filter_ocr_results(results):
+    """
+    readtext(detail=1) 결과에서 신뢰도가 낮거나 너무 작은 상자 제거
+    (UI 아이콘, 배경 무늬가 ~|# 같은 글자로 인식되는 경우)
+    """
+    min_confidence = get_setting("OCR_MIN_CONFIDENCE", 0.3)
+    min_height = get_setting("OCR_MIN_BOX_HEIGHT", 8)
+    kept = []
+    for box, text, confidence in results:
+        x1, y1, x2, y2 = _bounds(box)
+        if confidence < min_confidence or y2 - y1 < min_height or not text.strip():
+            continue
+        kept.append((box, text, confidence))
+    return kept
+
+
+def _join_line(texts):
+    """같은 줄의 상자를 왼쪽부터 합침 (한중일 문자끼리는 붙이고 그 외는 띄어씀)"""
+    line = texts[0]
+    for text in texts[1:]:
+        if _CJK_RE.match(line[-1]) and _CJK_RE.match(text[0]):
+            line += text
+        else:
+            line += " " + text
+    return line
+
+
+def reading_order_lines(results):
+    """
+    상자들을 읽는 순서(위→아래, 같은 줄은 왼쪽→오른쪽)로 정렬하여 줄 목록 반환
+    세로 중심이 이전 상자 높이의 절반 이내면 같은 줄로 간주
+    """
+    boxes = sorted(((_bounds(box), text) for box, text, _ in results), key=lambda item: item[0][1])
+    lines = []
+    for bounds, text in boxes:
+        center = (bounds[1] + bounds[3]) / 2
+        for line in lines:
+            if abs(center - line["center"]) <= line["height"] / 2:
+                line["items"].append((bounds[0], text))
+                break
+        else:
+            lines.append({"center": center, "height": bounds[3] - bounds[1], "items": [(bounds[0], text)]})
+
+    lines.sort(key=lambda line: line["center"])
+    return [_join_line([text for _, text in sorted(line["items"], key=lambda item: item[0])]) for line in lines]
@@ -0,0 +1,123 @@
+# ocr_reader_cache.py - 언어/GPU 설정별 EasyOCR 리더 캐시 + 백그라운드 미리 로드
+import gc
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from config import get_setting
+from logger import write_log
+
+# (언어 목록, GPU 사용) → (리더, 추정 메모리 바이트), 최근 사용 순서
+_readers = OrderedDict()
+# 모델 로드는 한 번에 하나만 (미리 로드 중인 리더를 다시 로드하지 않고 기다림)
+_load_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+
+def reader_key(lang_list=None, use_gpu=None):
+    if lang_list is None:
+        from translator_dispatch import get_lang
+        lang_list = get_lang(get_setting("SOURCE_LANG"))
+    if use_gpu is None:
+        use_gpu = bool(get_setting("USE_GPU"))
+    return tuple(lang_list), bool(use_gpu)
+
+
+def _estimate_reader_bytes(reader):
+    """검출/인식 모델의 파라미터 크기 합 (알 수 없으면 0)"""
+    total = 0
+    for model in (getattr(reader, "detector", None), getattr(reader, "recognizer", None)):
+        try:
+            total += sum(p.numel() * p.element_size() for p in model.parameters())
+        except Exception:
+            pass
+    return total
+
+
+def _evict_over_budget():
+    """메모리 예산을 넘으면 가장 오래 사용하지 않은 리더부터 제거 (_cache_lock 안에서 호출)"""
+    budget = get_setting("OCR_READER_CACHE_MB", 1024) * 1024 * 1024
+    while len(_readers) > 1 and sum(size for _, size in _readers.values()) > budget:
+        key, (reader, size) = _readers.popitem(last=False)
+        write_log(f"[🧹 OCR 리더 캐시 제거] 언어: {list(key[0])}, GPU: {key[1]}, {size / 1024 / 1024:.0f}MB")
+
+
+def get_cached_reader(lang_list=None, use_gpu=None):
+    """캐시된 리더만 반환 (없으면 None, 로드하지 않음)"""
+    key = reader_key(lang_list, use_gpu)
+    with _cache_lock:
+        entry = _readers.get(key)
+        if entry is None:
+            return None
+        _readers.move_to_end(key)
+        return entry[0]
+
+
+def get_ocr_reader(lang_list=None, use_gpu=None):
+    """
+    리더 반환 (캐시에 없으면 로드)
+    - 같은 설정의 리더가 이미 로드되어 있으면 즉시 반환
+    - 다른 스레드가 로드 중이면 끝날 때까지 기다렸다가 그 결과를 사용
+    """
+    key = reader_key(lang_list, use_gpu)
+    reader = get_cached_reader(*key)
+    if reader is not None:
+        return reader
+
+    with _load_lock:
+        reader = get_cached_reader(*key)
+        if reader is not None:
+            return reader
+
+        import easyocr
+        write_log(f"[🔍 OCR 리더 로드 시작] 언어: {list(key[0])}, GPU: {key[1]}")
+        start = time.perf_counter()
+        reader = easyocr.Reader(list(key[0]), gpu=key[1])
+        size = _estimate_reader_bytes(reader)
+        write_log(f"[✅ OCR 리더 로드 완료] {time.perf_counter() - start:.1f}초, 약 {size / 1024 / 1024:.0f}MB")
+
+        with _cache_lock:
+            _readers[key] = (reader, size)
+            _evict_over_budget()
+        return reader
+
+
+def preload_ocr_reader():
+    """현재 설정의 리더를 백그라운드에서 미리 로드 (첫 번역 시작 지연 제거)"""
+    def _preload():
+        try:
+            get_ocr_reader()
+        except Exception as e:
+            write_log(f"[⚠️ OCR 리더 미리 로드 실패]: {str(e)}", "WARNING")
+            write_log(traceback.format_exc(), "DEBUG")
+
+    thread = threading.Thread(target=_preload, name="ocr-reader-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_reader_cache():
+    with _cache_lock:
+        _readers.clear()
+
+
+def has_loaded_reader():
+    with _cache_lock:
+        return bool(_readers)
+
+
+def release_ocr_readers():
+    """캐시된 리더를 모두 해제하고 모델 메모리 반환 (해제한 리더 수)"""
+    with _load_lock, _cache_lock:
+        count = len(_readers)
+        _readers.clear()
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+    return count
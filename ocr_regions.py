@@ -0,0 +1,183 @@
+# ocr_regions.py - 여러 OCR 영역(이름표/대사창/선택지 등)을 각자의 주기로 감시
+import threading
+from collections import deque
+from config import get_setting
+from logger import write_log
+from text_settle import SettleDetector
+
+
+class OcrRegion:
+    """
+    이름이 붙은 OCR 영역 하나
+    - 영역마다 캡처 주기, 화면 변화 감지 지문, 텍스트 안정화 상태, 출력 슬롯을 따로 가짐
+    """
+
+    def __init__(self, name, box, interval=None):
+        self.name = name
+        self.box = tuple(int(v) for v in box)
+        self.interval = interval  # 지정하면 이 영역은 고정 주기, None이면 적응형 (끄면 OCR_INTERVAL)
+        self.next_due = 0.0
+        self.current_interval = self.poll_interval()
+        self.last_fingerprint = None
+        self.fingerprint_seq = 0  # last_fingerprint를 만든 프레임 번호 (변화 없는 캡처가 이 프레임을 확인)
+        self.settle = SettleDetector()
+        self.latest_seq = 0  # 번역 대기열에 마지막으로 넣은 텍스트의 프레임 번호
+        self.emitted_seq = -1  # 마지막으로 출력한 결과의 프레임 번호
+
+        # 글자 영역 추적: 최근 인식된 글자 상자들의 합집합 + 여백만 OCR
+        self.roi = None  # 영역 내부 좌표 (x1, y1, x2, y2), None이면 전체
+        self.text_boxes = deque(maxlen=get_setting("ROI_HISTORY", 5))
+        self.last_full_scan = 0.0
+        self.text_height = None  # 최근 인식된 글자 줄 높이 (전처리 축소 배율 계산용)
+
+    @property
+    def size(self):
+        """(높이, 너비)"""
+        return self.box[3] - self.box[1], self.box[2] - self.box[0]
+
+    def poll_interval(self):
+        return self.interval if self.interval is not None else get_setting("OCR_INTERVAL")
+
+    def schedule_next(self, captured_at, changed):
+        """
+        다음 캡처 시각 결정 (캡처 시작 시각 기준 → 처리에 걸린 시간만큼 대기 시간이 줄어듦)
+        - 화면이 바뀐 직후: MIN_OCR_INTERVAL로 빠르게 (다음 대사를 바로 잡기 위해)
+        - 변화가 없으면: IDLE_BACKOFF배씩 늘려 OCR_INTERVAL(설정 창의 OCR 주기)까지 느리게
+          → 정적인 화면에서도 변화를 알아채는 데 OCR_INTERVAL보다 오래 걸리지 않음
+        """
+        if self.interval is not None or not get_setting("USE_ADAPTIVE_INTERVAL", True):
+            self.current_interval = self.poll_interval()
+        else:
+            slowest = get_setting("OCR_INTERVAL")
+            fastest = min(slowest, get_setting("MIN_OCR_INTERVAL", 0.2))
+            if changed:
+                self.current_interval = fastest
+            else:
+                self.current_interval = self.current_interval * get_setting("IDLE_BACKOFF", 1.5)
+            self.current_interval = max(fastest, min(slowest, self.current_interval))
+        self.next_due = captured_at + self.current_interval
+
+    def roi_view(self, crop, now):
+        """
+        학습된 글자 영역만 잘라서 반환 → (이미지, (x, y) 오프셋, 전체 검사 여부)
+        학습 전이거나 ROI_RESCAN_INTERVAL이 지났으면 전체 영역 (다른 곳에 새로 나타난 글자 확인)
+        """
+        roi = self.roi
+        if (not get_setting("USE_ADAPTIVE_ROI", True) or roi is None
+                or now - self.last_full_scan >= get_setting("ROI_RESCAN_INTERVAL", 3.0)):
+            self.last_full_scan = now
+            return crop, (0, 0), True
+        x1, y1, x2, y2 = roi
+        return crop[y1:y2, x1:x2], (x1, y1), False
+
+    def learn_text_boxes(self, boxes, offset, full_scan):
+        """
+        인식 결과의 글자 상자(EasyOCR 네 꼭짓점, 잘라낸 이미지 기준 좌표)로 ROI 갱신
+        잘라낸 영역에서 글자가 사라지면 ROI를 버리고 다음 캡처는 전체 검사
+        """
+        if not boxes:
+            if not full_scan:
+                self.roi = None
+                self.text_boxes.clear()
+            return
+
+        ox, oy = offset
+        xs = [point[0] + ox for box in boxes for point in box]
+        ys = [point[1] + oy for box in boxes for point in box]
+        self.text_boxes.append((min(xs), min(ys), max(xs), max(ys)))
+        heights = sorted(max(p[1] for p in box) - min(p[1] for p in box) for box in boxes)
+        self.text_height = heights[len(heights) // 2]
+
+        margin = get_setting("ROI_MARGIN", 16)
+        height, width = self.size
+        self.roi = (
+            max(0, int(min(b[0] for b in self.text_boxes)) - margin),
+            max(0, int(min(b[1] for b in self.text_boxes)) - margin),
+            min(width, int(max(b[2] for b in self.text_boxes)) + margin),
+            min(height, int(max(b[3] for b in self.text_boxes)) + margin),
+        )
+
+
+def regions_signature():
+    """영역 설정이 바뀌었는지 비교하기 위한 값"""
+    return repr((get_setting("OCR_REGIONS"), get_setting("OCR_REGION")))
+
+
+def load_ocr_regions():
+    """
+    OCR_REGIONS 설정으로 영역 목록 생성
+    예: [{"name": "name", "region": [200, 760, 500, 800], "interval": 1.0},
+         {"name": "dialogue", "region": [200, 800, 1700, 1000]}]
+    비어 있으면 OCR_REGION 하나를 "main" 영역으로 사용
+    """
+    regions = []
+    for i, entry in enumerate(get_setting("OCR_REGIONS") or []):
+        box = entry.get("region")
+        if not box or len(box) != 4 or box[2] <= box[0] or box[3] <= box[1]:
+            write_log(f"[⚠️ 잘못된 OCR 영역 설정 무시]: {entry}", "WARNING")
+            continue
+        regions.append(OcrRegion(entry.get("name") or f"region{i + 1}", box, entry.get("interval")))
+
+    if not regions and get_setting("OCR_REGION"):
+        regions.append(OcrRegion("main", get_setting("OCR_REGION")))
+    return regions
+
+
+def union_box(regions):
+    """모든 영역을 덮는 최소 사각형 (한 번의 캡처로 모든 영역을 가져옴)"""
+    return (
+        min(r.box[0] for r in regions),
+        min(r.box[1] for r in regions),
+        max(r.box[2] for r in regions),
+        max(r.box[3] for r in regions),
+    )
+
+
+def crop_region(frame, union, box):
+    """union 영역을 캡처한 프레임에서 box 부분만 잘라냄 (복사 없는 view)"""
+    x1, y1, x2, y2 = box
+    return frame[y1 - union[1]:y2 - union[1], x1 - union[0]:x2 - union[0]]
+
+
+def compose_outputs(regions, outputs):
+    """영역별 최신 결과를 설정 순서대로 합쳐 하나의 오버레이 텍스트로"""
+    return "\n".join(outputs[r.name] for r in regions if outputs.get(r.name))
+
+
+class LatestSlots:
+    """
+    영역 이름별 단일 슬롯 (파이프라인 단계 사이)
+    - 같은 영역의 처리되지 않은 이전 작업은 새 작업으로 덮어씀
+    - 다른 영역의 작업은 서로 밀어내지 않음
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._items = {}
+
+    def put(self, key, item):
+        """새 작업을 넣음. 덮어쓴 이전 작업이 있으면 True"""
+        return self.put_many([(key, item)]) > 0
+
+    def put_many(self, pairs):
+        """여러 작업을 한 번에 넣음 (받는 쪽이 한 묶음으로 꺼내도록). 덮어쓴 작업 수 반환"""
+        with self._cond:
+            replaced = 0
+            for key, item in pairs:
+                replaced += key in self._items
+                self._items[key] = item
+            self._cond.notify()
+            return replaced
+
+    def take_all(self, timeout):
+        """대기 중인 모든 작업을 꺼냄 (timeout 동안 없으면 빈 목록)"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            items = list(self._items.values())
+            self._items.clear()
+            return items
+
+    def clear(self):
+        with self._cond:
+            self._items.clear()
@@ -1,8 +1,28 @@
 # overlay.py
 import tkinter as tk
 from config import get_setting
+from overlay_mailbox import overlay_mailbox
 
 _overlay_root = None
+_drain_after_id = None
+
+OVERLAY_REFRESH_MS = 50  # Tk 스레드가 우편함을 확인하는 간격
+
+
+def _drain_mailbox():
+    """Tk 스레드에서만 실행: 가장 최근 텍스트 하나만 그림"""
+    global _drain_after_id
+    pending = overlay_mailbox.take()
+    if pending is not None:
+        label, text = pending
+        try:
+            # 같은 텍스트면 다시 배치하지 않음
+            if label.winfo_exists() and label.cget("text") != text:
+                label.config(text=text)
+        except tk.TclError:
+            pass
+    if _overlay_root:
+        _drain_after_id = _overlay_root.after(OVERLAY_REFRESH_MS, _drain_mailbox)
 
 
 def create_overlay_window():
@@ -26,6 +46,8 @@ def create_overlay_window():
         anchor="nw"
     )
     label.pack(fill="both", expand=True)
+    overlay_mailbox.clear()
+    _drain_mailbox()
     return label
 
 
@@ -42,7 +64,10 @@ def update_overlay_position():
         x, y = get_setting("OUTPUT_POSITION")
         _overlay_root.geometry(f"800x120+{x}+{y}")
 def destroy_overlay():
-    global _overlay_root
+    global _overlay_root, _drain_after_id
     if _overlay_root:
+        if _drain_after_id:
+            _overlay_root.after_cancel(_drain_after_id)
+            _drain_after_id = None
         _overlay_root.destroy()
         _overlay_root = None
\ No newline at end of file
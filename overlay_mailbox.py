@@ -0,0 +1,33 @@
+# overlay_mailbox.py - 워커 스레드 → Tk 스레드 오버레이 텍스트 전달 (최신 값 하나만 보관)
+import threading
+from metrics import increment
+
+
+class TextMailbox:
+    """
+    단일 슬롯 우편함
+    - post(): 아무 스레드에서나 호출, 아직 그리지 않은 이전 텍스트는 덮어씀
+    - take(): Tk 스레드가 after()로 주기적으로 꺼내 감 (없으면 None)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = None
+
+    def post(self, label, text):
+        with self._lock:
+            if self._pending is not None:
+                increment("overlay_coalesced")
+            self._pending = (label, text)
+
+    def take(self):
+        with self._lock:
+            pending, self._pending = self._pending, None
+            return pending
+
+    def clear(self):
+        with self._lock:
+            self._pending = None
+
+
+overlay_mailbox = TextMailbox()
@@ -1,7 +1,8 @@
 # overlay_webserver.py (번역 문제 해결)
-from flask import Flask, render_template, render_template_string, request, jsonify
+from flask import Flask, Response, render_template, render_template_string, request, jsonify
 from flask_socketio import SocketIO, emit
 from config import get_setting
+from metrics import snapshot, prometheus_text
 import json
 import os
 import sys
@@ -38,6 +39,34 @@ socketio = SocketIO(app, cors_allowed_origins="*", logger=False, engineio_logger
 # 텍스트 상태 저장
 default_text = "(번역 없음)"
 latest_text = default_text
+latest_region_texts = {}  # 영역 이름 → 최신 텍스트 (OCR 영역이 여러 개일 때)
+
+# 같은 프로세스(OCR 스레드)에서 직접 브라우저로 브로드캐스트
+# - 루프백 WebSocket 클라이언트 연결 없이 서버 객체로 바로 전송
+def publish_text(text):
+    global latest_text
+    latest_text = text if text else default_text
+    socketio.emit("overlay_text", latest_text)
+
+def publish_region_text(region, text):
+    """영역별 텍스트 (브라우저 소스에서 영역마다 따로 배치할 때 사용)"""
+    latest_region_texts[region] = text
+    socketio.emit("region_text", {"region": region, "text": text})
+
+def publish_overlay_mode(mode):
+    global latest_text
+    if mode == 'transparent':
+        # 투명 모드: 텍스트는 보내지 않고 모드만 전환
+        latest_text = default_text
+        latest_region_texts.clear()
+        print("[🔍 오버레이 투명 모드 설정 - 서버 측 처리]")
+        socketio.emit("set_overlay_mode", mode)
+    else:
+        print("[🔍 오버레이 일반 모드 설정 - 서버 측 처리]")
+        # 모드를 먼저 보내고, 최신 텍스트가 있으면 다시 보냄
+        socketio.emit("set_overlay_mode", mode)
+        if latest_text and latest_text != default_text:
+            socketio.emit("overlay_text", latest_text)
 
 # overlay_webserver.py의 run_flask_server 함수 수정
 def run_flask_server():
@@ -121,6 +150,8 @@ def handle_connect():
     print("[🌐 WebSocket 연결됨]")
     # 연결 즉시 최신 텍스트 전송
     emit("overlay_text", latest_text)
+    for region, text in latest_region_texts.items():
+        emit("region_text", {"region": region, "text": text})
 
 @socketio.on("disconnect")
 def handle_disconnect():
@@ -132,42 +163,22 @@ def handle_get_latest_text():
     print("[📤 최신 텍스트 요청됨]")
     emit("overlay_text", latest_text)
 
-# push_text 이벤트 핸들러
+# push_text 이벤트 핸들러 (원격 OCR 클라이언트용)
 @socketio.on("push_text")
 def handle_push(data):
-    global latest_text
-    # 기본 텍스트를 명시적으로 처리
-    latest_text = data if data else default_text
-    print(f"[✅ push_text 수신]: {latest_text}")
-    
+    print(f"[✅ push_text 수신]: {data}")
     # 모든 클라이언트에 브로드캐스트
-    emit("overlay_text", latest_text, broadcast=True)
+    publish_text(data)
+
+@socketio.on("push_region_text")
+def handle_push_region(data):
+    publish_region_text(data.get("region"), data.get("text", ""))
 
 @socketio.on("set_overlay_mode")
 def handle_set_overlay_mode(mode):
-    global latest_text
-    
     # 디버그 로깅 추가
     print(f"[🔍 set_overlay_mode 이벤트 수신] 모드: {mode}")
-    
-    if mode == 'transparent':
-        # 투명 모드로 설정
-        latest_text = default_text
-        print("[🔍 오버레이 투명 모드 설정 - 서버 측 처리]")
-        
-        # 먼저 모드를 설정하고, 텍스트는 설정하지 않음
-        # 클라이언트는 투명 모드 이벤트만으로 처리 가능
-        emit("set_overlay_mode", mode, broadcast=True)
-    else:
-        # 일반 모드로 설정
-        print("[🔍 오버레이 일반 모드 설정 - 서버 측 처리]")
-        
-        # 모드를 먼저 보내고, 최신 텍스트를 다시 보냄
-        emit("set_overlay_mode", mode, broadcast=True)
-        
-        # 최신 텍스트가 있는 경우 다시 보냄 (일반 모드에서만)
-        if latest_text and latest_text != default_text:
-            emit("overlay_text", latest_text, broadcast=True)
+    publish_overlay_mode(mode)
 @app.route('/shutdown')
 def shutdown():
     func = request.environ.get('werkzeug.server.shutdown')
@@ -190,5 +201,12 @@ def status():
         }
     })
 
+# 단계별 지연 시간/횟수 (기본: Prometheus 텍스트, ?format=json: JSON)
+@app.route('/metrics')
+def metrics():
+    if request.args.get("format") == "json":
+        return jsonify(snapshot())
+    return Response(prometheus_text(), mimetype="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     socketio.run(app, port=5000, debug=True)
\ No newline at end of file
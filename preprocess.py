@@ -0,0 +1,116 @@
+# preprocess.py - OCR 전 이미지 전처리 (회색조, 대비 늘이기/이진화, 축소) - NumPy 벡터 연산
+import numpy as np
+from config import get_setting
+
+PREPROCESS_MODES = ("off", "gray", "stretch", "binary")
+
+# 회색조 변환 가중치 (ITU-R BT.601, 합이 256인 정수 → 나눗셈 대신 시프트), 채널 순서별
+_LUMA_WEIGHTS = {"RGB": (77, 150, 29), "BGR": (29, 150, 77)}
+_LEVELS = np.arange(256, dtype=np.float32)
+
+
+def to_grayscale(image, channel_order="RGB"):
+    """
+    (H, W, 3) → (H, W) uint8. 결과는 새 배열이라 캡처 버퍼 복사를 겸함
+    channel_order: 입력의 채널 순서 (캡처 백엔드의 channel_order, GDI/mss는 "BGR")
+    """
+    if image.ndim == 2:
+        return np.array(image, dtype=np.uint8, copy=True)
+    weights = _LUMA_WEIGHTS[channel_order]
+    acc = image[..., 0].astype(np.uint16)
+    acc *= weights[0]
+    acc += image[..., 1] * np.uint16(weights[1])
+    acc += image[..., 2] * np.uint16(weights[2])
+    acc >>= 8
+    return acc.astype(np.uint8)
+
+
+def _cumulative_histogram(gray):
+    return np.cumsum(np.bincount(gray.ravel(), minlength=256))
+
+
+def stretch_contrast(gray, clip_percent=1.0):
+    """
+    밝기 분포의 하위/상위 clip_percent%를 0/255로 늘림 (제자리 변환)
+    반투명 대사창처럼 글자와 배경의 밝기 차이가 작은 화면용
+    """
+    cdf = _cumulative_histogram(gray)
+    total = cdf[-1]
+    low = int(np.searchsorted(cdf, total * clip_percent / 100))
+    high = int(np.searchsorted(cdf, total * (100 - clip_percent) / 100))
+    if high <= low:
+        return gray
+    lut = np.clip((_LEVELS - low) * (255.0 / (high - low)), 0, 255).astype(np.uint8)
+    np.take(lut, gray, out=gray)
+    return gray
+
+
+def binarize(gray):
+    """Otsu 임계값으로 흑백 이진화 (제자리 변환)"""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    mean_sum = np.cumsum(hist * _LEVELS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_bg = mean_sum / weight_bg
+        mean_fg = (mean_sum[-1] - mean_sum) / weight_fg
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    threshold = int(np.nanargmax(between))
+    lut = np.where(_LEVELS > threshold, 255, 0).astype(np.uint8)
+    np.take(lut, gray, out=gray)
+    return gray
+
+
+def downscale(gray, scale):
+    """
+    scale(0~1) 배율로 축소
+    정수 배율 부분은 블록 평균(글자 획 보존), 나머지는 가장 가까운 픽셀 선택
+    """
+    if scale >= 1.0:
+        return gray
+    factor = int(1 / scale)
+    if factor >= 2:
+        h = gray.shape[0] // factor * factor
+        w = gray.shape[1] // factor * factor
+        gray = gray[:h, :w].reshape(h // factor, factor, w // factor, factor).mean(axis=(1, 3)).astype(np.uint8)
+        scale *= factor
+    if scale < 0.99:
+        rows = (np.arange(max(1, int(gray.shape[0] * scale))) / scale).astype(np.intp)
+        cols = (np.arange(max(1, int(gray.shape[1] * scale))) / scale).astype(np.intp)
+        gray = gray[rows[:, None], cols]
+    return gray
+
+
+def choose_scale(text_height=None):
+    """
+    축소 배율 결정
+    - PREPROCESS_SCALE: 고정 배율 (calibrate.py로 측정)
+    - OCR_TARGET_TEXT_HEIGHT: 지정 시 최근 글자 높이가 이 값이 되도록 자동 축소 (확대는 하지 않음)
+    """
+    scale = get_setting("PREPROCESS_SCALE", 1.0) or 1.0
+    target = get_setting("OCR_TARGET_TEXT_HEIGHT")
+    if target and text_height:
+        scale = min(scale, target / text_height)
+    return max(0.1, min(1.0, scale))
+
+
+def preprocess_image(image, mode=None, scale=1.0, channel_order="RGB"):
+    """
+    전처리 결과와 실제 적용된 배율 반환 (mode="off"면 원본 그대로)
+    결과 좌표를 원본 좌표로 되돌릴 때는 1 / 배율을 곱함
+    channel_order: 입력의 채널 순서 (캡처 백엔드의 channel_order)
+    """
+    mode = mode or get_setting("PREPROCESS_MODE", "gray")
+    if mode == "off" and scale >= 1.0:
+        return image, 1.0
+
+    # "off"라도 축소할 때는 채널별로 처리하지 않도록 회색조로 변환
+    gray = to_grayscale(image, channel_order)
+    if mode == "stretch":
+        stretch_contrast(gray)
+    elif mode == "binary":
+        binarize(gray)
+
+    original_height = gray.shape[0]
+    gray = downscale(gray, scale)
+    return gray, gray.shape[0] / original_height
@@ -0,0 +1,116 @@
+# recognition_cache.py - 글자 줄 이미지 해시 → 인식 결과 캐시 (검출은 매번, 인식은 새 줄만)
+import hashlib
+import threading
+from collections import OrderedDict
+from config import get_setting
+from metrics import increment
+
+# (언어 목록, 줄 이미지 해시) → (텍스트, 신뢰도), 최근 사용 순서
+_lines = OrderedDict()
+_lock = threading.Lock()
+
+
+def supports_cache(reader):
+    """검출/인식을 따로 호출할 수 있는 EasyOCR 리더인지"""
+    return hasattr(reader, "detect") and hasattr(reader, "recognize")
+
+
+def _line_key(reader, grey, x1, x2, y1, y2):
+    crop = grey[max(0, y1):max(0, y2), max(0, x1):max(0, x2)]
+    digest = hashlib.blake2b(crop.tobytes(), digest_size=16).digest()
+    return tuple(getattr(reader, "lang_list", ())), crop.shape, digest
+
+
+def _box_points(box):
+    """recognize() 결과와 맞춰 보기 위한 꼭짓점 좌표 키"""
+    return tuple((int(round(x)), int(round(y))) for x, y in box)
+
+
+def _get(key):
+    with _lock:
+        entry = _lines.get(key)
+        if entry is not None:
+            _lines.move_to_end(key)
+        return entry
+
+
+def _put(key, entry):
+    with _lock:
+        _lines[key] = entry
+        _lines.move_to_end(key)
+        while len(_lines) > get_setting("RECOGNITION_CACHE_SIZE", 2000):
+            _lines.popitem(last=False)
+
+
+def clear_recognition_cache():
+    with _lock:
+        _lines.clear()
+
+
+def _recognize_image(reader, grey, horizontal, free):
+    """이미지 한 장의 검출 결과 중 캐시에 없는 줄만 인식하여 (상자, 텍스트, 신뢰도) 목록 반환"""
+    results = []
+    missing = {}  # 꼭짓점 키 → [(결과 위치, 캐시 키), ...] (같은 상자가 두 번 검출되어도 둘 다 채움)
+    missing_horizontal, missing_free = [], []
+
+    height, width = grey.shape[:2]
+    for x_min, x_max, y_min, y_max in horizontal:
+        # recognize()와 같은 방식으로 이미지 경계 안으로 제한
+        x1, x2 = max(0, int(x_min)), min(int(x_max), width)
+        y1, y2 = max(0, int(y_min)), min(int(y_max), height)
+        box = [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+        key = _line_key(reader, grey, x1, x2, y1, y2)
+        entry = _get(key)
+        results.append((box, *entry) if entry else None)
+        if entry is None:
+            missing.setdefault(_box_points(box), []).append((len(results) - 1, key))
+            missing_horizontal.append([x1, x2, y1, y2])
+
+    for polygon in free:
+        xs = [int(x) for x, _ in polygon]
+        ys = [int(y) for _, y in polygon]
+        key = _line_key(reader, grey, min(xs), max(xs), min(ys), max(ys))
+        entry = _get(key)
+        results.append((polygon, *entry) if entry else None)
+        if entry is None:
+            missing.setdefault(_box_points(polygon), []).append((len(results) - 1, key))
+            missing_free.append(polygon)
+
+    missed = len(missing_horizontal) + len(missing_free)
+    increment("recognition_cache_hits", len(results) - missed)
+    if missed:
+        increment("recognition_cache_misses", missed)
+        recognized = reader.recognize(
+            grey, horizontal_list=missing_horizontal, free_list=missing_free, detail=1, reformat=False
+        )
+        for box, text, confidence in recognized:
+            waiting = missing.get(_box_points(box))
+            if not waiting:
+                continue
+            index, key = waiting.pop(0)
+            results[index] = (box, text, confidence)
+            _put(key, (text, confidence))
+
+    return [result for result in results if result is not None]
+
+
+def readtext_cached(reader, images):
+    """
+    readtext(detail=1)과 같은 형식의 결과를 이미지마다 반환
+    - 검출(CRAFT)은 이미지 전체에 대해 매번 실행 (여러 장이면 한 번에)
+    - 검출된 줄 이미지가 이전에 본 것과 픽셀 단위로 같으면 인식 결과 재사용
+    images: 같은 크기의 이미지 목록 (여러 장이면 호출 측에서 크기를 맞춤)
+    """
+    from easyocr.utils import reformat_input
+
+    converted = [reformat_input(image) for image in images]
+    if len(converted) == 1:
+        horizontal, free = reader.detect(converted[0][0], reformat=False)
+    else:
+        import numpy as np
+        horizontal, free = reader.detect(np.array([img for img, _ in converted]), reformat=False)
+
+    return [
+        _recognize_image(reader, grey, horizontal[i], free[i])
+        for i, (_, grey) in enumerate(converted)
+    ]
@@ -119,6 +119,7 @@ def open_settings_window(overlay_label, hotkey_callback=None, restart_ocr=None):
     tk.Checkbutton(frame, text="GPU 사용 (속도 향상)", variable=gpu_var).grid(row=6, column=0, columnspan=2, pady=4)
 
     # OCR 주기 설정
+    # 적응형 주기(USE_ADAPTIVE_INTERVAL)에서는 가장 느린 주기: 화면이 바뀐 직후 MIN_OCR_INTERVAL로 빨라졌다가 변화가 없으면 이 주기까지 느려짐
     tk.Label(frame, text="OCR 주기 (초)").grid(row=7, column=0, sticky="e", pady=4)
     interval_spin = tk.Spinbox(frame, from_=0.1, to=10.0, increment=0.1, format="%.1f")
     interval_spin.delete(0, "end")
@@ -289,7 +290,7 @@ def open_settings_window(overlay_label, hotkey_callback=None, restart_ocr=None):
             if lang_changed:
                 try:
                     from ocr import reinit_ocr_reader
-                    reinit_ocr_reader()
+                    reinit_ocr_reader(background=True)
                     
                     # 변경 사항 로그
                     if old_auto_detect != auto_detect_var.get():
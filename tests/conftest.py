@@ -0,0 +1,26 @@
+# tests/conftest.py - 공통 설정 (프로젝트 루트 모듈 import, 설정/로그/지표 격리)
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+import metrics  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path):
+    """테스트마다 설정을 원래대로 되돌리고, 로그는 오류만, 번역 캐시는 임시 폴더에"""
+    saved = dict(config.settings)
+    config.settings.update({
+        "LOG_LEVEL": "ERROR",
+        "LOG_TO_CONSOLE": False,
+        "TRANSLATION_CACHE_PATH": str(tmp_path / "translation_cache.db"),
+    })
+    metrics.reset_metrics()
+    yield config.settings
+    config.settings.clear()
+    config.settings.update(saved)
+    metrics.reset_metrics()
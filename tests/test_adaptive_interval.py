@@ -0,0 +1,60 @@
+# tests/test_adaptive_interval.py - 영역별 적응형 캡처 주기
+import pytest
+
+import config
+from ocr_regions import OcrRegion
+
+
+@pytest.fixture
+def adaptive():
+    config.settings.update({"USE_ADAPTIVE_INTERVAL": True, "OCR_INTERVAL": 1.0,
+                            "MIN_OCR_INTERVAL": 0.2, "IDLE_BACKOFF": 2.0})
+    return OcrRegion("main", (0, 0, 100, 50))
+
+
+def test_change_polls_faster_than_base_interval(adaptive):
+    adaptive.schedule_next(1.0, changed=True)
+
+    assert adaptive.current_interval == 0.2
+    assert adaptive.current_interval < config.settings["OCR_INTERVAL"]
+    assert adaptive.next_due == pytest.approx(1.2)
+
+
+def test_idle_backs_off_up_to_ocr_interval(adaptive):
+    adaptive.schedule_next(0.0, changed=True)
+    intervals = []
+    for _ in range(4):
+        adaptive.schedule_next(10.0, changed=False)
+        intervals.append(adaptive.current_interval)
+
+    assert intervals == [0.4, 0.8, 1.0, 1.0]
+    assert adaptive.next_due == 11.0
+
+
+def test_change_after_idle_returns_to_fast_interval(adaptive):
+    for _ in range(5):
+        adaptive.schedule_next(0.0, changed=False)
+    assert adaptive.current_interval == 1.0
+
+    adaptive.schedule_next(5.0, changed=True)
+    assert adaptive.current_interval == 0.2
+
+
+def test_ocr_interval_below_min_is_respected(adaptive):
+    # 설정 창에서 OCR 주기를 MIN_OCR_INTERVAL보다 짧게 잡으면 변화가 없어도 그 주기로
+    config.settings["OCR_INTERVAL"] = 0.1
+
+    adaptive.schedule_next(0.0, changed=True)
+    assert adaptive.current_interval == 0.1
+    adaptive.schedule_next(0.1, changed=False)
+    assert adaptive.current_interval == 0.1
+
+
+def test_fixed_region_interval_and_adaptive_off(adaptive):
+    fixed = OcrRegion("name", (0, 0, 10, 10), interval=2.0)
+    fixed.schedule_next(0.0, changed=True)
+    assert fixed.current_interval == 2.0
+
+    config.settings["USE_ADAPTIVE_INTERVAL"] = False
+    adaptive.schedule_next(0.0, changed=True)
+    assert adaptive.current_interval == 1.0
@@ -0,0 +1,153 @@
+# tests/test_circuit_breaker.py - 엔진별 회로 차단기와 응답 상태 분류
+import pytest
+import requests
+
+import config
+import translator_client
+from translator_client import CircuitBreaker, EngineClient
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """translator_client의 time.time()을 직접 움직이는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(translator_client.time, "time", lambda: now[0])
+    config.settings.update({"BREAKER_FAILURE_THRESHOLD": 3, "BREAKER_COOLDOWN": 30.0})
+    return now
+
+
+def _open_breaker():
+    breaker = CircuitBreaker("test")
+    breaker.trip()
+    return breaker
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("test")
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert not breaker.available()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test")
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_exactly_one_trial(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+
+    assert breaker.allow()
+    assert breaker.state == "half-open"
+    assert not breaker.allow()
+
+
+def test_trial_result_closes_or_reopens(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+    breaker.trip()
+    clock[0] += 30.0
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_available_does_not_spend_the_trial(clock):
+    breaker = _open_breaker()
+    assert not breaker.available()
+
+    clock[0] += 30.0
+    assert breaker.available()
+    assert breaker.available()
+    assert breaker.state == "open"
+    assert breaker.allow()
+
+
+def test_release_returns_unused_trial(clock):
+    breaker = _open_breaker()
+    clock[0] += 30.0
+    breaker.allow()
+
+    breaker.release()
+
+    assert breaker.state == "open"
+    assert breaker.allow()
+
+
+def test_release_does_nothing_when_closed(clock):
+    breaker = CircuitBreaker("test")
+    breaker.release()
+
+    assert breaker.state == "closed"
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _Session:
+    def __init__(self, result):
+        self.result = result
+        self.kwargs = None
+
+    def post(self, url, **kwargs):
+        self.kwargs = kwargs
+        if isinstance(self.result, Exception):
+            raise self.result
+        return _Response(self.result)
+
+
+@pytest.fixture
+def client(clock):
+    client = EngineClient("test-engine", "Test", "missing-key.txt", lambda: "key")
+    yield client
+    translator_client.engine_clients.pop("test-engine", None)
+
+
+@pytest.mark.parametrize("status, failures, state", [
+    (200, 0, "closed"),
+    (400, 0, "closed"),
+    (401, 1, "closed"),
+    (456, 1, "closed"),
+    (503, 1, "closed"),
+    (429, 1, "open"),
+])
+def test_post_records_status(client, status, failures, state):
+    client.session = _Session(status)
+
+    assert client.post("http://engine.invalid").status_code == status
+    assert (client.breaker.failures, client.breaker.state) == (failures, state)
+
+
+def test_post_records_network_error_and_reraises(client):
+    client.session = _Session(requests.exceptions.ConnectTimeout("timeout"))
+
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        client.post("http://engine.invalid")
+    assert client.breaker.failures == 1
+
+
+def test_post_uses_engine_timeout(client):
+    config.settings["ENGINE_TIMEOUTS"] = {"test-engine": (1.0, 2.0)}
+    client.session = _Session(200)
+
+    client.post("http://engine.invalid")
+
+    assert client.session.kwargs["timeout"] == (1.0, 2.0)
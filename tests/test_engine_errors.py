@@ -0,0 +1,61 @@
+# tests/test_engine_errors.py - 엔진 요청 실패가 번역 결과로 취급되지 않는지 (캐시/대체 엔진 판단)
+import pytest
+import requests
+
+import config
+import translation_cache
+import translator
+import translator_deepl
+import translator_dispatch as dispatch
+import translator_libre
+import translator_nhn
+from translation_cache import get_cached_translation, is_error_result
+
+ENGINES = {
+    "papago-nhn": (translator_nhn.nhn_client, ("access", "secret")),
+    "deepl": (translator_deepl.deepl_client, "key:fx"),
+    "libretranslate": (translator_libre.libre_client, ("http://libre.invalid/translate", "")),
+    "gpt": (translator.gpt_client, "sk-test"),
+}
+
+
+class _RaisingSession:
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(translation_cache, "_conn", None)
+    monkeypatch.setattr(translation_cache, "_memory", type(translation_cache._memory)())
+    config.settings.update({"USE_TRANSLATION_CACHE": True, "USE_ENGINE_FAILOVER": False,
+                            "USE_HEDGED_REQUESTS": False, "AUTO_DETECT_LANG": False,
+                            "SOURCE_LANG": "en", "TARGET_LANG": "ko"})
+    yield
+    if translation_cache._conn is not None:
+        translation_cache._conn.close()
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ReadTimeout("read timed out"),
+    requests.exceptions.ConnectionError("connection refused"),
+])
+def test_network_error_is_marked_and_not_cached(monkeypatch, engine, error):
+    client, credentials = ENGINES[engine]
+    session = _RaisingSession(error)
+    monkeypatch.setattr(client, "credentials", lambda: credentials)
+    monkeypatch.setattr(client, "session", session)
+    monkeypatch.setattr(client, "breaker", type(client.breaker)(client.name))
+    config.settings["ENGINE"] = engine
+
+    result = dispatch.translate_text("Hello there")
+
+    assert session.calls == 1
+    assert is_error_result(result)
+    assert get_cached_translation(engine, "en", "ko", "Hello there") is None
@@ -0,0 +1,54 @@
+# tests/test_frame_gate.py - 화면 변화 감지 지문
+import numpy as np
+
+import config
+
+from frame_gate import fingerprint_diff, frame_changed, make_fingerprint
+
+
+def _frame(value=0, shape=(64, 256, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_fingerprint_has_grid_shape():
+    assert make_fingerprint(_frame(), grid=(64, 16)).shape == (16, 64)
+    assert make_fingerprint(_frame(shape=(64, 256)), grid=(8, 4)).shape == (4, 8)
+
+
+def test_grid_is_clamped_to_frame_size():
+    assert make_fingerprint(_frame(shape=(5, 10, 3)), grid=(64, 16)).shape == (5, 10)
+
+
+def test_fingerprint_is_block_mean_brightness():
+    frame = _frame()
+    frame[:, :128] = 200
+
+    fingerprint = make_fingerprint(frame, grid=(2, 1))
+
+    assert fingerprint.tolist() == [[200.0, 0.0]]
+
+
+def test_single_pixel_noise_is_below_threshold():
+    # 대사창 크기 캡처: 칸 하나가 12x50 픽셀이라 한 픽셀 변화는 평균에 거의 반영되지 않음
+    prev = _frame(100, shape=(200, 800, 3))
+    curr = prev.copy()
+    curr[10, 10] = 255
+    threshold = config.settings["FRAME_DIFF_THRESHOLD"]
+
+    assert not frame_changed(make_fingerprint(prev), make_fingerprint(curr), threshold)
+
+
+def test_new_text_block_is_a_change():
+    prev = _frame(30, shape=(200, 800, 3))
+    curr = prev.copy()
+    curr[80:100, 100:300] = 240
+    threshold = config.settings["FRAME_DIFF_THRESHOLD"]
+
+    assert frame_changed(make_fingerprint(prev), make_fingerprint(curr), threshold)
+
+
+def test_missing_or_resized_fingerprint_always_changes():
+    fingerprint = make_fingerprint(_frame())
+
+    assert fingerprint_diff(None, fingerprint) == float("inf")
+    assert frame_changed(fingerprint, make_fingerprint(_frame(), grid=(8, 4)), threshold=1000)
@@ -0,0 +1,106 @@
+# tests/test_gpt_streaming.py - GPT 스트리밍 응답(SSE) 처리 (mock_gpt_server로 실제 HTTP 왕복)
+import pytest
+
+import config
+import metrics
+import translator
+from mock_gpt_server import MockGptServer, chunk_events, sse_event
+from translation_cache import is_error_result
+
+
+@pytest.fixture
+def gpt(monkeypatch):
+    """가짜 서버를 띄우고 GPT_API_URL을 그쪽으로 돌림"""
+    monkeypatch.setattr(translator.gpt_client, "credentials", lambda: "sk-test")
+    servers = []
+
+    def start(chunks, **kwargs):
+        server = MockGptServer(chunks, **kwargs).start()
+        servers.append(server)
+        config.settings["GPT_API_URL"] = server.url
+        config.settings["GPT_STREAMING"] = True
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_partials_are_cumulative_and_final_is_joined(gpt):
+    chunks = ["안녕", "하세요", ", 여러분", "!"]
+    server = gpt(chunks, usage=12)
+    partials = []
+
+    result = translator.gpt_translate("Hello, everyone!", "en", on_partial=partials.append)
+
+    assert partials == ["안녕", "안녕하세요", "안녕하세요, 여러분", "안녕하세요, 여러분!"]
+    assert result == "안녕하세요, 여러분!"
+    assert not is_error_result(result)
+    assert server.requests[0]["stream"] is True
+    assert metrics.snapshot()["stages"]["engine.gpt.first_chunk"]["count"] == 1
+
+
+def test_usage_from_last_chunk_is_counted(gpt, monkeypatch):
+    monkeypatch.setattr(config, "TOKEN_USAGE", 0)
+    gpt(["하나"], usage=42)
+
+    translator.gpt_translate("one", "en", on_partial=lambda text: None)
+
+    assert config.TOKEN_USAGE == 42
+
+
+def test_events_after_done_are_ignored(gpt):
+    events = chunk_events(["끝"]) + [sse_event({"choices": [{"delta": {"content": " 이후"}}]})]
+    partials = []
+    gpt(["끝"], events=events)
+
+    result = translator.gpt_translate("end", "en", on_partial=partials.append)
+
+    assert result == "끝"
+    assert partials == ["끝"]
+
+
+def test_malformed_and_non_data_lines_are_skipped(gpt):
+    events = [
+        ": keep-alive\n\n",
+        sse_event({"choices": [{"delta": {"content": "첫"}}]}),
+        "data: {not json\n\n",
+        "event: ping\n\n",
+        sse_event({"choices": [{"delta": {}}]}),
+        sse_event({"choices": [{"delta": {"content": " 문장"}}]}),
+        sse_event("[DONE]"),
+    ]
+    partials = []
+    gpt(["첫", " 문장"], events=events)
+
+    result = translator.gpt_translate("first sentence", "en", on_partial=partials.append)
+
+    assert result == "첫 문장"
+    assert partials == ["첫", "첫 문장"]
+
+
+def test_event_split_across_writes_is_reassembled(gpt):
+    event = sse_event({"choices": [{"delta": {"content": "나뉜 줄"}}]})
+    middle = len(event) // 2
+    gpt(["나뉜 줄"], events=[event[:middle], event[middle:], sse_event("[DONE]")], delay=0.05)
+
+    assert translator.gpt_translate("split line", "en", on_partial=lambda text: None) == "나뉜 줄"
+
+
+def test_without_on_partial_request_is_not_streamed(gpt):
+    server = gpt(["전체", " 응답"], usage=5)
+
+    result = translator.gpt_translate("whole reply", "en")
+
+    assert result == "전체 응답"
+    assert "stream" not in server.requests[0]
+
+
+def test_streaming_disabled_in_settings(gpt):
+    server = gpt(["꺼짐"])
+    config.settings["GPT_STREAMING"] = False
+    partials = []
+
+    assert translator.gpt_translate("off", "en", on_partial=partials.append) == "꺼짐"
+    assert partials == []
+    assert "stream" not in server.requests[0]
@@ -0,0 +1,140 @@
+# tests/test_hedged_requests.py - 주 엔진이 늦을 때 보조 엔진에 보내는 헤지 요청
+import threading
+
+import pytest
+
+import config
+import metrics
+import translator_client
+import translator_dispatch as dispatch
+from translator_client import EngineClient
+from translation_cache import is_error_result
+
+
+class FakeEngine:
+    def __init__(self, reply, delay=0.0, error=None):
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.finished = threading.Event()
+
+    def __call__(self, text, source_lang=None):
+        self.calls += 1
+        if self.delay:
+            threading.Event().wait(self.delay)
+        self.finished.set()
+        if self.error:
+            raise self.error
+        return self.reply
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    config.settings.update({
+        "ENGINE": "primary", "USE_HEDGED_REQUESTS": True, "HEDGE_ENGINE": "backup",
+        "HEDGE_PERCENTILE": 0.95, "HEDGE_MIN_SAMPLES": 5, "HEDGE_MIN_DELAY": 0.05,
+        "USE_TRANSLATION_CACHE": False, "AUTO_DETECT_LANG": False,
+        "SOURCE_LANG": "en", "TARGET_LANG": "ko", "BREAKER_COOLDOWN": 0.0,
+    })
+    for _ in range(5):
+        metrics.record_latency("engine.primary", 0.01)
+    backup_client = EngineClient("backup", "Backup", "missing-key.txt", lambda: "key")
+
+    def setup(primary_delay, primary_error=None, backup_delay=0.0, backup_error=None):
+        primary = FakeEngine("주 엔진 번역", primary_delay, primary_error)
+        backup = FakeEngine("보조 엔진 번역", backup_delay, backup_error)
+        monkeypatch.setitem(dispatch.ENGINE_FUNCTIONS, "primary", primary)
+        monkeypatch.setitem(dispatch.ENGINE_FUNCTIONS, "backup", backup)
+        return primary, backup, backup_client.breaker
+
+    yield setup
+    translator_client.engine_clients.pop("backup", None)
+
+
+def test_fast_primary_does_not_spend_backup_trial(engines):
+    primary, backup, breaker = engines(primary_delay=0.0)
+    breaker.trip()  # 대기 시간 0 → 다음 allow()가 half-open 시험 요청
+
+    assert dispatch.translate_text("Hello") == "주 엔진 번역"
+    assert backup.calls == 0
+    assert breaker.state == "open"
+    assert breaker.allow()
+
+
+def test_slow_primary_is_hedged_to_backup(engines):
+    primary, backup, breaker = engines(primary_delay=0.5)
+
+    assert dispatch.translate_text("Hello") == "보조 엔진 번역"
+    assert backup.calls == 1
+    assert metrics.snapshot()["counters"]["hedge_wins.backup"] == 1
+    primary.finished.wait(2.0)
+
+
+def test_blocked_backup_is_not_hedged(engines):
+    primary, backup, breaker = engines(primary_delay=0.2)
+    config.settings["BREAKER_COOLDOWN"] = 60.0
+    breaker.trip()
+
+    assert dispatch.translate_text("Hello") == "주 엔진 번역"
+    assert backup.calls == 0
+
+
+def test_fallback_chain_is_used_without_failover(engines):
+    primary, backup, breaker = engines(primary_delay=0.5)
+    config.settings.update({"HEDGE_ENGINE": None, "USE_ENGINE_FAILOVER": False, "ENGINE_FALLBACK_CHAIN": ["backup"]})
+
+    assert dispatch.translate_text("Hello") == "보조 엔진 번역"
+    assert backup.calls == 1
+    primary.finished.wait(2.0)
+
+
+def test_no_hedge_candidates_translates_with_primary(engines):
+    primary, backup, breaker = engines(primary_delay=0.1)
+    config.settings.update({"HEDGE_ENGINE": None, "ENGINE_FALLBACK_CHAIN": []})
+
+    assert dispatch.translate_text("Hello") == "주 엔진 번역"
+    assert backup.calls == 0
+
+
+def test_raising_backup_is_an_error_result(engines):
+    primary, backup, breaker = engines(primary_delay=0.2, backup_error=ConnectionError("boom"))
+
+    assert dispatch.translate_text("Hello") == "주 엔진 번역"
+    assert backup.calls == 1
+    assert metrics.snapshot()["counters"]["api_failures.backup"] == 1
+
+
+def test_raising_primary_lets_backup_win(engines):
+    primary, backup, breaker = engines(primary_delay=0.2, primary_error=ConnectionError("boom"), backup_delay=0.4)
+
+    assert dispatch.translate_text("Hello") == "보조 엔진 번역"
+    assert metrics.snapshot()["counters"]["api_failures.primary"] == 1
+
+
+def test_raising_primary_before_hedge_is_an_error_result(engines):
+    primary, backup, breaker = engines(primary_delay=0.0, primary_error=ConnectionError("boom"))
+
+    assert is_error_result(dispatch.translate_text("Hello"))
+    assert backup.calls == 0
+
+
+def test_hung_hedges_do_not_pile_up(engines, monkeypatch):
+    primary, backup, breaker = engines(primary_delay=0.2)
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()  # 앞선 헤지 요청이 아직 멈춰 있는 상태
+    monkeypatch.setattr(dispatch, "_hedge_slots", slots)
+
+    assert dispatch.translate_text("Hello") == "주 엔진 번역"
+    assert backup.calls == 0
+    assert metrics.snapshot()["counters"]["hedges_skipped_busy"] == 1
+
+
+def test_finished_hedge_frees_its_slot(engines, monkeypatch):
+    primary, backup, breaker = engines(primary_delay=0.5)
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(dispatch, "_hedge_slots", slots)
+
+    assert dispatch.translate_text("Hello") == "보조 엔진 번역"
+    primary.finished.wait(2.0)
+    assert slots.acquire(blocking=False)
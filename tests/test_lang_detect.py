@@ -0,0 +1,91 @@
+# tests/test_lang_detect.py - 문자 계열 분포로 원본 언어 추정
+import pytest
+
+import config
+from lang_detect import (base_lang, detect_language, detect_source_lang, easyocr_lang_list,
+                         same_language, script_histogram)
+
+CANDIDATES = ["ko", "ja", "en", "zh-CN", "ru", "fr"]
+
+
+def test_base_lang_and_same_language():
+    assert base_lang("zh-CN") == "zh"
+    assert base_lang("EN") == "en"
+    assert base_lang(None) == ""
+    assert same_language("zh-CN", "zh-TW")
+    assert not same_language("ko", "ja")
+    assert not same_language(None, None)
+
+
+def test_script_histogram_counts_letters_per_script():
+    counts = script_histogram("한국어 カナ 漢字 abc Жж")
+
+    assert counts == {"hangul": 3, "kana": 2, "han": 2, "cyrillic": 2, "latin": 3}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("안녕하세요, 반갑습니다!", "ko"),
+    ("今日はいい天気ですね。", "ja"),
+    ("今天天气很好。", "zh-CN"),
+    ("Привет, как дела?", "ru"),
+    ("What is that thing over there?", "en"),
+    ("Je ne sais pas ce que vous voulez.", "fr"),
+])
+def test_detect_language_with_candidates(text, expected):
+    assert detect_language(text, CANDIDATES) == expected
+
+
+def test_detect_language_returns_candidate_spelling():
+    assert detect_language("今天天气很好", ["ko", "zh-TW"]) == "zh-TW"
+
+
+def test_detect_language_outside_candidates_is_undecided():
+    assert detect_language("Привет, как дела?", ["ko", "ja", "en"]) is None
+
+
+def test_detect_language_mixed_scripts_is_undecided():
+    config.settings["LANG_DETECT_MIN_RATIO"] = 0.6
+
+    assert detect_language("Hi 안녕", CANDIDATES) is None
+
+
+def test_detect_language_without_letters_is_undecided():
+    assert detect_language("123 !!! ...", CANDIDATES) is None
+
+
+def test_latin_text_needs_candidates():
+    # 제한 모드가 아니면 라틴 문자 언어는 서버 자동 감지에 맡김
+    assert detect_language("What is that?") is None
+    assert detect_language("안녕하세요") == "ko"
+
+
+def test_latin_text_with_other_latin_candidates_needs_english_marker():
+    candidates = ["en", "es"]
+
+    assert detect_language("What is that?", candidates) == "en"
+    assert detect_language("Hola amigo mio", candidates) is None
+
+
+def test_detect_source_lang_follows_settings():
+    config.settings.update({"AUTO_DETECT_LANG": False, "SOURCE_LANG": "ja"})
+    assert detect_source_lang("안녕하세요") == "ja"
+
+    config.settings.update({"AUTO_DETECT_LANG": True, "USE_LOCAL_LANG_DETECT": False})
+    assert detect_source_lang("안녕하세요") is None
+
+    config.settings.update({"USE_LOCAL_LANG_DETECT": True, "USE_LIMITED_AUTO_DETECT": True,
+                            "LIMITED_AUTO_DETECT_LANGS": CANDIDATES})
+    assert detect_source_lang("안녕하세요") == "ko"
+
+
+@pytest.mark.parametrize("lang, extra, expected", [
+    ("en", (), ["en"]),
+    ("ja", (), ["ja", "en"]),
+    ("zh-CN", (), ["ch_sim", "en"]),
+    ("fr", ("de", "ja", "fr"), ["fr", "de", "en"]),
+    ("ko", ("ja", "en"), ["ko", "en"]),
+    ("ru", ("fr",), ["ru", "en"]),
+    ("xx", (), ["en"]),
+])
+def test_easyocr_lang_list_keeps_one_recognition_model(lang, extra, expected):
+    assert easyocr_lang_list(lang, extra) == expected
@@ -0,0 +1,59 @@
+# tests/test_ocr_filter.py - OCR 상자 필터, 읽는 순서, 의미 없는 텍스트 판단
+import pytest
+
+import config
+from ocr_filter import filter_ocr_results, is_meaningful_text, reading_order_lines
+
+
+def _box(x, y, w=40, h=20):
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("안녕", True),
+    ("こんにちは", True),
+    ("你好", True),
+    ("Yes", True),
+    ("12:30", True),
+    ("~|#@*", False),
+    ("ok #", True),
+    ("", False),
+    ("   ", False),
+])
+def test_is_meaningful_text(text, expected):
+    config.settings["SPECIAL_CHAR_THRESHOLD"] = 0.3
+
+    assert is_meaningful_text(text) is expected
+
+
+def test_filter_drops_low_confidence_small_and_blank_boxes():
+    config.settings.update({"OCR_MIN_CONFIDENCE": 0.3, "OCR_MIN_BOX_HEIGHT": 8})
+    results = [
+        (_box(0, 0), "keep", 0.9),
+        (_box(0, 30), "faint", 0.1),
+        (_box(0, 60, h=5), "tiny", 0.9),
+        (_box(0, 90), "  ", 0.9),
+    ]
+
+    assert [text for _, text, _ in filter_ocr_results(results)] == ["keep"]
+
+
+def test_reading_order_groups_rows_left_to_right():
+    results = [
+        (_box(120, 42), "line", 0.9),
+        (_box(0, 0), "First", 0.9),
+        (_box(0, 40), "Second", 0.9),
+        (_box(60, 3), "row", 0.9),
+    ]
+
+    assert reading_order_lines(results) == ["First row", "Second line"]
+
+
+def test_reading_order_joins_cjk_boxes_without_space():
+    results = [(_box(50, 0), "天気", 0.9), (_box(0, 0), "今日の", 0.9), (_box(100, 2), "OK", 0.9)]
+
+    assert reading_order_lines(results) == ["今日の天気 OK"]
+
+
+def test_reading_order_of_nothing_is_empty():
+    assert reading_order_lines([]) == []
@@ -0,0 +1,95 @@
+# tests/test_ocr_regions.py - 영역별 작업 슬롯, 영역 설정, 캡처 자르기
+import threading
+
+import numpy as np
+
+import config
+from ocr_regions import LatestSlots, compose_outputs, crop_region, load_ocr_regions, union_box
+
+
+def test_put_overwrites_only_same_region():
+    slots = LatestSlots()
+
+    assert slots.put("name", "old name") is False
+    assert slots.put("dialogue", "line 1") is False
+    assert slots.put("name", "new name") is True
+
+    assert sorted(slots.take_all(timeout=0)) == ["line 1", "new name"]
+    assert slots.take_all(timeout=0) == []
+
+
+def test_put_many_counts_replaced_items():
+    slots = LatestSlots()
+    slots.put("a", 1)
+
+    assert slots.put_many([("a", 2), ("b", 3), ("b", 4)]) == 2
+    assert sorted(slots.take_all(timeout=0)) == [2, 4]
+
+
+def test_take_all_waits_for_put():
+    slots = LatestSlots()
+    timer = threading.Timer(0.05, slots.put, ("main", "text"))
+    timer.start()
+
+    assert slots.take_all(timeout=5.0) == ["text"]
+    timer.join()
+
+
+def test_take_all_times_out_empty():
+    assert LatestSlots().take_all(timeout=0.01) == []
+
+
+def test_clear_drops_pending_items():
+    slots = LatestSlots()
+    slots.put("main", "text")
+    slots.clear()
+
+    assert slots.take_all(timeout=0) == []
+
+
+def test_load_regions_skips_invalid_entries():
+    config.settings["OCR_REGIONS"] = [
+        {"name": "name", "region": [200, 760, 500, 800], "interval": 1.0},
+        {"name": "broken", "region": [10, 10, 5, 20]},
+        {"region": [200, 800, 1700, 1000]},
+    ]
+
+    regions = load_ocr_regions()
+
+    assert [(r.name, r.box, r.interval) for r in regions] == [
+        ("name", (200, 760, 500, 800), 1.0),
+        ("region3", (200, 800, 1700, 1000), None),
+    ]
+
+
+def test_load_regions_falls_back_to_single_region():
+    config.settings.update({"OCR_REGIONS": [], "OCR_REGION": (0, 0, 100, 50)})
+
+    assert [(r.name, r.box) for r in load_ocr_regions()] == [("main", (0, 0, 100, 50))]
+
+
+def test_union_capture_is_cropped_per_region():
+    config.settings["OCR_REGIONS"] = [
+        {"name": "name", "region": [10, 20, 30, 25]},
+        {"name": "dialogue", "region": [5, 30, 50, 40]},
+    ]
+    regions = load_ocr_regions()
+    union = union_box(regions)
+    frame = np.arange((union[3] - union[1]) * (union[2] - union[0])).reshape(union[3] - union[1], -1)
+
+    assert union == (5, 20, 50, 40)
+    name = crop_region(frame, union, regions[0].box)
+    assert name.shape == (5, 20)
+    assert name[0, 0] == frame[0, 5]
+    assert crop_region(frame, union, regions[1].box).shape == (10, 45)
+
+
+def test_compose_outputs_follows_region_order():
+    config.settings["OCR_REGIONS"] = [
+        {"name": "name", "region": [0, 0, 10, 10]},
+        {"name": "dialogue", "region": [0, 10, 10, 20]},
+    ]
+    regions = load_ocr_regions()
+
+    assert compose_outputs(regions, {"dialogue": "대사", "name": "이름"}) == "이름\n대사"
+    assert compose_outputs(regions, {"dialogue": "대사", "name": ""}) == "대사"
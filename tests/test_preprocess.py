@@ -0,0 +1,66 @@
+# tests/test_preprocess.py - 회색조 변환 채널 순서, 캡처 백엔드/녹화의 채널 순서
+import numpy as np
+import pytest
+
+from capture import (CaptureBackend, FileCapture, GdiCapture, MssCapture, PyAutoGuiCapture, ReplayCapture,
+                     SessionRecorder)
+from preprocess import preprocess_image, to_grayscale
+
+RED_RGB = np.array([[[255, 0, 0]]], dtype=np.uint8)
+BLUE_RGB = np.array([[[0, 0, 255]]], dtype=np.uint8)
+
+
+def test_red_and_blue_differ_in_luma():
+    assert to_grayscale(RED_RGB)[0, 0] == 76
+    assert to_grayscale(BLUE_RGB)[0, 0] == 28
+
+
+def test_bgr_input_gives_same_gray_as_rgb():
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, (8, 16, 3), dtype=np.uint8)
+    bgr = np.ascontiguousarray(rgb[:, :, ::-1])
+
+    assert np.array_equal(to_grayscale(bgr, "BGR"), to_grayscale(rgb))
+    assert not np.array_equal(to_grayscale(bgr), to_grayscale(rgb))
+
+
+def test_preprocess_image_passes_channel_order():
+    bgr_red = np.ascontiguousarray(RED_RGB[:, :, ::-1])
+
+    gray, scale = preprocess_image(bgr_red, mode="gray", channel_order="BGR")
+
+    assert gray[0, 0] == 76
+    assert scale == 1.0
+
+
+def test_backends_report_channel_order():
+    assert CaptureBackend.channel_order == "RGB"
+    assert PyAutoGuiCapture.channel_order == "RGB"
+    assert GdiCapture.channel_order == "BGR"
+    assert MssCapture.channel_order == "BGR"
+
+
+@pytest.mark.parametrize("order", ["RGB", "BGR"])
+def test_recording_keeps_capture_channel_order(tmp_path, order):
+    path = str(tmp_path / "session.npz")
+    recorder = SessionRecorder(path, channel_order=order)
+    recorder.add(np.zeros((4, 4, 3), dtype=np.uint8), 0.0)
+    assert recorder.save()
+
+    assert ReplayCapture(path).channel_order == order
+    assert FileCapture(path).channel_order == order
+
+
+def test_old_recording_without_channel_order_is_bgr(tmp_path):
+    path = str(tmp_path / "old.npz")
+    np.savez_compressed(path, frames=np.zeros((1, 4, 4, 3), dtype=np.uint8),
+                        frame_index=np.array([0], dtype=np.int32), timestamps=np.array([0.0]))
+
+    assert ReplayCapture(path).channel_order == "BGR"
+
+
+def test_npy_file_is_rgb(tmp_path):
+    path = str(tmp_path / "frame.npy")
+    np.save(path, np.zeros((4, 4, 3), dtype=np.uint8))
+
+    assert FileCapture(path).channel_order == "RGB"
@@ -0,0 +1,122 @@
+# tests/test_recognition_cache.py - 줄 이미지가 같으면 인식 결과를 재사용
+import numpy as np
+import pytest
+
+import config
+import metrics
+import recognition_cache
+from recognition_cache import _recognize_image, clear_recognition_cache
+
+
+class FakeReader:
+    """detect/recognize를 따로 호출할 수 있는 EasyOCR 리더 흉내 (줄 이미지의 밝기로 텍스트를 만듦)"""
+
+    lang_list = ["en"]
+
+    def __init__(self, horizontal=(), free=()):
+        self.horizontal = [list(box) for box in horizontal]
+        self.free = [list(polygon) for polygon in free]
+        self.recognized = []  # recognize()에 넘어온 (가로 상자 목록, 자유 다각형 목록)
+
+    def detect(self, image, reformat=False):
+        count = len(image) if image.ndim == 3 else 1
+        return [self.horizontal] * count, [self.free] * count
+
+    def recognize(self, grey, horizontal_list, free_list, detail=1, reformat=False):
+        self.recognized.append((horizontal_list, free_list))
+        results = []
+        for x1, x2, y1, y2 in horizontal_list:
+            box = [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+            results.append((box, f"line{int(grey[y1:y2, x1:x2].mean())}", 0.9))
+        for polygon in free_list:
+            xs = [x for x, _ in polygon]
+            ys = [y for _, y in polygon]
+            crop = grey[min(ys):max(ys), min(xs):max(xs)]
+            results.append((polygon, f"free{int(crop.mean())}", 0.8))
+        return results
+
+
+def _screen(*values):
+    """세로로 10픽셀씩 값이 다른 줄이 쌓인 회색 이미지"""
+    grey = np.zeros((10 * len(values), 40), dtype=np.uint8)
+    for i, value in enumerate(values):
+        grey[i * 10:(i + 1) * 10] = value
+    return grey
+
+
+def _texts(results):
+    return [text for _, text, _ in results]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_recognition_cache()
+    yield
+    clear_recognition_cache()
+
+
+def test_cached_lines_are_not_recognized_again():
+    reader = FakeReader(horizontal=[(0, 40, 0, 10), (0, 40, 10, 20)])
+    grey = _screen(10, 20)
+
+    first = _recognize_image(reader, grey, reader.horizontal, [])
+    second = _recognize_image(reader, grey, reader.horizontal, [])
+
+    assert _texts(first) == _texts(second) == ["line10", "line20"]
+    assert len(reader.recognized) == 1
+    counters = metrics.snapshot()["counters"]
+    assert counters["recognition_cache_misses"] == 2
+    assert counters["recognition_cache_hits"] == 2
+
+
+def test_only_changed_line_is_recognized_and_order_is_kept():
+    reader = FakeReader(horizontal=[(0, 40, 0, 10), (0, 40, 10, 20), (0, 40, 20, 30)])
+    _recognize_image(reader, _screen(10, 20, 30), reader.horizontal, [])
+
+    results = _recognize_image(reader, _screen(10, 25, 30), reader.horizontal, [])
+
+    assert _texts(results) == ["line10", "line25", "line30"]
+    assert reader.recognized[-1] == ([[0, 40, 10, 20]], [])
+
+
+def test_horizontal_and_free_boxes_keep_their_order():
+    polygon = [[0, 20], [40, 20], [40, 30], [0, 30]]
+    reader = FakeReader(horizontal=[(0, 40, 0, 10)], free=[polygon])
+    grey = _screen(10, 20, 30)
+    _recognize_image(reader, grey, reader.horizontal, [])  # 가로 줄만 미리 캐시
+
+    results = _recognize_image(reader, grey, reader.horizontal, reader.free)
+
+    assert _texts(results) == ["line10", "free30"]
+    assert reader.recognized[-1] == ([], [polygon])
+
+
+def test_identical_boxes_are_both_kept():
+    reader = FakeReader(horizontal=[(0, 40, 0, 10), (0, 40, 0, 10)])
+
+    results = _recognize_image(reader, _screen(10), reader.horizontal, [])
+
+    assert _texts(results) == ["line10", "line10"]
+
+
+def test_cache_is_bounded():
+    config.settings["RECOGNITION_CACHE_SIZE"] = 2
+    reader = FakeReader(horizontal=[(0, 40, 0, 10)])
+    for value in (10, 20, 30):
+        _recognize_image(reader, _screen(value), reader.horizontal, [])
+
+    assert len(recognition_cache._lines) == 2
+    _recognize_image(reader, _screen(10), reader.horizontal, [])
+    assert len(reader.recognized) == 4  # 가장 오래된 줄은 밀려나 다시 인식
+
+
+def test_readtext_cached_detects_once_per_batch():
+    pytest.importorskip("easyocr")
+    from recognition_cache import readtext_cached
+
+    reader = FakeReader(horizontal=[(0, 40, 0, 10), (0, 40, 10, 20)])
+    images = [np.dstack([_screen(10, 20)] * 3), np.dstack([_screen(10, 40)] * 3)]
+
+    results = readtext_cached(reader, images)
+
+    assert [_texts(r) for r in results] == [["line10", "line20"], ["line10", "line40"]]
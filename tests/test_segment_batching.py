@@ -0,0 +1,121 @@
+# tests/test_segment_batching.py - 새 세그먼트를 한 번의 요청으로 묶어 번역
+import pytest
+
+import config
+import translation_cache
+import translator_dispatch as dispatch
+from translation_cache import error_result, get_cache_stats, is_error_result
+
+
+class FakeEngine:
+    """줄마다 "[원문]"을 돌려주는 번역 엔진 (호출 기록)"""
+
+    def __init__(self):
+        self.calls = []
+        self.merge_lines = False
+        self.fail = False
+
+    def __call__(self, text, source_lang=None):
+        self.calls.append(text)
+        if self.fail:
+            return error_result("(가짜 번역 실패)")
+        lines = [f"[{line}]" for line in text.split("\n")]
+        return " ".join(lines) if self.merge_lines else "\n".join(lines)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setitem(dispatch.ENGINE_FUNCTIONS, "fake", fake)
+    # 번역 캐시는 테스트마다 임시 폴더의 새 DB로
+    monkeypatch.setattr(translation_cache, "_conn", None)
+    monkeypatch.setattr(translation_cache, "_memory", type(translation_cache._memory)())
+    config.settings.update({
+        "ENGINE": "fake", "USE_ENGINE_FAILOVER": False, "USE_HEDGED_REQUESTS": False,
+        "USE_TRANSLATION_CACHE": True, "AUTO_DETECT_LANG": False,
+        "SOURCE_LANG": "en", "TARGET_LANG": "ko", "SEGMENT_MODE": "sentence",
+    })
+    yield fake
+    if translation_cache._conn is not None:
+        translation_cache._conn.close()
+
+
+def test_new_segments_go_in_one_request(engine):
+    result = dispatch.translate_text_segmented("One. Two.\nThree?")
+
+    assert engine.calls == ["One.\nTwo.\nThree?"]
+    assert result == "[One.] [Two.]\n[Three?]"
+
+
+def test_cached_segments_are_not_sent_again(engine):
+    dispatch.translate_text_segmented("One. Two.")
+    engine.calls.clear()
+
+    result = dispatch.translate_text_segmented("Two. Three. Four.")
+
+    assert engine.calls == ["Three.\nFour."]
+    assert result == "[Two.] [Three.] [Four.]"
+
+
+def test_single_new_segment_is_sent_alone(engine):
+    dispatch.translate_text_segmented("One. Two.")
+    engine.calls.clear()
+
+    dispatch.translate_text_segmented("One. Two. Three.")
+
+    assert engine.calls == ["Three."]
+
+
+def test_line_count_mismatch_keeps_the_batch_translation(engine):
+    engine.merge_lines = True
+
+    result = dispatch.translate_text_segmented("One. Two.")
+
+    # 이미 받은 묶음 번역을 그대로 사용 (세그먼트별로 다시 요청하지 않음)
+    assert engine.calls == ["One.\nTwo."]
+    assert result == "[One.] [Two.]"
+    # 나눌 수 없는 번역은 세그먼트별로 캐시하지 않음
+    assert translation_cache.get_cached_translation("fake", "en", "ko", "One.") is None
+
+    engine.calls.clear()
+    assert dispatch.translate_text_segmented("One. Two.") == "[One.] [Two.]"
+    assert engine.calls == []
+
+
+def test_segments_are_cached_under_the_engine_that_answered(engine, monkeypatch):
+    engine.fail = True
+    backup = FakeEngine()
+    monkeypatch.setitem(dispatch.ENGINE_FUNCTIONS, "backup", backup)
+    config.settings.update({"USE_ENGINE_FAILOVER": True, "ENGINE_FALLBACK_CHAIN": ["backup"]})
+
+    assert dispatch.translate_text_segmented("One. Two.") == "[One.] [Two.]"
+
+    assert translation_cache.get_cached_translation("backup", "en", "ko", "One.") == "[One.]"
+    assert translation_cache.get_cached_translation("fake", "en", "ko", "One.") is None
+
+
+def test_failed_batch_shows_error_once(engine):
+    engine.fail = True
+
+    result = dispatch.translate_text_segmented("One. Two. Three.")
+
+    assert len(engine.calls) == 1
+    assert is_error_result(result)
+    assert result == "(가짜 번역 실패)"
+    assert get_cache_stats()["entries"] == 0
+
+
+def test_partials_are_rejoined_per_segment(engine, monkeypatch):
+    def streaming(text, source_lang=None, on_partial=None):
+        first = text.split("\n")[0]
+        on_partial(f"[{first}]")
+        return "\n".join(f"[{line}]" for line in text.split("\n"))
+
+    monkeypatch.setitem(dispatch.ENGINE_FUNCTIONS, "fake", streaming)
+    monkeypatch.setattr(dispatch, "STREAMING_ENGINES", {"fake"})
+    partials = []
+
+    result = dispatch.translate_text_segmented("One. Two.", on_partial=partials.append)
+
+    assert partials == ["[One.]"]
+    assert result == "[One.] [Two.]"
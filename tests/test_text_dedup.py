@@ -0,0 +1,71 @@
+# tests/test_text_dedup.py - OCR 노이즈가 섞인 중복 텍스트 감지
+from text_dedup import RecentTexts, normalize_ocr_text, similarity
+
+
+def test_normalize_unifies_confusables_case_and_punctuation():
+    assert normalize_ocr_text("Hel1o, W0rld!") == normalize_ocr_text("hello world")
+    assert normalize_ocr_text("ＨＥＬＬＯ") == "hello"  # 전각 문자 (NFKC)
+    assert normalize_ocr_text("I'm | here") == normalize_ocr_text("l`m l here")
+    assert normalize_ocr_text(None) == ""
+
+
+def test_similarity_bounds():
+    assert similarity("abc", "abc") == 1.0
+    assert similarity("", "abc") == 0.0
+    assert 0.0 < similarity("hello", "help") < 1.0
+
+
+def test_near_duplicate_is_matched_after_normalization():
+    recent = RecentTexts(size=5)
+    recent.add("Welcome to the village, traveler.", "마을에 온 것을 환영하네, 여행자여.")
+
+    # 구두점/대소문자/혼동 문자만 다름 → 정규화 후 완전히 같음
+    assert recent.find("WELC0ME to the vi1lage traveler", 0.9) == ("마을에 온 것을 환영하네, 여행자여.", 1.0)
+
+    # 한 글자 잘못 인식 → 유사도 기준 이상
+    translated, ratio = recent.find("Welcome to the villaqe, traveler.", 0.9)
+    assert translated == "마을에 온 것을 환영하네, 여행자여."
+    assert 0.9 <= ratio < 1.0
+
+
+def test_new_line_is_not_suppressed():
+    recent = RecentTexts(size=5)
+    recent.add("Welcome to the village, traveler.", "마을에 온 것을 환영하네, 여행자여.")
+
+    assert recent.find("The bridge to the north is closed.", 0.9) is None
+    assert recent.find("Welcome to the castle, knight.", 0.9) is None
+
+
+def test_short_text_needs_an_exact_match():
+    recent = RecentTexts(size=5)
+    recent.add("Yes", "예")
+
+    assert recent.find("yes!", 0.5) == ("예", 1.0)
+    assert recent.find("Yet", 0.5) is None
+
+
+def test_old_entries_expire_out_of_the_window():
+    recent = RecentTexts(size=2)
+    recent.add("First line of dialogue", "첫 번째 대사")
+    recent.add("Second line of dialogue", "두 번째 대사")
+    recent.add("Something else entirely", "전혀 다른 대사")
+
+    assert recent.find("First line of dialogue", 0.99) is None
+    assert recent.find("Second line of dialogue", 0.99) == ("두 번째 대사", 1.0)
+
+
+def test_most_similar_entry_wins():
+    recent = RecentTexts(size=5)
+    recent.add("The knight draws his sword", "기사가 칼을 뽑는다")
+    recent.add("The knight draws his bow", "기사가 활을 뽑는다")
+
+    translated, _ = recent.find("The knight draws his sw0rd.", 0.8)
+    assert translated == "기사가 칼을 뽑는다"
+
+
+def test_clear_forgets_everything():
+    recent = RecentTexts()
+    recent.add("Hello there", "안녕")
+    recent.clear()
+
+    assert recent.find("Hello there", 0.9) is None
@@ -0,0 +1,61 @@
+# tests/test_text_segments.py - 줄/문장 분리와 재결합
+import pytest
+
+from text_segments import join_segments, split_segments, split_sentences
+
+
+@pytest.mark.parametrize("chunk, expected", [
+    ("Hello. How are you? Fine!", ["Hello.", "How are you?", "Fine!"]),
+    ("Dr. Smith paid $3.50 today.", ["Dr. Smith paid $3.50 today."]),
+    ("J. R. R. Tolkien wrote it. Really.", ["J. R. R. Tolkien wrote it.", "Really."]),
+    ("...Wait. Stop.", ["...Wait.", "Stop."]),
+    ("Hello. ...", ["Hello. ..."]),
+    ("He said \"go.\" Then left.", ["He said \"go.\"", "Then left."]),
+    ("こんにちは。元気ですか？はい", ["こんにちは。", "元気ですか？", "はい"]),
+    ("안녕하세요. 반갑습니다", ["안녕하세요.", "반갑습니다"]),
+    ("?!", ["?!"]),
+    ("", []),
+])
+def test_split_sentences(chunk, expected):
+    assert split_sentences(chunk) == expected
+
+
+def test_sentence_mode_merges_lines_until_sentence_ends():
+    segments, separators = split_segments("This line was\nwrapped by the box.\nNext one.")
+
+    assert segments == ["This line was wrapped by the box.", "Next one."]
+    assert separators == ["\n"]
+
+
+def test_sentence_mode_joins_cjk_lines_without_space():
+    segments, _ = split_segments("今日は\nいい天気ですね。")
+
+    assert segments == ["今日はいい天気ですね。"]
+
+
+def test_line_mode_keeps_ocr_lines():
+    segments, separators = split_segments(" first \n\nsecond. third\n", mode="line")
+
+    assert segments == ["first", "second. third"]
+    assert separators == ["\n"]
+
+
+@pytest.mark.parametrize("text", [
+    "One. Two.\nThree? Four!",
+    "Dr. Who arrived...\nthen left. End",
+    "첫 줄이\n이어집니다. 다음 문장!\n마지막",
+])
+def test_join_restores_original_layout(text):
+    segments, separators = split_segments(text)
+
+    rebuilt = join_segments(segments, separators)
+
+    # 줄바꿈으로 이어 붙인 줄(문장 부호 없이 끝난 줄)을 제외하면 원문 그대로
+    assert rebuilt.replace("\n", " ") == text.replace("\n", " ")
+    assert "".join(rebuilt.split()) == "".join(text.split())
+
+
+def test_join_skips_empty_parts():
+    assert join_segments(["a", "", "c"], ["\n", " "]) == "a c"
+    assert join_segments(["", "b"], [" "]) == "b"
+    assert join_segments([], []) == ""
@@ -0,0 +1,85 @@
+# tests/test_text_settle.py - 타자기 효과 대사가 완성될 때까지 번역 보류
+from text_settle import SettleDetector
+
+SETTLE = 0.6
+
+
+def test_text_waits_for_settle_time_and_a_confirming_capture():
+    settle = SettleDetector()
+    assert settle.update("Hello", 1, now=0.0)
+
+    # 시간은 지났지만 이후 캡처가 아직 없음 (캡처 주기가 SETTLE_TIME보다 긴 경우)
+    assert settle.poll(1.0, SETTLE) is None
+
+    settle.confirm(1)
+    assert settle.poll(1.0, SETTLE) == (1, "Hello")
+    assert settle.poll(2.0, SETTLE) is None
+
+
+def test_confirmation_before_settle_time_still_waits():
+    settle = SettleDetector()
+    settle.update("Hello", 1, now=0.0)
+    settle.confirm(1)
+
+    assert settle.poll(0.3, SETTLE) is None
+    assert settle.poll(0.6, SETTLE) == (1, "Hello")
+
+
+def test_growing_prefix_is_released_only_when_complete():
+    settle = SettleDetector()
+    settle.update("He", 1, now=0.0)
+    settle.confirm(0)  # 더 이전 프레임의 확인은 현재 텍스트를 확인하지 않음
+    assert settle.poll(1.0, SETTLE) is None
+
+    assert settle.update("Hello, wor", 2, now=1.0)
+    assert settle.growing
+    assert settle.update("Hello, world!", 3, now=2.0)
+    settle.confirm(2)
+    assert settle.poll(3.0, SETTLE) is None
+
+    settle.confirm(3)
+    assert settle.poll(3.0, SETTLE) == (3, "Hello, world!")
+    assert settle.superseded == 2
+
+
+def test_same_text_recognized_again_confirms():
+    settle = SettleDetector()
+    settle.update("Hello world", 1, now=0.0)
+
+    # OCR 공백 차이만 있는 재인식은 변경이 아님
+    assert not settle.update("Hello  world", 2, now=0.5)
+    assert settle.poll(0.6, SETTLE) == (1, "Hello world")
+
+
+def test_replacement_is_not_growing():
+    settle = SettleDetector()
+    settle.update("First line.", 1, now=0.0)
+    settle.confirm(1)
+    assert settle.poll(1.0, SETTLE) == (1, "First line.")
+
+    assert settle.update("Second line.", 2, now=2.0)
+    assert not settle.growing
+    # 내보낸 텍스트가 바뀐 것은 폐기가 아님
+    assert settle.superseded == 0
+    settle.confirm(2)
+    assert settle.poll(3.0, SETTLE) == (2, "Second line.")
+
+
+def test_zero_settle_time_releases_immediately():
+    settle = SettleDetector()
+    settle.update("Hello", 1, now=0.0)
+
+    assert settle.poll(0.0, 0) == (1, "Hello")
+
+
+def test_reset_forgets_pending_text():
+    settle = SettleDetector()
+    settle.update("He", 1, now=0.0)
+    settle.update("Hello", 2, now=0.1)
+    settle.confirm(2)
+    settle.reset()
+
+    assert settle.poll(5.0, SETTLE) is None
+    assert (settle.superseded, settle.confirmed_seq, settle.growing) == (0, 0, False)
+    assert settle.update("He", 3, now=6.0)
+    assert not settle.growing
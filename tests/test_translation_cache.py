@@ -0,0 +1,81 @@
+# tests/test_translation_cache.py - 영구 번역 캐시와 오류 결과 표시
+import pytest
+
+import config
+import translation_cache as cache
+from translation_cache import ErrorResult, error_result, is_error_result
+
+
+def _reopen():
+    """프로그램을 다시 켠 것처럼 메모리를 비우고 DB를 다시 열게 함"""
+    if cache._conn is not None:
+        cache._conn.close()
+    cache._conn = None
+    cache._memory.clear()
+    cache._touched.clear()
+    cache.cache_stats.update(hits=0, misses=0)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    _reopen()
+    yield
+    _reopen()
+
+
+def test_error_result_is_marked_by_type():
+    message = error_result("(GPT 번역 실패: HTTP 500)")
+
+    assert isinstance(message, ErrorResult)
+    assert message == "(GPT 번역 실패: HTTP 500)"
+    assert is_error_result(message)
+    assert is_error_result("")
+    assert is_error_result(None)
+
+
+def test_translation_that_looks_like_an_error_is_not_one():
+    assert not is_error_result("(작전 실패)")
+
+
+def test_store_and_get_with_normalized_text():
+    cache.store_translation("gpt", "en", "ko", "Hello   world ", "안녕 세상")
+
+    assert cache.get_cached_translation("gpt", "en", "ko", " Hello world") == "안녕 세상"
+    assert cache.get_cached_translation("deepl", "en", "ko", "Hello world") is None
+    assert cache.get_cache_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_error_results_are_not_stored():
+    cache.store_translation("gpt", "en", "ko", "Hello", error_result("(GPT 번역 실패: timeout)"))
+    cache.store_translation("gpt", "en", "ko", "Bye", "")
+
+    assert cache.get_cache_stats()["entries"] == 0
+
+
+def test_entries_persist_across_restarts():
+    cache.store_translation("gpt", "en", "ko", "Hello", "안녕")
+    _reopen()
+
+    assert cache.get_cached_translation("gpt", "en", "ko", "Hello") == "안녕"
+
+
+def test_least_recently_used_entry_is_evicted():
+    config.settings["TRANSLATION_CACHE_MAX_ENTRIES"] = 2
+    cache.store_translation("gpt", "en", "ko", "one", "하나")
+    cache.store_translation("gpt", "en", "ko", "two", "둘")
+    cache.get_cached_translation("gpt", "en", "ko", "one")
+    cache.store_translation("gpt", "en", "ko", "three", "셋")
+
+    assert cache.get_cached_translation("gpt", "en", "ko", "two") is None
+    _reopen()
+    assert cache.get_cached_translation("gpt", "en", "ko", "one") == "하나"
+    assert cache.get_cached_translation("gpt", "en", "ko", "two") is None
+    assert cache.get_cache_stats()["entries"] == 2
+
+
+def test_clear_removes_memory_and_disk():
+    cache.store_translation("gpt", "en", "ko", "Hello", "안녕")
+    cache.clear_translation_cache()
+    _reopen()
+
+    assert cache.get_cached_translation("gpt", "en", "ko", "Hello") is None
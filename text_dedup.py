@@ -0,0 +1,62 @@
+# text_dedup.py - OCR 노이즈에 강한 중복 텍스트 감지
+import re
+import unicodedata
+from collections import deque
+from difflib import SequenceMatcher
+
+# OCR에서 자주 혼동되는 문자를 하나로 통일 (소문자 변환 전에 적용)
+_CONFUSABLES = str.maketrans({
+    "I": "l", "1": "l", "|": "l", "í": "l", "ì": "l",
+    "O": "o", "0": "o",
+    "`": "'", "´": "'",
+})
+
+# 문자/숫자 외의 모든 문자 (공백, 문장 부호, 기호) 제거
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_ocr_text(text):
+    """비교용 정규화: NFKC → 혼동 문자 통일 → 소문자 → 공백/부호 제거"""
+    text = unicodedata.normalize("NFKC", text or "")
+    text = text.translate(_CONFUSABLES).lower()
+    return _NON_WORD_RE.sub("", text)
+
+
+def similarity(a, b):
+    """정규화된 두 문자열의 유사도 (0~1)"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+class RecentTexts:
+    """최근 번역한 텍스트 몇 개를 보관하고, 거의 같은 텍스트가 오면 이전 번역을 돌려줌"""
+
+    def __init__(self, size=5):
+        self.entries = deque(maxlen=size)  # (정규화 텍스트, 번역 결과)
+
+    def clear(self):
+        self.entries.clear()
+
+    def find(self, text, threshold):
+        """유사도가 threshold 이상인 최근 텍스트의 (번역, 유사도) 반환 (없으면 None)"""
+        key = normalize_ocr_text(text)
+        best = None
+        for other, translated in reversed(self.entries):
+            if key == other:
+                return translated, 1.0
+            # 짧은 텍스트는 한 글자 차이도 의미가 달라지므로 완전히 같을 때만 인정
+            if min(len(key), len(other)) < 4:
+                continue
+            matcher = SequenceMatcher(None, key, other, autojunk=False)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= threshold and (best is None or ratio > best[1]):
+                best = (translated, ratio)
+        return best
+
+    def add(self, text, translated):
+        self.entries.append((normalize_ocr_text(text), translated))
@@ -0,0 +1,100 @@
+# text_segments.py - OCR 결과를 줄/문장 단위로 나누고 다시 합치기
+import re
+
+# 한자/가나가 포함된 텍스트는 줄을 이을 때 공백을 넣지 않음
+_CJK_RE = re.compile(r"[぀-ヿ㐀-䶿一-鿿]")
+
+# 문장 끝: 문장 부호 (+ 닫는 따옴표/괄호)
+# - 반각 부호(. ! ? …)는 뒤에 공백/텍스트 끝/한중일 문자가 올 때만 (3.50, ...Wait 등은 나누지 않음)
+# - 전각 부호(。！？)는 바로 나눔
+_CLOSERS = "」』\"'”’)）"
+_BOUNDARY_RE = re.compile(
+    rf"[.!?…]+[{_CLOSERS}]*(?=\s|$|[぀-ヿ㐀-䶿一-鿿가-힣])|[。！？]+[{_CLOSERS}]*"
+)
+_LINE_END_RE = re.compile(rf"[.!?…。！？][{_CLOSERS}]*$")
+_WORD_RE = re.compile(r"\w")
+
+# 마침표로 끝나도 문장 끝이 아닌 약어 (소문자 비교)
+_ABBREVIATIONS = {"mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "vs", "etc", "e.g", "i.e", "no", "mt", "fig"}
+
+
+def _is_abbreviation(chunk, match):
+    """마침표 하나로 끝나는 약어(Dr.)나 이름 머리글자(J.)이면 True"""
+    if match.group() != ".":
+        return False
+    words = chunk[:match.start()].split()
+    if not words:
+        return False
+    word = words[-1].lstrip(_CLOSERS + "(（「『").lower()
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def split_sentences(chunk):
+    """
+    한 덩어리 텍스트를 문장으로 분리
+    글자가 없는 조각(앞에 붙은 "...", "?!" 등)은 따로 떼지 않고 이웃 문장에 붙여 둠
+    """
+    sentences = []
+    start = 0
+    for match in _BOUNDARY_RE.finditer(chunk):
+        piece = chunk[start:match.end()]
+        if not _WORD_RE.search(piece) or _is_abbreviation(chunk, match):
+            continue
+        sentences.append(piece.strip())
+        start = match.end()
+
+    rest = chunk[start:].strip()
+    if rest:
+        if sentences and not _WORD_RE.search(rest):
+            sentences[-1] = (sentences[-1] + chunk[start:]).rstrip()
+        else:
+            sentences.append(rest)
+    return sentences
+
+
+def split_segments(text, mode="sentence"):
+    """
+    텍스트를 번역 단위로 분리
+    - "line": OCR 상자(줄) 단위
+    - "sentence": 문장 부호 기준으로 분리. 문장 부호 없이 끝난 줄은 다음 줄과 이어 붙임
+      (줄바꿈으로 잘린 문장도 한 문장으로 번역), 문장이 끝난 줄바꿈은 그대로 유지
+    반환값: (세그먼트 목록, 세그먼트 사이 구분자 목록) - join_segments()로 다시 합침
+    """
+    lines = [line.strip() for line in (text or "").split("\n") if line.strip()]
+
+    if mode == "line":
+        return lines, ["\n"] * max(0, len(lines) - 1)
+
+    # 문장 부호로 끝나는 줄까지를 한 덩어리로
+    line_joiner = "" if _CJK_RE.search(text or "") else " "
+    chunks, current = [], []
+    for line in lines:
+        current.append(line)
+        if _LINE_END_RE.search(line):
+            chunks.append(line_joiner.join(current))
+            current = []
+    if current:
+        chunks.append(line_joiner.join(current))
+
+    segments, separators = [], []
+    for chunk in chunks:
+        sentences = split_sentences(chunk)
+        if not sentences:
+            continue
+        if segments:
+            separators.append("\n")
+        separators.extend([" "] * (len(sentences) - 1))
+        segments.extend(sentences)
+    return segments, separators
+
+
+def join_segments(parts, separators):
+    """번역된 세그먼트를 원래 구분자(공백/줄바꿈)로 다시 합침 (빈 결과는 건너뜀)"""
+    text = ""
+    for i, part in enumerate(parts):
+        if not part:
+            continue
+        if text:
+            text += separators[i - 1] if i > 0 else " "
+        text += part
+    return text
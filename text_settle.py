@@ -0,0 +1,57 @@
+# text_settle.py - 글자가 한 자씩 나타나는 대사창에서 텍스트가 완성될 때까지 번역 보류
+
+
+def _compact(text):
+    """OCR 공백 차이는 무시하고 비교"""
+    return "".join((text or "").split())
+
+
+class SettleDetector:
+    """
+    인식된 텍스트가 바뀌지 않았음이 확인되어야 번역 대상으로 내보냄
+    - 텍스트가 바뀐 뒤 SETTLE_TIME이 지나고, 그 텍스트를 인식한 프레임 이후의 캡처가 같은 화면임을 확인(confirm)해야 함
+      (캡처 주기가 SETTLE_TIME보다 길면 시간만으로는 글자가 더 늘어났는지 알 수 없음)
+    - 이전 텍스트에 글자가 덧붙은 경우(타자기 효과)는 growing으로 표시
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.superseded = 0  # 안정되기 전에 다른 텍스트로 바뀐 횟수 (절약된 번역 요청 수)
+        self.pending = None
+        self.pending_seq = 0
+        self.confirmed_seq = 0  # 이 프레임 번호의 화면이 이후 캡처에서도 그대로였음
+        self.changed_at = 0.0
+        self.released = True
+        self.growing = False
+
+    def update(self, text, seq, now):
+        """새 OCR 결과 반영. 내용이 바뀌었으면 True (대기 시간 다시 시작)"""
+        if self.pending is not None and _compact(text) == _compact(self.pending):
+            # 다시 인식해도 같은 텍스트 → 그 사이 바뀌지 않았음이 확인됨
+            self.confirm(seq)
+            return False
+
+        if self.pending is not None and not self.released:
+            self.superseded += 1
+        self.growing = self.pending is not None and _compact(text).startswith(_compact(self.pending))
+        self.pending = text
+        self.pending_seq = seq
+        self.changed_at = now
+        self.released = False
+        return True
+
+    def confirm(self, seq):
+        """seq 프레임의 화면이 이후 캡처에서도 바뀌지 않았음 (캡처 단계의 화면 변화 감지 결과)"""
+        if seq > self.confirmed_seq:
+            self.confirmed_seq = seq
+
+    def poll(self, now, settle_time):
+        """안정된 텍스트가 있으면 (seq, text) 반환 (한 번만). settle_time이 0이면 확인 없이 바로"""
+        if self.released or self.pending is None:
+            return None
+        if settle_time > 0 and (now - self.changed_at < settle_time or self.confirmed_seq < self.pending_seq):
+            return None
+        self.released = True
+        return self.pending_seq, self.pending
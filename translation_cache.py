@@ -0,0 +1,152 @@
+# translation_cache.py - 모든 번역 엔진이 공유하는 영구 번역 캐시 (SQLite)
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from config import get_setting
+from logger import write_log
+from metrics import increment
+
+# 메모리 LRU (디스크 내용 전체를 최근 사용 순서로 보관)
+_memory = OrderedDict()
+_touched = {}  # 마지막 커밋 이후 조회된 키 → 사용 시각 (다음 저장 시 디스크에 반영)
+_conn = None
+_lock = threading.Lock()
+cache_stats = {"hits": 0, "misses": 0}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+
+def normalize_source_text(text):
+    """캐시 키용 원문 정규화 (NFKC, 앞뒤 공백 제거, 연속 공백 축약)"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+class ErrorResult(str):
+    """
+    번역 함수가 실패 시 반환하는 안내 문자열 (오버레이에는 그대로 표시)
+    번역문 내용으로 추측하지 않고 타입으로 구분 → "(작전 실패)" 같은 정상 번역은 캐시됨
+    """
+
+
+def error_result(message):
+    return ErrorResult(message)
+
+
+def is_error_result(result):
+    """빈 결과 또는 번역 함수가 error_result()로 돌려준 안내 문자열이면 True (캐시/대체 엔진 판단용)"""
+    return not result or isinstance(result, ErrorResult)
+
+
+def _init_cache():
+    """최초 사용 시 DB를 열고 기존 항목을 메모리로 불러옴 (_lock 안에서 호출)"""
+    global _conn
+    if _conn is not None:
+        return
+    path = get_setting("TRANSLATION_CACHE_PATH", "translation_cache.db")
+    _conn = sqlite3.connect(path, check_same_thread=False)
+    _conn.execute("PRAGMA journal_mode=WAL")
+    _conn.execute("PRAGMA synchronous=NORMAL")
+    _conn.execute(
+        "CREATE TABLE IF NOT EXISTS translations ("
+        " engine TEXT, source TEXT, target TEXT, text TEXT,"
+        " translated TEXT, last_used REAL,"
+        " PRIMARY KEY (engine, source, target, text))"
+    )
+    _conn.commit()
+    rows = _conn.execute(
+        "SELECT engine, source, target, text, translated FROM translations ORDER BY last_used"
+    ).fetchall()
+    for engine, source, target, text, translated in rows:
+        _memory[(engine, source, target, text)] = translated
+    write_log(f"[💾 번역 캐시 로드] {len(_memory):,}개 항목")
+
+
+def get_cached_translation(engine, source, target, text):
+    """캐시된 번역 반환 (없으면 None)"""
+    key = (engine, source, target, normalize_source_text(text))
+    with _lock:
+        _init_cache()
+        translated = _memory.get(key)
+        if translated is None:
+            cache_stats["misses"] += 1
+            increment("cache_misses")
+            return None
+        _memory.move_to_end(key)
+        _touched[key] = time.time()
+        cache_stats["hits"] += 1
+        increment("cache_hits")
+        return translated
+
+
+def store_translation(engine, source, target, text, translated):
+    """번역 결과를 캐시에 저장하고 최대 개수를 넘으면 오래된 항목부터 삭제"""
+    if is_error_result(translated):
+        return
+    key = (engine, source, target, normalize_source_text(text))
+    now = time.time()
+    max_entries = get_setting("TRANSLATION_CACHE_MAX_ENTRIES", 20000)
+    with _lock:
+        _init_cache()
+        _memory[key] = translated
+        _memory.move_to_end(key)
+        _touched.pop(key, None)
+
+        evicted = []
+        while len(_memory) > max_entries:
+            old_key, _ = _memory.popitem(last=False)
+            _touched.pop(old_key, None)
+            evicted.append(old_key)
+
+        try:
+            _conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, translated, now)
+            )
+            if _touched:
+                _conn.executemany(
+                    "UPDATE translations SET last_used = ? "
+                    "WHERE engine = ? AND source = ? AND target = ? AND text = ?",
+                    [(used, *k) for k, used in _touched.items()]
+                )
+                _touched.clear()
+            if evicted:
+                _conn.executemany(
+                    "DELETE FROM translations WHERE engine = ? AND source = ? AND target = ? AND text = ?",
+                    evicted
+                )
+            _conn.commit()
+        except Exception as e:
+            write_log(f"[⚠️ 번역 캐시 저장 오류]: {e}", "WARNING")
+
+
+def clear_translation_cache():
+    """캐시 전체 삭제 (메모리 + 디스크)"""
+    with _lock:
+        _init_cache()
+        _memory.clear()
+        _touched.clear()
+        cache_stats["hits"] = 0
+        cache_stats["misses"] = 0
+        try:
+            _conn.execute("DELETE FROM translations")
+            _conn.commit()
+        except Exception as e:
+            write_log(f"[⚠️ 번역 캐시 삭제 오류]: {e}", "WARNING")
+    write_log("[🧹 번역 캐시 비움]")
+
+
+def get_cache_stats():
+    return {"entries": len(_memory), **cache_stats}
+
+
+def make_cache_stats_string():
+    if not get_setting("USE_TRANSLATION_CACHE", True):
+        return "💾 번역 캐시: 사용 안 함"
+    hits = cache_stats["hits"]
+    total = hits + cache_stats["misses"]
+    percent = hits / total * 100 if total else 0
+    return f"💾 번역 캐시: {len(_memory):,}개 / 적중 {hits:,}회 ({percent:.1f}%)"
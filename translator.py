@@ -1,28 +1,68 @@
 # translator.py - 제한된 언어 자동 감지 기능 추가
 import os
 import json
-import requests
+import time
 from config import get_setting, increment_token_usage
-from translator_nhn import nhn_translate
-from translator_deepl import deepl_translate
+from logger import write_log
+from metrics import record_latency
+from translator_client import EngineClient
+from translation_cache import error_result
 
 def load_openai_key():
     try:
         with open("openai.txt", encoding="utf-8") as f:
             return f.read().strip()
     except Exception as e:
-        print(f"[⚠️ OpenAI API 키 로드 오류]: {e}")
+        write_log(f"[⚠️ OpenAI API 키 로드 오류]: {e}", "WARNING")
         return ""
 
-def gpt_translate(text):
+# 세션과 키를 재사용하는 OpenAI 클라이언트
+gpt_client = EngineClient("gpt", "OpenAI", "openai.txt", load_openai_key)
+
+def _read_stream(res, on_partial, started):
+    """
+    스트리밍 응답(SSE, "data: {...}" 줄)의 조각을 이어 붙이며 지금까지의 번역을 on_partial로 전달
+    (전체 번역, 토큰 사용량) 반환
+    """
+    parts = []
+    usage = 0
+    for raw in res.iter_lines():
+        if not raw.startswith(b"data:"):
+            continue
+        payload = raw[5:].strip()
+        if payload == b"[DONE]":
+            break
+        try:
+            chunk = json.loads(payload)
+        except ValueError:
+            # 깨진 조각 하나 때문에 번역 전체를 실패로 만들지 않음
+            write_log(f"[⚠️ GPT 스트리밍 조각 해석 실패, 건너뜀]: {payload[:80]!r}", "WARNING")
+            continue
+        if chunk.get("usage"):
+            usage = chunk["usage"].get("total_tokens", 0)
+        for choice in chunk.get("choices") or []:
+            delta = (choice.get("delta") or {}).get("content")
+            if not delta:
+                continue
+            if not parts:
+                record_latency("engine.gpt.first_chunk", time.perf_counter() - started)
+            parts.append(delta)
+            on_partial("".join(parts).strip())
+    return "".join(parts).strip(), usage
+
+def gpt_translate(text, source_lang=None, on_partial=None):
+    """
+    on_partial: 지정하면 (GPT_STREAMING 켜짐) 응답을 스트리밍으로 받아 조각이 올 때마다 중간 번역을 전달
+    반환값은 항상 최종 번역 전체
+    """
     # 빈 텍스트는 번역하지 않음
     if not text:
         return ""
         
-    api_key = load_openai_key()
+    api_key = gpt_client.credentials()
     if not api_key:
-        print(f"[⚠️ OpenAI API 키가 설정되지 않았습니다]")
-        return "(OpenAI API 키가 설정되지 않았습니다)"
+        write_log(f"[⚠️ OpenAI API 키가 설정되지 않았습니다]", "WARNING")
+        return error_result("(OpenAI API 키가 설정되지 않았습니다)")
         
     headers = {
         "Content-Type": "application/json",
@@ -34,9 +74,9 @@ def gpt_translate(text):
     # 최종 대체 언어 (알 수 없는 언어일 경우)
     FALLBACK_LANG = "en"
 
-    # 자동 감지 모드 확인
-    auto_detect = get_setting("AUTO_DETECT_LANG") or False
-    source = get_setting("SOURCE_LANG") or "en"
+    # 자동 감지 모드 확인 (원본 언어를 로컬에서 이미 감지했으면 프롬프트에서 감지를 요청하지 않음)
+    auto_detect = (get_setting("AUTO_DETECT_LANG") or False) and source_lang is None
+    source = source_lang or get_setting("SOURCE_LANG") or "en"
     target = get_setting("TARGET_LANG") or "ko"
     
     # 자동 감지 모드인 경우의 프롬프트
@@ -48,63 +88,48 @@ def gpt_translate(text):
                       f"Detect the source language, but only consider these languages: "
                       f"{', '.join(LIMITED_LANGS)}. "
                       f"If the text doesn't match any of these languages, assume it's {FALLBACK_LANG}.\n\n{text}")
-            print(f"[🔍 GPT 제한된 언어 자동 감지 모드] 대상 언어: {', '.join(LIMITED_LANGS)}")
+            write_log(f"[🔍 GPT 제한된 언어 자동 감지 모드] 대상 언어: {', '.join(LIMITED_LANGS)}", "DEBUG")
         else:
             prompt = f"Translate the following text to {target}. Detect the source language automatically:\n\n{text}"
-            print(f"[🔍 GPT 모든 언어 자동 감지 모드]")
+            write_log(f"[🔍 GPT 모든 언어 자동 감지 모드]", "DEBUG")
     else:
         prompt = f"Translate the following text from {source} to {target}:\n\n{text}"
-        print(f"[🔍 GPT 번역] 원본 언어: {source}, 목표 언어: {target}")
+        write_log(f"[🔍 GPT 번역] 원본 언어: {source}, 목표 언어: {target}", "DEBUG")
 
     body = {
         "model": "gpt-3.5-turbo",
         "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.7
     }
+    stream = on_partial is not None and get_setting("GPT_STREAMING", True)
+    if stream:
+        body["stream"] = True
+        body["stream_options"] = {"include_usage": True}  # 마지막 조각에 토큰 사용량 포함
 
     try:
-        print(f"[🔍 GPT API 요청 중...]")
-        res = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=body)
+        write_log(f"[🔍 GPT API 요청 중...] 스트리밍: {stream}", "DEBUG")
+        started = time.perf_counter()
+        res = gpt_client.post(get_setting("GPT_API_URL") or "https://api.openai.com/v1/chat/completions",
+                              headers=headers, json=body, stream=stream)
         
-        print(f"[🔍 GPT API 응답 상태 코드]: {res.status_code}")
+        write_log(f"[🔍 GPT API 응답 상태 코드]: {res.status_code}", "DEBUG")
         
         if res.status_code != 200:
-            print(f"[⚠️ GPT API 오류]: {res.text}")
-            return f"(GPT 번역 실패: HTTP {res.status_code})"
+            write_log(f"[⚠️ GPT API 오류]: {res.text}", "WARNING")
+            return error_result(f"(GPT 번역 실패: HTTP {res.status_code})")
             
-        data = res.json()
-        result = data["choices"][0]["message"]["content"].strip()
-
-        usage = data.get("usage", {}).get("total_tokens", 0)
+        if stream:
+            with res:
+                result, usage = _read_stream(res, on_partial, started)
+        else:
+            data = res.json()
+            result = data["choices"][0]["message"]["content"].strip()
+            usage = data.get("usage", {}).get("total_tokens", 0)
         increment_token_usage(usage)
         
-        print(f"[✅ GPT 번역 완료] 토큰 사용량: {usage}")
+        write_log(f"[✅ GPT 번역 완료] 토큰 사용량: {usage}")
 
         return result
     except Exception as e:
-        print(f"[⚠️ GPT 예외] {e}")
-        return f"(GPT 번역 실패: {str(e)})"
-
-# 공용 번역 함수
-def translate_text(text):
-    if not text:
-        return ""
-        
-    engine = get_setting("ENGINE")
-    print(f"[🔍 번역 시작] 엔진: {engine}, 텍스트 길이: {len(text)}자")
-
-    # 자동 감지 모드 상태 로깅
-    if get_setting("AUTO_DETECT_LANG", False):
-        use_limited = get_setting("USE_LIMITED_AUTO_DETECT", True)
-        if use_limited:
-            langs = ", ".join(get_setting("LIMITED_AUTO_DETECT_LANGS", ["ko", "ja", "en", "zh-CN", "ru", "fr"]))
-            print(f"[🔍 제한된 언어 자동 감지 활성화됨] 대상 언어: {langs}")
-        else:
-            print(f"[🔍 모든 언어 자동 감지 활성화됨]")
-    
-    if engine == "papago-nhn":
-        return nhn_translate(text)
-    elif engine == "deepl":
-        return deepl_translate(text)
-    else:
-        return gpt_translate(text)
\ No newline at end of file
+        write_log(f"[⚠️ GPT 예외] {e}", "WARNING")
+        return error_result(f"(GPT 번역 실패: {str(e)})")
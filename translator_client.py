@@ -0,0 +1,155 @@
+# translator_client.py - 번역 엔진별 HTTP 세션/인증 정보 관리
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from config import get_setting
+from logger import write_log
+
+# 엔진 이름("papago-nhn" 등) → EngineClient
+engine_clients = {}
+
+DEFAULT_TIMEOUT = (3.05, 10.0)  # (연결, 응답) 제한 시간 (초)
+# 키 오류/권한 없음/사용량 초과(DeepL 456) - 다시 보내도 실패하므로 실패로 기록
+AUTH_FAILURE_STATUS = (401, 403, 456)
+
+
+def get_engine_client(engine):
+    return engine_clients.get(engine)
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 일정 횟수를 넘으면 엔진을 잠시 차단 (open)
+    - 대기 시간이 지나면 한 번만 시험 요청을 허용 (half-open)
+    - 시험 요청이 성공하면 다시 정상 상태 (closed)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.state = "closed"
+        self.opened_at = 0.0
+
+    def available(self):
+        """allow()와 같은 판단이지만 상태를 바꾸지 않음 (half-open 시험 기회를 쓰지 않고 미리 확인할 때)"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            return self.state == "open" and time.time() - self.opened_at >= get_setting("BREAKER_COOLDOWN", 30.0)
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.time() - self.opened_at >= get_setting("BREAKER_COOLDOWN", 30.0):
+                self.state = "half-open"
+                write_log(f"[🔌 {self.name} 차단 해제 시험 요청]", "DEBUG")
+                return True
+            return False
+
+    def release(self):
+        """
+        allow()로 받은 시험 요청을 보내지 않고 끝났을 때 (키 없음, 같은 언어/의미 없는 텍스트 생략 등)
+        결과가 기록되지 않아 half-open에 머무르지 않도록, 다음 호출이 다시 시험하게 되돌림
+        """
+        with self._lock:
+            if self.state == "half-open":
+                self.state = "open"
+                self.opened_at = time.time() - get_setting("BREAKER_COOLDOWN", 30.0)
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                write_log(f"[✅ {self.name} 차단 해제]")
+            self.failures = 0
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half-open" or self.failures >= get_setting("BREAKER_FAILURE_THRESHOLD", 3):
+                self._open()
+
+    def trip(self):
+        """요청 한도 초과(429) 등 즉시 차단해야 하는 경우"""
+        with self._lock:
+            self.failures += 1
+            self._open()
+
+    def _open(self):
+        self.state = "open"
+        self.opened_at = time.time()
+        write_log(f"[⛔ {self.name} 일시 차단] 연속 실패: {self.failures}회", "WARNING")
+
+
+class EngineClient:
+    """
+    번역 엔진 하나에 대한 클라이언트
+    - keep-alive 연결을 재사용하는 requests.Session 보관 (매 요청마다 TCP/TLS 핸드셰이크 방지)
+    - 키 파일은 한 번만 읽고, 파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽음
+    - 모든 요청에 엔진별 제한 시간을 적용하고 결과를 회로 차단기에 기록
+    """
+
+    def __init__(self, engine, name, key_file, loader, pool_size=4):
+        self.engine = engine
+        self.name = name
+        self.key_file = key_file
+        self.loader = loader
+        self.breaker = CircuitBreaker(name)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._credentials = None
+        self._loaded = False
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        engine_clients[engine] = self
+
+    def _key_file_mtime(self):
+        try:
+            return os.stat(self.key_file).st_mtime
+        except OSError:
+            return None
+
+    def credentials(self):
+        """캐시된 인증 정보 반환 (키 파일이 바뀌었으면 다시 로드)"""
+        mtime = self._key_file_mtime()
+        with self._lock:
+            if not self._loaded or mtime != self._mtime:
+                self._credentials = self.loader()
+                self._mtime = mtime
+                self._loaded = True
+                write_log(f"[🔑 {self.name} 인증 정보 로드]")
+            return self._credentials
+
+    def invalidate(self):
+        """다음 요청 때 인증 정보를 강제로 다시 읽음"""
+        with self._lock:
+            self._loaded = False
+
+    def timeout(self):
+        """설정된 (연결, 응답) 제한 시간"""
+        timeouts = get_setting("ENGINE_TIMEOUTS", {}) or {}
+        return tuple(timeouts.get(self.engine, DEFAULT_TIMEOUT))
+
+    def post(self, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout())
+        try:
+            res = self.session.post(url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.breaker.record_failure()
+            raise
+
+        if res.status_code == 429:
+            self.breaker.trip()
+        elif res.status_code >= 500 or res.status_code in AUTH_FAILURE_STATUS:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return res
@@ -1,5 +1,7 @@
-import requests
 from config import get_setting, increment_deepl_usage
+from logger import write_log
+from translator_client import EngineClient
+from translation_cache import error_result
 
 # DeepL API 키 로드 함수
 def load_deepl_key():
@@ -7,9 +9,30 @@ def load_deepl_key():
         with open("deepl.txt", encoding="utf-8") as f:
             return f.read().strip()
     except Exception as e:
-        print(f"[⚠️ DeepL API 키 로드 오류]: {e}")
+        write_log(f"[⚠️ DeepL API 키 로드 오류]: {e}", "WARNING")
         return ""
 
+# DeepL API 언어 코드로 변환
+DEEPL_LANGS = {
+    "ko": "KO",
+    "en": "EN",
+    "ja": "JA",
+    "zh-cn": "ZH",
+    "zh-CN": "ZH",
+    "zh": "ZH",
+    "ru": "RU",
+    "fr": "FR",
+    "es": "ES",
+    "de": "DE",
+    "pt": "PT",
+    "it": "IT",
+    "nl": "NL",
+    "pl": "PL"
+}
+
+# 세션과 키를 재사용하는 DeepL 클라이언트
+deepl_client = EngineClient("deepl", "DeepL", "deepl.txt", load_deepl_key)
+
 # 언어 코드 정규화 함수 추가
 def normalize_lang_code(lang_code):
     """언어 코드를 정규화하여 다양한 형식의 언어 코드를 통일된 형식으로 변환"""
@@ -25,42 +48,16 @@ def normalize_lang_code(lang_code):
         
     return lang_code
 
-# DeepL API를 이용한 번역 함수 (source_lang 매개변수 추가)
-def deepl_translate(text, source_lang=None):
-    # 빈 텍스트는 번역하지 않음
-    if not text:
-        return ""
-    
-    # DeepL API 키 가져오기
-    api_key = load_deepl_key()
-    if not api_key:
-        print(f"[⚠️ DeepL API 키가 설정되지 않았습니다]")
-        return "(DeepL API 키가 설정되지 않았습니다)"
-    
+DEEPL_URL = "https://api-free.deepl.com/v2/translate"
+
+# 최종 대체 언어 (알 수 없는 언어일 경우)
+FALLBACK_LANG = "en"
+
+def resolve_deepl_langs(source_lang=None):
+    """설정/인자로부터 DeepL 형식의 (소스, 타겟) 언어 코드 결정 (소스 None = 자동 감지)"""
     # 제한된 자동 감지 지원 언어
     LIMITED_LANGS = get_setting("LIMITED_AUTO_DETECT_LANGS") or ["ko", "ja", "en", "zh-CN", "zh", "ru", "fr"]
     
-    # DeepL API 언어 코드로 변환
-    DEEPL_LANGS = {
-        "ko": "KO",
-        "en": "EN",
-        "ja": "JA",
-        "zh-cn": "ZH",
-        "zh-CN": "ZH",
-        "zh": "ZH",
-        "ru": "RU",
-        "fr": "FR",
-        "es": "ES",
-        "de": "DE",
-        "pt": "PT",
-        "it": "IT",
-        "nl": "NL",
-        "pl": "PL"
-    }
-    
-    # 최종 대체 언어 (알 수 없는 언어일 경우)
-    FALLBACK_LANG = "en"
-    
     # 환경 설정에서 언어 설정 가져오기
     if source_lang is None:
         auto_detect = get_setting("AUTO_DETECT_LANG") or False
@@ -69,43 +66,45 @@ def deepl_translate(text, source_lang=None):
             use_limited = get_setting("USE_LIMITED_AUTO_DETECT") or True
             if use_limited:
                 source_lang = None
-                print(f"[🔍 DeepL 제한된 언어 자동 감지 사용] 대상 언어: {', '.join(LIMITED_LANGS)}")
+                write_log(f"[🔍 DeepL 제한된 언어 자동 감지 사용] 대상 언어: {', '.join(LIMITED_LANGS)}", "DEBUG")
             else:
                 source_lang = None
-                print(f"[🔍 DeepL 모든 언어 자동 감지 사용]")
+                write_log(f"[🔍 DeepL 모든 언어 자동 감지 사용]", "DEBUG")
         else:
             source_lang = get_setting("SOURCE_LANG")
-            print(f"[🔍 DeepL 소스 언어]: {source_lang}")
+            write_log(f"[🔍 DeepL 소스 언어]: {source_lang}", "DEBUG")
     else:
         if source_lang == "auto":
             source_lang = None
-            print(f"[🔍 DeepL 언어 자동 감지 사용]")
+            write_log(f"[🔍 DeepL 언어 자동 감지 사용]", "DEBUG")
         else:
-            print(f"[🔍 DeepL 소스 언어 (수동 지정)]: {source_lang}")
+            write_log(f"[🔍 DeepL 소스 언어 (수동 지정)]: {source_lang}", "DEBUG")
     
     target_lang = get_setting("TARGET_LANG")
     
     # DeepL API 형식에 맞게 언어 코드 변환
     deepl_target = DEEPL_LANGS.get(target_lang, "EN")
     deepl_source = None if source_lang is None else DEEPL_LANGS.get(source_lang, "EN")
-    
-    # 같은 언어면 번역 스킵
-    if deepl_source and deepl_source == deepl_target:
-        print(f"[🔍 DeepL 번역 스킵] 소스와 타겟이 동일: {deepl_source}")
-        return text
-    
-    print(f"[🔍 DeepL 타겟 언어]: {deepl_target}")
-    
-    # DeepL API 요청 URL 및 헤더
-    url = "https://api-free.deepl.com/v2/translate"
+    return deepl_source, deepl_target
+
+def is_allowed_detected_lang(detected_lang):
+    """제한된 자동 감지 모드에서 감지된 언어가 허용 목록에 있는지 확인"""
+    if not get_setting("USE_LIMITED_AUTO_DETECT", True):
+        return True
+    LIMITED_LANGS = get_setting("LIMITED_AUTO_DETECT_LANGS") or ["ko", "ja", "en", "zh-CN", "zh", "ru", "fr"]
+    # 언어 코드 정규화 (제한 목록의 언어 코드도 정규화하여 비교)
+    normalized_limited_langs = [normalize_lang_code(lang) for lang in LIMITED_LANGS]
+    return normalize_lang_code(detected_lang) in normalized_limited_langs
+
+def _deepl_request(api_key, texts, deepl_source, deepl_target):
     headers = {
         "Authorization": f"DeepL-Auth-Key {api_key}",
         "Content-Type": "application/json"
     }
     
-    # API 요청 데이터 준비
+    # API 요청 데이터 준비 (text는 여러 개를 한 번에 보낼 수 있음)
     data = {
-        "text": [text],
+        "text": list(texts),
         "target_lang": deepl_target
     }
     
@@ -114,18 +113,41 @@ def deepl_translate(text, source_lang=None):
         data["source_lang"] = deepl_source
     
     # 디버그 로그 추가
-    print(f"[🔍 DeepL API 요청 준비] 대상 언어: {deepl_target}, 소스 언어: {'자동 감지' if deepl_source is None else deepl_source}")
+    write_log(f"[🔍 DeepL API 요청 준비] 대상 언어: {deepl_target}, 소스 언어: {'자동 감지' if deepl_source is None else deepl_source}, 문장 수: {len(data['text'])}", "DEBUG")
+    write_log(f"[🔍 DeepL API 요청 중...]", "DEBUG")
+    response = deepl_client.post(DEEPL_URL, headers=headers, json=data)
+    write_log(f"[🔍 DeepL API 응답 상태 코드]: {response.status_code}", "DEBUG")
+    return response
+
+# DeepL API를 이용한 번역 함수 (source_lang 매개변수 추가)
+def deepl_translate(text, source_lang=None):
+    # 빈 텍스트는 번역하지 않음
+    if not text:
+        return ""
+    
+    # DeepL API 키 가져오기
+    api_key = deepl_client.credentials()
+    if not api_key:
+        write_log(f"[⚠️ DeepL API 키가 설정되지 않았습니다]", "WARNING")
+        return error_result("(DeepL API 키가 설정되지 않았습니다)")
+    
+    deepl_source, deepl_target = resolve_deepl_langs(source_lang)
+    
+    # 같은 언어면 번역 스킵
+    if deepl_source and deepl_source == deepl_target:
+        write_log(f"[🔍 DeepL 번역 스킵] 소스와 타겟이 동일: {deepl_source}", "DEBUG")
+        return text
+    
+    write_log(f"[🔍 DeepL 타겟 언어]: {deepl_target}", "DEBUG")
     
     # DeepL API 호출
     try:
-        print(f"[🔍 DeepL API 요청 중...]")
-        response = requests.post(url, headers=headers, json=data)
-        print(f"[🔍 DeepL API 응답 상태 코드]: {response.status_code}")
+        response = _deepl_request(api_key, [text], deepl_source, deepl_target)
         
         # 응답 코드 확인
         if response.status_code != 200:
-            print(f"[⚠️ DeepL API 오류]: {response.text}")
-            return f"(DeepL 번역 실패: HTTP {response.status_code})"
+            write_log(f"[⚠️ DeepL API 오류]: {response.text}", "WARNING")
+            return error_result(f"(DeepL 번역 실패: HTTP {response.status_code})")
         
         # 응답 처리
         result = response.json()
@@ -137,34 +159,67 @@ def deepl_translate(text, source_lang=None):
             
             # 자동 감지된 언어 확인 및 제한된 언어 목록 체크
             if deepl_source is None:
-                print(f"[🔍 DeepL 감지된 언어]: {detected_lang}")
+                write_log(f"[🔍 DeepL 감지된 언어]: {detected_lang}", "DEBUG")
                 
-                # 제한된 자동 감지 모드인 경우
-                use_limited = get_setting("USE_LIMITED_AUTO_DETECT", True)
-                if use_limited:
-                    # 언어 코드 정규화 (수정된 부분)
-                    detected_lower = normalize_lang_code(detected_lang)
-                    
-                    # 제한 목록의 언어 코드도 정규화하여 비교
-                    normalized_limited_langs = [normalize_lang_code(lang) for lang in LIMITED_LANGS]
-                    
-                    # 감지된 언어가 제한 목록에 없는 경우
-                    if detected_lower not in normalized_limited_langs:
-                        print(f"[⚠️ 감지된 언어({detected_lang})가 제한 목록에 없습니다. 영어로 재시도합니다.]")
-                        # 영어로 가정하고 다시 번역
-                        return deepl_translate(text, source_lang=FALLBACK_LANG)
+                # 감지된 언어가 제한 목록에 없는 경우
+                if not is_allowed_detected_lang(detected_lang):
+                    write_log(f"[⚠️ 감지된 언어({detected_lang})가 제한 목록에 없습니다. 영어로 재시도합니다.]", "WARNING")
+                    # 영어로 가정하고 다시 번역
+                    return deepl_translate(text, source_lang=FALLBACK_LANG)
             
             # 번역된 텍스트 길이에 따라 사용량 증가
             increment_deepl_usage(len(text))
-            print(f"[✅ DeepL 번역 완료] 결과 길이: {len(translated_text)}자")
+            write_log(f"[✅ DeepL 번역 완료] 결과 길이: {len(translated_text)}자")
             
             return translated_text
         else:
-            print(f"[⚠️ DeepL 번역 결과 없음]")
-            return "(DeepL 번역 결과 없음)"
+            write_log(f"[⚠️ DeepL 번역 결과 없음]", "WARNING")
+            return error_result("(DeepL 번역 결과 없음)")
+    except Exception as e:
+        write_log(f"[⚠️ DeepL 예외] {e}", "WARNING")
+        return error_result(f"(DeepL 번역 실패: {str(e)})")
+
+# 여러 문장을 한 번의 요청으로 번역 (실패 시 None)
+def deepl_translate_batch(texts, source_lang=None):
+    if not texts:
+        return []
+    
+    api_key = deepl_client.credentials()
+    if not api_key:
+        write_log("[⚠️ DeepL API 키가 설정되지 않았습니다]", "WARNING")
+        return None
+    
+    deepl_source, deepl_target = resolve_deepl_langs(source_lang)
+    if deepl_source and deepl_source == deepl_target:
+        write_log(f"[🔍 DeepL 번역 스킵] 소스와 타겟이 동일: {deepl_source}", "DEBUG")
+        return list(texts)
+    
+    try:
+        response = _deepl_request(api_key, texts, deepl_source, deepl_target)
+        if response.status_code != 200:
+            write_log(f"[⚠️ DeepL API 오류]: {response.text}", "WARNING")
+            return None
+        
+        translations = response.json().get("translations", [])
+        if len(translations) != len(texts):
+            write_log(f"[⚠️ DeepL 일괄 번역 결과 개수 불일치] 요청: {len(texts)}, 응답: {len(translations)}", "WARNING")
+            return None
+        
+        results = []
+        for text, item in zip(texts, translations):
+            detected_lang = item.get("detected_source_language", "")
+            if deepl_source is None and not is_allowed_detected_lang(detected_lang):
+                write_log(f"[⚠️ 감지된 언어({detected_lang})가 제한 목록에 없습니다. 영어로 재시도합니다.]", "WARNING")
+                results.append(deepl_translate(text, source_lang=FALLBACK_LANG))
+            else:
+                results.append(item.get("text", ""))
+        
+        increment_deepl_usage(sum(len(text) for text in texts))
+        write_log(f"[✅ DeepL 일괄 번역 완료] 문장 수: {len(texts)}")
+        return results
     except Exception as e:
-        print(f"[⚠️ DeepL 예외] {e}")
-        return f"(DeepL 번역 실패: {str(e)})"
+        write_log(f"[⚠️ DeepL 예외] {e}", "WARNING")
+        return None
 
 # DeepL API용 언어 코드 변환 함수 (필요한 경우 참조용)
 def convert_deepl_lang_code(lang_code):
@@ -1,21 +1,423 @@
-from translator import translate_text as _translate_text
+import threading
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from translator import gpt_translate
+from translator_nhn import nhn_translate
+from translator_deepl import deepl_translate, deepl_translate_batch
+from translator_libre import libre_translate
+from translator_mock import mock_translate
+from translator_client import get_engine_client
+from translation_cache import get_cached_translation, store_translation, is_error_result, error_result
+from text_segments import split_segments, join_segments
+from lang_detect import detect_source_lang, same_language, detection_candidates, easyocr_lang_list
+from logger import write_log
+from metrics import timed, increment, latency_percentile
 
-def translate_text(text):
+# 엔진 이름 → 번역 함수
+ENGINE_FUNCTIONS = {
+    "papago-nhn": nhn_translate,
+    "deepl": deepl_translate,
+    "gpt": gpt_translate,
+    "libretranslate": libre_translate,
+    "mock": mock_translate,  # 벤치마크/재생 테스트용
+}
+# 중간 번역을 조각 단위로 전달할 수 있는 엔진 (on_partial 인자 지원)
+STREAMING_ENGINES = {"gpt"}
+
+def get_engine_chain():
+    """현재 엔진을 먼저 시도하고, 실패 시 대체 엔진을 순서대로 시도"""
+    from config import get_setting
+
+    engine = get_setting("ENGINE")
+    chain = [engine]
+    if get_setting("USE_ENGINE_FAILOVER", False):
+        for fallback in get_setting("ENGINE_FALLBACK_CHAIN", []) or []:
+            if fallback not in chain:
+                chain.append(fallback)
+    return chain
+
+def _translate_with(engine, text, source_lang=None, on_partial=None):
+    translate = ENGINE_FUNCTIONS.get(engine, gpt_translate)
+    increment(f"api_calls.{engine}")
+    increment("api_chars_sent", len(text))
+    try:
+        with timed(f"engine.{engine}"):
+            if on_partial and engine in STREAMING_ENGINES:
+                return translate(text, source_lang=source_lang, on_partial=on_partial)
+            return translate(text, source_lang=source_lang)
+    finally:
+        _release_breaker(engine)
+
+def _release_breaker(engine):
+    """요청을 보내지 않고 끝난 경우 (키 없음, 번역 생략) 차단기의 시험 요청 기회를 되돌림"""
+    client = get_engine_client(engine)
+    if client:
+        client.breaker.release()
+
+def _cache_langs(source_lang=None):
+    """캐시 키에 쓰는 (원본, 목표) 언어 (로컬에서 감지한 언어가 있으면 그 언어)"""
+    from config import get_setting
+
+    source = source_lang or ("auto" if get_setting("AUTO_DETECT_LANG", False) else get_setting("SOURCE_LANG"))
+    return source, get_setting("TARGET_LANG")
+
+def _is_target_language(text, source_lang):
+    """원본 언어가 목표 언어와 같으면 (예: 한국어 → 한국어) 요청 없이 원문 그대로 사용"""
+    from config import get_setting
+
+    if same_language(source_lang, get_setting("TARGET_LANG")):
+        increment("same_lang_skipped")
+        write_log(f"[⏭️ 원본과 목표 언어가 같아 번역 생략] {source_lang}", "DEBUG")
+        return True
+    return False
+
+def _is_engine_available(engine, reserve=True):
+    """
+    사용량 한도/차단기 확인
+    reserve=False: 실제로 요청할지 아직 모를 때 - 차단기의 half-open 시험 기회를 쓰지 않고 확인만
+    """
+    from config import is_usage_limit_reached
+
+    if is_usage_limit_reached(engine):
+        write_log(f"[⏭️ {engine} 사용량 한도 도달, 다음 엔진으로]", "DEBUG")
+        return False
+
+    client = get_engine_client(engine)
+    if client and not (client.breaker.allow() if reserve else client.breaker.available()):
+        write_log(f"[⏭️ {engine} 일시 차단 상태, 다음 엔진으로]", "DEBUG")
+        return False
+    return True
+
+# 동시에 실행 중일 수 있는 보조(헤지) 요청 수 상한
+# 진 쪽 요청은 취소할 수 없어 응답이 올 때까지 남으므로, 멈춘 요청이 쌓이면 새 헤지는 보내지 않음
+# (주 엔진 요청은 호출마다 별도 스레드에서 실행되어 이 상한에 막히지 않음)
+HEDGE_MAX_IN_FLIGHT = 4
+_hedge_slots = threading.BoundedSemaphore(HEDGE_MAX_IN_FLIGHT)
+
+def _start_request(engine, text, source_lang, on_partial=None, on_done=None):
+    """번역 요청을 새 데몬 스레드에서 실행하고 Future 반환 (예외도 Future에 담김)"""
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(_translate_with(engine, text, source_lang, on_partial))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            if on_done:
+                on_done()
+
+    threading.Thread(target=run, name=f"translate-hedge-{engine}", daemon=True).start()
+    return future
+
+def _request_result(engine, future):
+    """완료된 요청의 결과 (요청 중 예외가 났으면 실패 결과로 바꿈)"""
+    try:
+        return future.result()
+    except Exception as e:
+        write_log(f"[⚠️ {engine} 번역 요청 예외]: {e}", "WARNING")
+        return error_result(f"({engine} 번역 실패: {e})")
+
+def _hedge_plan(engine):
+    """
+    (대기 시간, 보조 엔진) - 헤지하지 않으면 None
+    대기 시간: 주 엔진의 최근 처리 시간 HEDGE_PERCENTILE 분위수 (기록이 HEDGE_MIN_SAMPLES개 미만이면 헤지 안 함)
+    보조 엔진: HEDGE_ENGINE, 없으면 ENGINE_FALLBACK_CHAIN에서 다음으로 사용 가능한 엔진
+    (USE_ENGINE_FAILOVER와 관계없이 대체 엔진 목록을 직접 읽음)
+    """
     from config import get_setting
-    
-    # LibreTranslate 엔진 추가
-    if get_setting("ENGINE") == "libretranslate":
-        from translator_libre import libre_translate
-        return libre_translate(text)
+
+    if not get_setting("USE_HEDGED_REQUESTS", False):
+        return None
+    delay = latency_percentile(
+        f"engine.{engine}", get_setting("HEDGE_PERCENTILE", 0.95), get_setting("HEDGE_MIN_SAMPLES", 20)
+    )
+    if delay is None:
+        return None
+
+    hedge_engine = get_setting("HEDGE_ENGINE")
+    candidates = [hedge_engine] if hedge_engine else get_setting("ENGINE_FALLBACK_CHAIN", []) or []
+    for secondary in candidates:
+        # 헤지가 실제로 나갈지는 아직 모르므로 차단기 상태를 바꾸지 않고 확인만
+        if secondary != engine and secondary in ENGINE_FUNCTIONS and _is_engine_available(secondary, reserve=False):
+            return max(delay, get_setting("HEDGE_MIN_DELAY", 0.2)), secondary
+
+    if not candidates:
+        write_log("[⏭️ 헤지 안 함] HEDGE_ENGINE과 ENGINE_FALLBACK_CHAIN이 모두 비어 있음", "DEBUG")
     else:
-        return _translate_text(text)
+        write_log(f"[⏭️ 헤지 안 함] 사용 가능한 보조 엔진 없음: {candidates}", "DEBUG")
+    return None
+
+def _translate_hedged(engine, text, source_lang, on_partial, cache_langs):
+    """
+    주 엔진이 평소보다 늦으면 같은 텍스트를 보조 엔진에도 보내고 먼저 성공한 결과 사용
+    (엔진, 번역, 함께 시도한 엔진 목록) 반환. 진 쪽 요청은 취소할 수 없으므로 끝나면 캐시에만 저장
+    """
+    plan = _hedge_plan(engine)
+    if plan is None:
+        return engine, _translate_with(engine, text, source_lang, on_partial), [engine]
+    delay, secondary = plan
+
+    # 결과가 정해진 뒤에는 스트리밍 중간 결과가 최종 번역을 덮어쓰지 않도록 막음
+    decided = threading.Event()
+    partial_lock = threading.Lock()
+
+    def guarded_partial(partial):
+        with partial_lock:
+            if not decided.is_set():
+                on_partial(partial)
+
+    primary = _start_request(engine, text, source_lang, guarded_partial if on_partial else None)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        # 제시간에 응답 (실패했으면 일반 대체 엔진 처리에 맡김)
+        return engine, _request_result(engine, primary), [engine]
+
+    # 이전 헤지 요청들이 아직 끝나지 않았으면 더 쌓지 않고 주 엔진만 기다림
+    if not _hedge_slots.acquire(blocking=False):
+        increment("hedges_skipped_busy")
+        write_log(f"[⏭️ 헤지 안 함] 보조 요청 {HEDGE_MAX_IN_FLIGHT}개가 아직 실행 중", "DEBUG")
+        return engine, _request_result(engine, primary), [engine]
+
+    # 헤지 요청을 보내는 시점에 차단기 허가를 받음 (그사이 차단되었으면 주 엔진만 기다림)
+    if not _is_engine_available(secondary):
+        _hedge_slots.release()
+        return engine, _request_result(engine, primary), [engine]
+
+    increment(f"hedges.{secondary}")
+    write_log(f"[🏁 {engine} 응답 지연 ({delay:.2f}s 초과), {secondary}에도 요청]", "DEBUG")
+    hedge = _start_request(secondary, text, source_lang, on_done=_hedge_slots.release)
+    futures = {primary: engine, hedge: secondary}
+
+    winner = None
+    results = {}
+    errors = {}
+    pending = set(futures)
+    while pending and winner is None:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[future] = _request_result(futures[future], future)
+            if is_error_result(results[future]):
+                errors[futures[future]] = results[future]
+            elif winner is None:
+                winner = future
+
+    with partial_lock:
+        decided.set()
+
+    # 아직 실행 중인 쪽은 결과를 버리지 않고 캐시에 저장 (이미 사용량을 쓴 요청)
+    for future in pending:
+        future.add_done_callback(lambda f, loser=futures[future]: _store_late_result(loser, text, cache_langs, f))
+
+    if winner is None:
+        # 둘 다 실패: 주 엔진의 실패는 호출 측에서 기록
+        increment(f"api_failures.{secondary}")
+        return engine, errors[engine], list(futures.values())
+
+    for failed in errors:
+        increment(f"api_failures.{failed}")
+    if futures[winner] == secondary:
+        increment(f"hedge_wins.{secondary}")
+        write_log(f"[🏁 헤지 요청 {secondary}가 먼저 응답]", "DEBUG")
+    return futures[winner], results[winner], list(futures.values())
+
+def _store_late_result(engine, text, cache_langs, future):
+    from config import get_setting
+
+    try:
+        result = future.result()
+    except Exception:
+        return
+    if not is_error_result(result) and get_setting("USE_TRANSLATION_CACHE", True):
+        store_translation(engine, *cache_langs, text, result)
+
+def translate_text(text, checked_engine=None, source_lang=None, on_partial=None):
+    """
+    캐시 → 현재 엔진 → 대체 엔진 순으로 번역
+    checked_engine: 호출자가 이미 캐시를 조회한 엔진 (중복 조회 방지)
+    source_lang: 호출자가 이미 감지한 원본 언어 (None이면 여기서 로컬 감지)
+    on_partial: 스트리밍 엔진이면 번역 도중의 중간 결과를 받을 함수
+    """
+    return _translate_text(text, checked_engine, source_lang, on_partial)[1]
+
+def _translate_text(text, checked_engine=None, source_lang=None, on_partial=None):
+    """translate_text()와 같지만 (번역한 엔진, 번역) 반환 (캐시 적중이면 그 엔진, 번역하지 않았으면 None)"""
+    from config import get_setting
+
+    if not text:
+        return None, ""
+
+    if source_lang is None:
+        source_lang = detect_source_lang(text)
+    if _is_target_language(text, source_lang):
+        return None, text
+
+    use_cache = get_setting("USE_TRANSLATION_CACHE", True)
+    # 캐시 키: 엔진, 원본/목표 언어, 정규화된 원문
+    source, target = _cache_langs(source_lang)
+
+    translated = ""
+    tried = set()
+    for engine in get_engine_chain():
+        if engine in tried:
+            continue
+        if use_cache and engine != checked_engine:
+            cached = get_cached_translation(engine, source, target, text)
+            if cached is not None:
+                write_log(f"[💾 번역 캐시 적중] 엔진: {engine}, 텍스트 길이: {len(text)}자", "DEBUG")
+                return engine, cached
+
+        if not _is_engine_available(engine):
+            continue
+
+        write_log(f"[🔍 번역 시작] 엔진: {engine}, 텍스트 길이: {len(text)}자", "DEBUG")
+        if not tried:
+            # 첫 엔진만 헤지 (대체 엔진으로 넘어간 뒤에는 이미 느려진 상태)
+            winner, translated, attempted = _translate_hedged(engine, text, source_lang, on_partial, (source, target))
+            tried.update(attempted)
+        else:
+            winner, translated = engine, _translate_with(engine, text, source_lang, on_partial)
+            tried.add(engine)
+        if not is_error_result(translated):
+            if use_cache:
+                store_translation(winner, source, target, text, translated)
+            return winner, translated
+
+        write_log(f"[⚠️ {engine} 번역 실패, 다음 엔진으로]: {translated}", "WARNING")
+        increment(f"api_failures.{engine}")
+
+    return None, translated or error_result("(사용 가능한 번역 엔진이 없습니다)")
+
+# 세그먼트 재사용 통계
+segment_stats = {"reused": 0, "translated": 0, "chars_sent": 0}
+
+def _translate_lines(segments, source_lang, on_partial):
+    """
+    새 세그먼트 여러 개를 줄바꿈으로 묶어 한 번의 요청으로 번역 (세그먼트마다 왕복하지 않도록)
+    (번역한 엔진, 세그먼트별 번역 목록, 세그먼트별로 나뉘었는지) 반환
+    번역 결과의 줄 수가 세그먼트 수와 다르면 (엔진이 줄을 합침) 나눌 수 없으므로
+    이미 받은 번역 전체를 첫 세그먼트 자리에 두고 나머지는 비움 (다시 요청하지 않음)
+    """
+    partial = None
+    if on_partial:
+        partial = lambda text: on_partial([line.strip() for line in text.split("\n")])
+    engine, translated = _translate_text("\n".join(segments), source_lang=source_lang, on_partial=partial)
+    if is_error_result(translated):
+        # 실패 안내는 한 번만 표시
+        return engine, [translated] + [""] * (len(segments) - 1), False
+
+    lines = [line.strip() for line in translated.split("\n") if line.strip()]
+    if len(lines) != len(segments):
+        increment("segment_batch_mismatch")
+        write_log(f"[⚠️ 묶음 번역 줄 수 불일치] 요청: {len(segments)}줄, 응답: {len(lines)}줄 → 묶음 전체를 한 번역으로 사용", "DEBUG")
+        return engine, ["\n".join(lines)] + [""] * (len(segments) - 1), False
+    return engine, lines, True
+
+def translate_segments(segments, source_lang=None, on_partial=None):
+    """
+    세그먼트 목록 번역 - 캐시에 있는 세그먼트는 재사용하고 새 세그먼트만 번역
+    새 세그먼트는 한 번의 요청으로 묶어서 보냄 (DeepL은 여러 text, 그 외 엔진은 줄바꿈으로 연결)
+    source_lang: 전체 텍스트에서 감지한 원본 언어
+    on_partial: 스트리밍 중 세그먼트별 현재 결과 목록(아직 없으면 None)을 받을 함수
+    """
+    from config import get_setting
+
+    use_cache = get_setting("USE_TRANSLATION_CACHE", True)
+    engine = get_setting("ENGINE")
+    source, target = _cache_langs(source_lang)
+
+    results = [None] * len(segments)
+    pending = []
+    for i, segment in enumerate(segments):
+        cached = get_cached_translation(engine, source, target, segment) if use_cache else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    segment_stats["reused"] += len(segments) - len(pending)
+    segment_stats["translated"] += len(pending)
+    segment_stats["chars_sent"] += sum(len(segments[i]) for i in pending)
+    write_log(f"[🧩 세그먼트 번역] 전체: {len(segments)}개, 재사용: {len(segments) - len(pending)}개, 새로 번역: {len(pending)}개", "DEBUG")
+
+    # DeepL은 여러 text를 한 요청으로 번역 가능
+    if engine == "deepl" and len(pending) > 1 and _is_engine_available(engine):
+        increment("api_calls.deepl")
+        increment("api_chars_sent", sum(len(segments[i]) for i in pending))
+        try:
+            with timed("engine.deepl"):
+                batch = deepl_translate_batch([segments[i] for i in pending], source_lang=source_lang)
+        finally:
+            _release_breaker("deepl")
+        if batch is None:
+            increment("api_failures.deepl")
+        if batch is not None:
+            for i, translated in zip(pending, batch):
+                results[i] = translated
+                if use_cache:
+                    store_translation(engine, source, target, segments[i], translated)
+            pending = [i for i in pending if is_error_result(results[i])]
+
+    if len(pending) > 1:
+        def batch_partial(lines):
+            current = list(results)
+            for i, line in zip(pending, lines):
+                current[i] = line
+            on_partial(current)
+
+        answered, batch, split = _translate_lines(
+            [segments[i] for i in pending], source_lang, batch_partial if on_partial else None
+        )
+        for i, translated in zip(pending, batch):
+            results[i] = translated
+            # 세그먼트별로 나뉜 번역만 캐시 (묶음 전체는 translate_text가 실제로 번역한 엔진으로 캐시함)
+            if use_cache and split and answered and not is_error_result(translated):
+                store_translation(answered, source, target, segments[i], translated)
+        pending = []
+
+    for i in pending:
+        partial = None
+        if on_partial:
+            partial = lambda text, i=i: on_partial([text if j == i else result for j, result in enumerate(results)])
+        results[i] = translate_text(
+            segments[i], checked_engine=engine if use_cache else None, source_lang=source_lang, on_partial=partial
+        )
+
+    return results
+
+def translate_text_segmented(text, on_partial=None):
+    """
+    OCR 텍스트를 세그먼트로 나누어 번역한 뒤 다시 합침
+    on_partial: 스트리밍 엔진이면 지금까지 번역된 부분을 합친 텍스트를 받을 함수
+    """
+    from config import get_setting
+
+    mode = get_setting("SEGMENT_MODE", "sentence")
+    if not text or mode == "off":
+        return translate_text(text, on_partial=on_partial)
+
+    # 언어는 전체 텍스트로 한 번만 감지 (짧은 세그먼트는 판단이 흔들림)
+    source_lang = detect_source_lang(text)
+    if _is_target_language(text, source_lang):
+        return text
+
+    segments, separators = split_segments(text, mode)
+    if len(segments) <= 1:
+        return translate_text(text, source_lang=source_lang, on_partial=on_partial)
+
+    partial = None
+    if on_partial:
+        partial = lambda parts: on_partial(join_segments(parts, separators))
+    results = translate_segments(segments, source_lang, partial)
+    joined = join_segments(results, separators)
+    # 일부 세그먼트라도 실패했으면 합친 결과도 실패로 표시 (중복 재사용 목록에 넣지 않음)
+    return error_result(joined) if any(is_error_result(r) for r in results) else joined
 
 def get_lang(lang_code):
-    if lang_code.startswith("ja"):
-        return ["ja", "en"]
-    elif lang_code.startswith("zh"):
-        return ["ch_sim", "en"]
-    elif lang_code.startswith("ko"):
-        return ["ko", "en"]
-    else:
-        return ["en"]
\ No newline at end of file
+    """
+    EasyOCR 언어 목록
+    자동 감지 중이면 감지 후보 언어 중 같은 인식 모델로 함께 읽을 수 있는 언어도 포함
+    """
+    from config import get_setting
+
+    extra = (detection_candidates() or []) if get_setting("AUTO_DETECT_LANG", False) else []
+    return easyocr_lang_list(lang_code, extra)
@@ -1,6 +1,9 @@
 # translator_libre.py
 import requests
 from config import get_setting, increment_libre_usage
+from logger import write_log
+from translator_client import EngineClient
+from translation_cache import error_result
 
 def load_libretranslate_config():
     """저장된 LibreTranslate 설정을 로드합니다."""
@@ -12,33 +15,36 @@ def load_libretranslate_config():
             api_key = parts[1] if len(parts) > 1 else ""
             return api_url, api_key
     except Exception as e:
-        print(f"[정보] LibreTranslate 설정 로드 실패 (파일이 없을 수 있음): {e}")
+        write_log(f"[정보] LibreTranslate 설정 로드 실패 (파일이 없을 수 있음): {e}")
         return get_setting("LIBRE_API_URL"), get_setting("LIBRE_API_KEY")
 
-def libre_translate(text):
+# 언어 코드 매핑
+LIBRE_LANG_MAP = {
+    "en": "en",
+    "ko": "ko",
+    "ja": "ja",
+    "zh": "zh",
+    "zh-CN": "zh",
+    "es": "es",
+    "de": "de",
+    "ru": "ru",
+    "fr": "fr",
+    "it": "it",
+    "pt": "pt"
+}
+
+# 세션과 설정을 재사용하는 LibreTranslate 클라이언트
+libre_client = EngineClient("libretranslate", "LibreTranslate", "libretranslate.txt", load_libretranslate_config)
+
+def libre_translate(text, source_lang=None):
     # LibreTranslate API URL 및 키 가져오기
-    api_url, api_key = load_libretranslate_config()
+    api_url, api_key = libre_client.credentials()
     
     # 설정값으로 갱신
     api_url = api_url or get_setting("LIBRE_API_URL") or "https://libretranslate.com/translate"
     
-    # 언어 코드 매핑
-    LANG_MAP = {
-        "en": "en",
-        "ko": "ko",
-        "ja": "ja",
-        "zh": "zh",
-        "zh-CN": "zh",
-        "es": "es",
-        "de": "de",
-        "ru": "ru",
-        "fr": "fr",
-        "it": "it",
-        "pt": "pt"
-    }
-    
-    source = LANG_MAP.get(get_setting("SOURCE_LANG"), "en")
-    target = LANG_MAP.get(get_setting("TARGET_LANG"), "ko")
+    source = LIBRE_LANG_MAP.get(source_lang or get_setting("SOURCE_LANG"), "en")
+    target = LIBRE_LANG_MAP.get(get_setting("TARGET_LANG"), "ko")
     
     # 소스와 타겟 언어가 같으면 번역 필요 없음
     if source == target:
@@ -61,23 +67,23 @@ def libre_translate(text):
     }
     
     try:
-        print(f"[🌐 LibreTranslate 요청] {source} → {target}, 텍스트 길이: {len(text)}자")
-        response = requests.post(api_url, json=payload, headers=headers)
+        write_log(f"[🌐 LibreTranslate 요청] {source} → {target}, 텍스트 길이: {len(text)}자", "DEBUG")
+        response = libre_client.post(api_url, json=payload, headers=headers)
         response.raise_for_status()  # HTTP 오류 발생시 예외 처리
         
         result = response.json().get("translatedText", "")
         
         # 사용량 추적
         increment_libre_usage(len(text))
-        print(f"[LibreTranslate 사용량 누적] 이번 번역: {len(text)}자")
+        write_log(f"[LibreTranslate 사용량 누적] 이번 번역: {len(text)}자", "DEBUG")
         
         return result
     except requests.exceptions.HTTPError as e:
-        print(f"[LibreTranslate HTTP 오류] {e.response.status_code} - {e.response.text}")
-        return f"(LibreTranslate 번역 실패 - HTTP 오류 {e.response.status_code})"
+        write_log(f"[LibreTranslate HTTP 오류] {e.response.status_code} - {e.response.text}", "WARNING")
+        return error_result(f"(LibreTranslate 번역 실패 - HTTP 오류 {e.response.status_code})")
     except requests.exceptions.ConnectionError:
-        print(f"[LibreTranslate 연결 오류] API URL: {api_url}")
-        return "(LibreTranslate 연결 실패 - 서버에 접속할 수 없습니다)"
+        write_log(f"[LibreTranslate 연결 오류] API URL: {api_url}", "WARNING")
+        return error_result("(LibreTranslate 연결 실패 - 서버에 접속할 수 없습니다)")
     except Exception as e:
-        print(f"[LibreTranslate 예외] {e}")
-        return "(LibreTranslate 번역 실패)"
\ No newline at end of file
+        write_log(f"[LibreTranslate 예외] {e}", "WARNING")
+        return error_result("(LibreTranslate 번역 실패)")
\ No newline at end of file
@@ -0,0 +1,17 @@
+# translator_mock.py - 네트워크 없이 동작하는 가짜 번역 엔진 (벤치마크/재생 테스트용)
+import time
+from config import get_setting
+from logger import write_log
+
+MOCK_USAGE = 0
+
+
+def mock_translate(text, source_lang=None):
+    """MOCK_ENGINE_LATENCY(초)만큼 기다린 뒤 원문에 표시를 붙여 반환"""
+    global MOCK_USAGE
+    if not text:
+        return ""
+    time.sleep(get_setting("MOCK_ENGINE_LATENCY", 0.2))
+    MOCK_USAGE += len(text)
+    write_log(f"[🧪 가짜 번역 엔진] 텍스트 길이: {len(text)}자", "DEBUG")
+    return f"[번역] {text}"